@@ -0,0 +1,314 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from scipy.interpolate import CubicSpline
+
+from simulador.loop import loop
+from simulador.core.preprocessamento import preprocessar_condicoes_iniciais
+from simulador.core.posprocessamento import construir_dataframe_simulacao, adicionar_dados_de_marcha
+from simulador.core.tools.geometria import interpolar_trajetoria, distanceXYZ, radiusXYZ, grading, curva
+from simulador.core.tools.powertrain import powercurve
+
+PISTAS = ('oval', 'oito', 'rua', 'morro', 'spline')
+
+TAMANHOS_PADRAO = (1_000, 10_000, 100_000, 1_000_000)
+
+# Veículo de referência dos benchmarks (unidades de loop: cv, km/h)
+VEICULO_PADRAO = dict(
+    fx=1.0, fy=1.0, P=100, m=300, Cl=0.5, Cd=0.8, Af=1.0, Crr=0.015,
+    ld=0.8, lt=0.7, h=0.3, Tracao='T', Vo=30, Frenagem=1.2, Vmax=200,
+    mu=1.3, nu=1.3,
+)
+
+POWERTRAIN_PADRAO = dict(
+    Ps=[40, 60, 80, 90, 100, 95], ns=[3000, 5000, 7000, 9000, 11000, 12000],
+    finaldrive=3.5, gearslist=[3.0, 2.2, 1.7, 1.4, 1.2, 1.05], rw=0.3,
+)
+
+# Chaves que identificam uma medição ao comparar arquivos de resultado
+CHAVES = ['pista', 'n', 'marcha', 'solver', 'backend', 'etapa']
+
+
+def pista_sintetica(tipo, n, passo=2.0, semente=0):
+    """
+    Gera uma pista sintética reprodutível com n pontos.
+
+    Os circuitos fechados ('oval', 'oito', 'rua') dão quantas voltas forem
+    necessárias para um espaçamento médio próximo de `passo`; as estradas
+    abertas ('morro', 'spline') crescem em comprimento com n.
+
+    Args:
+        tipo (str): 'oval', 'oito' (figura oito), 'rua' (circuito de rua com
+            grampos), 'morro' (estrada com altimetria) ou 'spline' (spline
+            aleatória).
+        n (int): Número de pontos.
+        passo (float): Espaçamento médio desejado [m].
+        semente (int): Semente do gerador aleatório ('spline').
+
+    Returns:
+        tuple: x, y, z (np.ndarray float64)
+    """
+    if tipo in ('oval', 'oito', 'rua'):
+        if tipo == 'oval':
+            def forma(t):
+                return 300 * np.cos(t) + 40 * np.cos(3 * t), 200 * np.sin(t), 5 * np.sin(3 * t)
+        elif tipo == 'oito':
+            def forma(t):
+                return 400 * np.sin(t), 250 * np.sin(t) * np.cos(t), np.zeros_like(t)
+        else:
+            def forma(t):
+                return (500 * np.cos(t) + 60 * np.cos(7 * t),
+                        350 * np.sin(t) - 60 * np.sin(7 * t),
+                        2 * np.sin(2 * t))
+
+        # Comprimento de uma volta, medido numa discretização fina
+        xv, yv, zv = forma(np.linspace(0, 2 * np.pi, 20_001))
+        volta = np.sum(np.sqrt(np.diff(xv) ** 2 + np.diff(yv) ** 2 + np.diff(zv) ** 2))
+        voltas = max(1, round(n * passo / volta))
+        return forma(np.linspace(0, 2 * np.pi * voltas, n))
+
+    if tipo == 'morro':
+        s = np.linspace(0, n * passo, n)
+        return (s,
+                150 * np.sin(s / 400) + 40 * np.sin(s / 90),
+                30 * np.sin(s / 700) + 8 * np.sin(s / 150))
+
+    if tipo == 'spline':
+        rng = np.random.default_rng(semente)
+        nos = max(8, int(n * passo / 80))
+        direcao = np.cumsum(rng.normal(0, 0.5, nos))
+        xc = np.cumsum(80 * np.cos(direcao))
+        yc = np.cumsum(80 * np.sin(direcao))
+        zc = np.cumsum(rng.normal(0, 1.5, nos))
+        t = np.linspace(0, nos - 1, n)
+        u = np.arange(nos)
+        return CubicSpline(u, xc)(t), CubicSpline(u, yc)(t), CubicSpline(u, zc)(t)
+
+    raise ValueError(f"Pista desconhecida: '{tipo}' (use {', '.join(PISTAS)})")
+
+
+def _cronometrar(funcao, *args, repeticoes=1, **kwargs):
+    # Menor tempo entre as repetições e o retorno da última chamada
+    melhor = np.inf
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        saida = funcao(*args, **kwargs)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, saida
+
+
+def medir_pista(tipo, n, marcha=False, solvers=('marcha', 'dois_passos'), backend='python',
+                veiculo=None, passo=2.0, repeticoes=1):
+    """
+    Mede cada etapa do pipeline sobre uma pista sintética.
+
+    Etapas: interpolar_trajetoria, distanceXYZ, radiusXYZ, grading, curva,
+    powercurve (com marcha), preprocessar_condicoes_iniciais (com a geometria
+    pronta), loop por solver (com os tempos internos de EstatisticasSolver),
+    corrigir_velocidade (tempo, nº de correções e profundidade máxima dentro
+    de loop), construir_dataframe_simulacao e adicionar_dados_de_marcha.
+    A falha de uma etapa é registrada em 'erro' sem interromper as demais.
+
+    Returns:
+        list[dict]: Uma medição por etapa, com as colunas de CHAVES, tempo_s,
+        erro e informações extras da etapa.
+    """
+    veiculo = {**VEICULO_PADRAO, **(veiculo or {})}
+    if marcha:
+        veiculo = {**POWERTRAIN_PADRAO, **veiculo, 'marcha': True}
+
+    x, y, z = pista_sintetica(tipo, n, passo=passo)
+    medicoes = []
+
+    def medir(etapa, funcao, *args, etapa_solver=None, **kwargs):
+        linha = {'pista': tipo, 'n': n, 'marcha': marcha, 'solver': etapa_solver,
+                 'backend': backend if etapa_solver else None, 'etapa': etapa,
+                 'tempo_s': None, 'erro': None}
+        saida = None
+        try:
+            linha['tempo_s'], saida = _cronometrar(funcao, *args, repeticoes=repeticoes, **kwargs)
+        except Exception as erro:
+            linha['erro'] = f"{type(erro).__name__}: {erro}"
+        medicoes.append(linha)
+        return linha, saida
+
+    medir('interpolar_trajetoria', interpolar_trajetoria, x, y, z, passo, use_z=True, method='cubic')
+    _, D = medir('distanceXYZ', distanceXYZ, x, y, z=z, use_z=True)
+    _, R = medir('radiusXYZ', radiusXYZ, x, y, z)
+    _, angle = medir('grading', grading, z, D)
+    _, c = medir('curva', curva, x, y)
+    if any(v is None for v in (D, R, angle, c)):
+        return medicoes
+    geometria = {"R": R, "D": D, "angle": angle, "c": c}
+
+    if marcha:
+        medir('powercurve', powercurve, [p * 735.499 for p in veiculo['Ps']], veiculo['ns'],
+              veiculo['finaldrive'], veiculo['gearslist'], veiculo['rw'])
+
+    parametros = {nome: veiculo.get(nome, 0) for nome in
+                  ('P', 'Ps', 'ns', 'finaldrive', 'gearslist', 'rw', 'Vo', 'Vmax',
+                   'm', 'Cl', 'Cd', 'Af', 'Crr')}
+    medir('preprocessar_condicoes_iniciais', preprocessar_condicoes_iniciais,
+          marcha=marcha, x=x, y=y, z=z, use_z=True, geometria=geometria, **parametros)
+
+    for solver in solvers:
+        with contextlib.redirect_stdout(io.StringIO()):
+            linha, saida = medir('loop', loop, x=x, y=y, z=z, use_z=True, solver=solver,
+                                 backend=backend, geometria=geometria, estatisticas=True,
+                                 etapa_solver=solver, **veiculo)
+        if saida is None:
+            continue
+        df, stats = saida
+        for contagem in df.attrs.values():
+            if isinstance(contagem, dict):
+                linha.update({nome.strip(): int(v) for nome, v in contagem.items()})
+        linha['tempo_volta_s'] = float(np.nanmax(df['Time']))
+        linha['chamadas_roots'] = stats.chamadas_roots
+        linha.update({f'tempo_{etapa}_s': t for etapa, t in stats.tempos.items()})
+
+        if solver == 'marcha':
+            medicoes.append({'pista': tipo, 'n': n, 'marcha': marcha, 'solver': solver,
+                             'backend': backend, 'etapa': 'corrigir_velocidade',
+                             'tempo_s': stats.tempos['correcoes'], 'chamadas': stats.correcoes,
+                             'profundidade_max': stats.profundidade_max, 'erro': None})
+
+        V = df['Speed'].to_numpy()
+        linha, df_pos = medir('construir_dataframe_simulacao', construir_dataframe_simulacao,
+                              V, D, R, x, y, veiculo['m'], c=c, etapa_solver=solver)
+        if marcha and df_pos is not None:
+            pcurve = powercurve([p * 735.499 for p in veiculo['Ps']], veiculo['ns'],
+                                veiculo['finaldrive'], veiculo['gearslist'], veiculo['rw'])
+            medir('adicionar_dados_de_marcha', adicionar_dados_de_marcha, df_pos, pcurve,
+                  veiculo['gearslist'], veiculo['finaldrive'], veiculo['rw'], etapa_solver=solver)
+
+    return medicoes
+
+
+def rodar_benchmark(pistas=PISTAS, tamanhos=TAMANHOS_PADRAO, marchas=(False, True),
+                    solvers=('marcha', 'dois_passos'), backend='python', passo=2.0,
+                    repeticoes=1, progresso=True):
+    """
+    Mede todas as combinações de pista, tamanho e marcha.
+
+    Returns:
+        pd.DataFrame: Uma linha por etapa medida (ver medir_pista).
+    """
+    if backend == 'numba':
+        # Compila os kernels fora da medição
+        medir_pista('oval', 1_000, marcha=True, solvers=solvers, backend=backend)
+
+    linhas = []
+    for n in tamanhos:
+        for tipo in pistas:
+            for marcha in marchas:
+                inicio = time.time()
+                linhas += medir_pista(tipo, n, marcha=marcha, solvers=solvers, backend=backend,
+                                      passo=passo, repeticoes=repeticoes)
+                if progresso:
+                    print(f"Benchmark: {tipo} n={n} marcha={marcha} ({time.time() - inicio:.1f} s)")
+    return pd.DataFrame(linhas)
+
+
+def ambiente():
+    """Versões e máquina, gravadas junto com os resultados."""
+    import scipy
+    from simulador.core.solver.kernels import NUMBA_DISPONIVEL
+
+    return {
+        'data': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'pandas': pd.__version__,
+        'numba': NUMBA_DISPONIVEL,
+        'plataforma': platform.platform(),
+        'processador': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def salvar_resultados(resultados, caminho, versao=None):
+    """
+    Grava os resultados em JSON: {'versao', 'ambiente', 'resultados': [...]}.
+    """
+    conteudo = {
+        'versao': versao,
+        'ambiente': ambiente(),
+        'resultados': json.loads(resultados.to_json(orient='records')),
+    }
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(conteudo, arquivo, indent=1, ensure_ascii=False)
+
+
+def carregar_resultados(caminho):
+    """Lê um arquivo de salvar_resultados; o ambiente fica em df.attrs."""
+    with open(caminho, encoding='utf-8') as arquivo:
+        conteudo = json.load(arquivo)
+    df = pd.DataFrame(conteudo['resultados'])
+    df.attrs.update({'versao': conteudo.get('versao'), 'ambiente': conteudo.get('ambiente')})
+    return df
+
+
+def comparar_resultados(base, novo, tolerancia=0.10):
+    """
+    Compara dois resultados de benchmark etapa a etapa.
+
+    Args:
+        base, novo (pd.DataFrame or str): Resultados ou caminhos de arquivo.
+        tolerancia (float): Aumento relativo de tempo considerado regressão.
+
+    Returns:
+        pd.DataFrame: CHAVES, tempo_base, tempo_novo, razao (novo/base) e
+        regressao (bool), ordenado da maior razão para a menor.
+    """
+    base = carregar_resultados(base) if isinstance(base, str) else base
+    novo = carregar_resultados(novo) if isinstance(novo, str) else novo
+
+    comparacao = pd.merge(base[CHAVES + ['tempo_s']], novo[CHAVES + ['tempo_s']],
+                          on=CHAVES, suffixes=('_base', '_novo'))
+    comparacao = comparacao.rename(columns={'tempo_s_base': 'tempo_base',
+                                            'tempo_s_novo': 'tempo_novo'})
+    comparacao['razao'] = comparacao['tempo_novo'] / comparacao['tempo_base']
+    comparacao['regressao'] = comparacao['razao'] > 1 + tolerancia
+    return comparacao.sort_values('razao', ascending=False, ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do simulador em pistas sintéticas.")
+    parser.add_argument('--pistas', nargs='+', default=list(PISTAS), choices=PISTAS)
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=list(TAMANHOS_PADRAO))
+    parser.add_argument('--solvers', nargs='+', default=['marcha', 'dois_passos'],
+                        choices=['marcha', 'dois_passos'])
+    parser.add_argument('--backend', default='python', choices=['python', 'numba'])
+    parser.add_argument('--sem-marcha', action='store_true', help="Mede só marcha=False")
+    parser.add_argument('--repeticoes', type=int, default=1)
+    parser.add_argument('--versao', default=None, help="Rótulo gravado no arquivo (ex.: commit)")
+    parser.add_argument('--saida', default='benchmark.json')
+    parser.add_argument('--comparar', default=None, help="Arquivo de referência para comparação")
+    args = parser.parse_args(argv)
+
+    resultados = rodar_benchmark(pistas=args.pistas, tamanhos=args.tamanhos,
+                                 marchas=(False,) if args.sem_marcha else (False, True),
+                                 solvers=args.solvers, backend=args.backend,
+                                 repeticoes=args.repeticoes)
+    salvar_resultados(resultados, args.saida, versao=args.versao)
+    print(f'✅ Resultados salvos em {args.saida}')
+
+    if args.comparar:
+        comparacao = comparar_resultados(args.comparar, resultados)
+        print(comparacao.to_string(index=False))
+        if comparacao['regressao'].any():
+            print(f"⚠️ {int(comparacao['regressao'].sum())} etapa(s) mais lentas que a referência")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,33 @@
+import os
+
+
+def arquivos_cache(diretorio, extensao):
+    """Caminhos dos arquivos do cache (com a extensão dada) no diretório."""
+    return [os.path.join(diretorio, nome) for nome in os.listdir(diretorio)
+            if nome.endswith(extensao)]
+
+
+def gravar_atomico(caminho, escrever):
+    """
+    Grava um arquivo do cache sem deixar arquivo parcial no lugar: escrever
+    recebe um caminho temporário, que depois substitui `caminho`.
+    """
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    escrever(temporario)
+    os.replace(temporario, caminho)
+
+
+def limitar_diretorio(diretorio, extensao, tamanho_max):
+    """
+    Remove os arquivos acessados há mais tempo (LRU pela data de modificação,
+    atualizada com os.utime a cada leitura) até o diretório caber em
+    tamanho_max bytes.
+    """
+    arquivos = sorted(arquivos_cache(diretorio, extensao), key=os.path.getmtime)
+    total = sum(os.path.getsize(arquivo) for arquivo in arquivos)
+    # O arquivo mais recente fica mesmo que sozinho passe do limite
+    for arquivo in arquivos[:-1]:
+        if total <= tamanho_max:
+            break
+        total -= os.path.getsize(arquivo)
+        os.remove(arquivo)
@@ -0,0 +1,102 @@
+import hashlib
+import os
+
+import numpy as np
+
+from simulador.core.preprocessamento import preprocessar_geometria
+from simulador.core.cache_disco import arquivos_cache, gravar_atomico, limitar_diretorio
+
+# Incrementar ao mudar o conteúdo ou a ordem dos arrays gravados
+VERSAO_FORMATO = 1
+
+DIRETORIO_PADRAO = os.path.join(os.path.expanduser('~'), '.cache', 'simulador', 'geometria')
+
+
+def chave_geometria(x, y, z, use_z, fechada=False):
+    """
+    Hash das coordenadas e opções que determinam a geometria da pista.
+
+    Returns:
+        str: Chave hexadecimal.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"v{VERSAO_FORMATO}|use_z={bool(use_z)}|n={len(x)}".encode())
+    if fechada:
+        h.update(b"|fechada")
+    for coord in (x, y, z):
+        h.update(np.ascontiguousarray(coord, dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+class CacheGeometria:
+    """
+    Cache em disco da saída de preprocessar_geometria.
+
+    Cada pista vira um único arquivo .npy com [D, R, angle, c] concatenados,
+    lido com memory map. O tamanho total do diretório é limitado; ao passar do
+    limite, os arquivos acessados há mais tempo são removidos (LRU).
+
+    Args:
+        diretorio (str, optional): Onde guardar os arquivos.
+        tamanho_max (int): Limite do cache em bytes (padrão 512 MB).
+    """
+
+    def __init__(self, diretorio=None, tamanho_max=512 * 1024 ** 2):
+        self.diretorio = diretorio or DIRETORIO_PADRAO
+        self.tamanho_max = tamanho_max
+        os.makedirs(self.diretorio, exist_ok=True)
+
+    def _caminho(self, chave):
+        return os.path.join(self.diretorio, f"{chave}.npy")
+
+    def obter(self, x, y, z, use_z, fechada=False):
+        """
+        Retorna a geometria da pista, do cache se existir; senão calcula e grava.
+
+        Returns:
+            dict: Mesmo formato de preprocessar_geometria (arrays somente leitura
+            quando vindos do cache).
+        """
+        chave = chave_geometria(x, y, z, use_z, fechada)
+        caminho = self._caminho(chave)
+        n = len(x)
+
+        if os.path.exists(caminho):
+            dados = np.load(caminho, mmap_mode='r')
+            os.utime(caminho)  # marca o acesso para o LRU
+            # Pista aberta: D com n - 1 valores e os demais com n - 2; fechada: n cada
+            nD, nR = (n, n) if fechada else (n - 1, n - 2)
+            return {
+                "D": dados[:nD],
+                "R": dados[nD:nD + nR],
+                "angle": dados[nD + nR:nD + 2 * nR],
+                "c": dados[nD + 2 * nR:],
+            }
+
+        geometria = preprocessar_geometria(x, y, z, use_z, fechada)
+        dados = np.concatenate([np.asarray(geometria[nome], dtype=np.float64)
+                                for nome in ("D", "R", "angle", "c")])
+
+        def escrever(temporario):
+            with open(temporario, 'wb') as arquivo:
+                np.save(arquivo, dados)
+
+        gravar_atomico(caminho, escrever)
+        limitar_diretorio(self.diretorio, '.npy', self.tamanho_max)
+        return geometria
+
+    def invalidar(self, x=None, y=None, z=None, use_z=False, fechada=False):
+        """
+        Remove do cache a pista indicada, ou todo o cache se x for None.
+        """
+        if x is None:
+            for arquivo in arquivos_cache(self.diretorio, '.npy'):
+                os.remove(arquivo)
+            return
+        caminho = self._caminho(chave_geometria(x, y, z, use_z, fechada))
+        if os.path.exists(caminho):
+            os.remove(caminho)
+
+    def tamanho(self):
+        """Tamanho atual do cache em bytes."""
+        return sum(os.path.getsize(arquivo) for arquivo in arquivos_cache(self.diretorio, '.npy'))
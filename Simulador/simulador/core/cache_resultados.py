@@ -0,0 +1,168 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from simulador.core.posprocessamento import exportar_resultado, ler_resultado
+from simulador.core.cache_disco import arquivos_cache, gravar_atomico, limitar_diretorio
+
+# Incrementar ao mudar o solver ou os canais gravados (invalida o cache antigo)
+VERSAO_FORMATO = 1
+
+DIRETORIO_PADRAO = os.path.join(os.path.expanduser('~'), '.cache', 'simulador', 'resultados')
+
+# Argumentos de simular que ficam fora da chave: a trajetória e o veículo
+# entram pelos valores, os demais não mudam o resultado (o solver paralelo
+# dá o mesmo resultado que o serial)
+ARGUMENTOS_FORA_DA_CHAVE = ('x', 'y', 'z', 'veiculo', 'powertrain', 'geometria', 'cache_geometria',
+                            'cache_resultados', 'registro', 'estatisticas', 'processos')
+
+# Entradas de df.attrs que descrevem a execução e não o resultado: trechos
+# depende de processos, que fica fora da chave. Não são guardadas, e loop as
+# tira também do resultado que guarda, para acerto e falta serem iguais
+ATTRS_FORA_DO_CACHE = ('trechos',)
+
+
+def _texto_valor(valor):
+    # Números com o mesmo valor dão o mesmo texto (30 e 30.0, int e np.float64)
+    if isinstance(valor, (bool, np.bool_, str)) or valor is None:
+        return repr(valor)
+    if isinstance(valor, (int, float, np.number)):
+        return repr(float(valor))
+    return None
+
+
+def chave_resultado(x, y, z, parametros):
+    """
+    Hash da trajetória e de todos os parâmetros de uma chamada de loop.
+
+    Args:
+        x, y, z (array-like): Trajetória.
+        parametros (dict): Demais argumentos de loop (veículo, powertrain e
+            opções do solver); listas e arrays entram pelos valores.
+
+    Returns:
+        str: Chave hexadecimal.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"v{VERSAO_FORMATO}|n={len(x)}".encode())
+    for coord in (x, y, z):
+        h.update(np.ascontiguousarray(coord, dtype=np.float64).tobytes())
+
+    for nome in sorted(parametros):
+        valor = parametros[nome]
+        texto = _texto_valor(valor)
+        if texto is not None:
+            h.update(f"|{nome}={texto}".encode())
+        else:
+            valores = np.ascontiguousarray(valor, dtype=np.float64)
+            h.update(f"|{nome}:{valores.shape}=".encode())
+            h.update(valores.tobytes())
+    return h.hexdigest()
+
+
+class CacheResultados:
+    """
+    Memoização dos resultados de loop, por conteúdo.
+
+    A chave é o hash da trajetória e de todos os parâmetros do veículo, do
+    powertrain e do solver (chave_resultado). Os resultados ficam num LRU em
+    memória e, atrás dele, num diretório com um .npz por resultado (canais
+    em binário e df.attrs em JSON, como em exportar_resultado, exceto as
+    entradas de ATTRS_FORA_DO_CACHE). O tamanho do
+    diretório é limitado; ao passar do limite, os arquivos acessados há mais
+    tempo são removidos.
+
+    Uso: loop(..., cache_resultados=CacheResultados()). Chamadas com
+    registro ou estatisticas=True não passam pelo cache.
+
+    Args:
+        diretorio (str, optional): Onde guardar os arquivos.
+        tamanho_max (int): Limite do diretório em bytes (padrão 1 GB).
+        itens_memoria (int): Resultados mantidos em memória; 0 desliga o LRU.
+    """
+
+    def __init__(self, diretorio=None, tamanho_max=1024 ** 3, itens_memoria=32):
+        self.diretorio = diretorio or DIRETORIO_PADRAO
+        self.tamanho_max = tamanho_max
+        self.itens_memoria = itens_memoria
+        os.makedirs(self.diretorio, exist_ok=True)
+
+        self._memoria = OrderedDict()
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+
+    def _caminho(self, chave):
+        return os.path.join(self.diretorio, f"{chave}.npz")
+
+    def obter(self, chave):
+        """
+        Resultado guardado com esta chave, ou None.
+
+        Returns:
+            pd.DataFrame: Cópia do resultado, que pode ser alterada sem afetar o cache.
+        """
+        df = self._memoria.get(chave)
+        if df is not None:
+            self._memoria.move_to_end(chave)
+            self.acertos_memoria += 1
+            return df.copy()
+
+        caminho = self._caminho(chave)
+        if os.path.exists(caminho):
+            df = ler_resultado(caminho, formato='npz')
+            os.utime(caminho)  # marca o acesso para o LRU
+            self.acertos_disco += 1
+            self._lembrar(chave, df)
+            return df.copy()
+
+        self.faltas += 1
+        return None
+
+    def guardar(self, chave, df):
+        """Grava o resultado em disco e na memória."""
+        df = df.copy()
+        df.attrs = {nome: valor for nome, valor in df.attrs.items()
+                    if nome not in ATTRS_FORA_DO_CACHE}
+        gravar_atomico(self._caminho(chave),
+                       lambda temporario: exportar_resultado(df, temporario, formato='npz'))
+
+        self._lembrar(chave, df)
+        limitar_diretorio(self.diretorio, '.npz', self.tamanho_max)
+
+    def _lembrar(self, chave, df):
+        if self.itens_memoria <= 0:
+            return
+        self._memoria[chave] = df
+        self._memoria.move_to_end(chave)
+        while len(self._memoria) > self.itens_memoria:
+            self._memoria.popitem(last=False)
+
+    def estatisticas(self):
+        """
+        Returns:
+            dict: Acertos (em memória e em disco), faltas, taxa de acerto,
+            itens em memória, arquivos e bytes em disco.
+        """
+        acertos = self.acertos_memoria + self.acertos_disco
+        consultas = acertos + self.faltas
+        arquivos = arquivos_cache(self.diretorio, '.npz')
+        return {
+            "acertos": acertos,
+            "acertos_memoria": self.acertos_memoria,
+            "acertos_disco": self.acertos_disco,
+            "faltas": self.faltas,
+            "taxa_acerto": acertos / consultas if consultas else 0.0,
+            "itens_memoria": len(self._memoria),
+            "arquivos": len(arquivos),
+            "tamanho": sum(os.path.getsize(arquivo) for arquivo in arquivos),
+        }
+
+    def limpar(self):
+        """Remove todos os resultados (memória e disco) e zera as contagens."""
+        self._memoria.clear()
+        for arquivo in arquivos_cache(self.diretorio, '.npz'):
+            os.remove(arquivo)
+        self.acertos_memoria = self.acertos_disco = self.faltas = 0
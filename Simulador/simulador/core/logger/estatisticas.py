@@ -0,0 +1,89 @@
+import numpy as np
+
+from simulador.core.logger.eventos import METODOS
+
+# Etapas cronometradas por loop
+ETAPAS = ("preprocessamento", "marcha", "correcoes", "posprocessamento")
+
+
+class EstatisticasSolver:
+    """
+    Tempos por etapa e estatísticas das correções de uma execução de loop.
+
+    Preenchido por loop(..., estatisticas=True), que o devolve junto com o
+    DataFrame. Cada correção guarda o método (índice em METODOS) e a
+    profundidade j da retroação (0 = correção local).
+
+    Atributos:
+        tempos (dict): Tempo de parede [s] de cada etapa de ETAPAS. Em
+            'marcha' não entra o tempo das correções; com backend 'numba' as
+            correções rodam dentro do kernel e 'correcoes' fica NaN.
+        chamadas_roots (int): Chamadas de Roots (marcha e retroação).
+        solver, backend (str): Configuração usada.
+    """
+
+    def __init__(self):
+        self.tempos = {etapa: 0.0 for etapa in ETAPAS}
+        self.chamadas_roots = 0
+        self.solver = None
+        self.backend = None
+        self._metodos = []
+        self._profundidades = []
+
+    def registrar_correcao(self, metodo, j, chamadas_roots):
+        self._metodos.append(METODOS.index(metodo))
+        self._profundidades.append(j)
+        self.chamadas_roots += chamadas_roots
+
+    def registrar_correcoes(self, metodos, profundidades):
+        """Registra em lote as correções feitas no kernel compilado."""
+        self._metodos.extend(np.asarray(metodos, dtype=np.int64).tolist())
+        self._profundidades.extend(np.asarray(profundidades, dtype=np.int64).tolist())
+
+    @property
+    def correcoes(self):
+        return len(self._profundidades)
+
+    @property
+    def profundidade_max(self):
+        return max(self._profundidades, default=0)
+
+    def histograma_retroacao(self):
+        """
+        Returns:
+            np.ndarray: Nº de correções com cada profundidade j (índice = j).
+        """
+        return np.bincount(np.asarray(self._profundidades, dtype=np.int64),
+                           minlength=1)
+
+    def contagem_por_metodo(self):
+        """
+        Returns:
+            dict: {metodo: {j: nº de correções}}, só com as profundidades ocorridas.
+        """
+        contagem = {metodo: {} for metodo in METODOS}
+        for k, j in zip(self._metodos, self._profundidades):
+            por_j = contagem[METODOS[k]]
+            por_j[j] = por_j.get(j, 0) + 1
+        return {metodo: dict(sorted(por_j.items())) for metodo, por_j in contagem.items()}
+
+    def resumo(self):
+        """Estatísticas em um dicionário serializável (ex.: para JSON)."""
+        return {
+            "solver": self.solver,
+            "backend": self.backend,
+            "tempos": dict(self.tempos),
+            "tempo_total": sum(t for t in self.tempos.values() if t == t),
+            "chamadas_roots": self.chamadas_roots,
+            "correcoes": self.correcoes,
+            "por_metodo": {metodo: {str(j): n for j, n in por_j.items()}
+                           for metodo, por_j in self.contagem_por_metodo().items()},
+            "profundidade_max": self.profundidade_max,
+            "histograma_retroacao": self.histograma_retroacao().tolist(),
+        }
+
+    def __repr__(self):
+        tempos = ", ".join(f"{etapa}={t:.3f} s" for etapa, t in self.tempos.items())
+        return (f"EstatisticasSolver({self.solver}/{self.backend}: {tempos}; "
+                f"Roots={self.chamadas_roots}, correções={self.correcoes}, "
+                f"j_max={self.profundidade_max})")
@@ -0,0 +1,105 @@
+import math
+import numpy as np
+
+from simulador.core.logger.print_functions import (print_else_entry, print_root_short, print_debug_raiz_x1n,
+                                         print_adjust_info, print_iterador, print_caminho_correcao)
+
+# Níveis do registro do solver
+DESLIGADO = 0   # nada é registrado
+EVENTOS = 1     # eventos de correção gravados no buffer circular
+DETALHADO = 2   # eventos + envio de cada etapa às saídas (ex.: SaidaTerminal)
+
+METODOS = ("Correção por Torricelli Modificado", "Correção por fórmula V1")
+
+DTYPE_CORRECAO = np.dtype([
+    ("i", np.int64),                # ponto em que Roots falhou
+    ("j", np.int64),                # passo da retroação (0 = sem retroação)
+    ("metodo", np.int8),            # índice em METODOS
+    ("x1N_bruto", np.float64),
+    ("x1N_ajustado", np.float64),
+    ("sinal_argumento", np.int8),   # sinal do argumento da raiz de x1N
+])
+
+
+class RegistroSolver:
+    """
+    Registro de eventos de corrigir_velocidade.
+
+    Os eventos de correção vão para um buffer circular pré-alocado (array
+    estruturado com DTYPE_CORRECAO); ao encher, os mais antigos são
+    sobrescritos. No nível DETALHADO cada etapa também é enviada às saídas,
+    que recebem (evento, *args).
+
+    Com registro=None ou nivel=DESLIGADO, o solver não faz nenhuma chamada
+    de registro.
+
+    Args:
+        nivel (int): DESLIGADO, EVENTOS ou DETALHADO.
+        capacidade (int): Tamanho do buffer circular.
+        saidas (list, optional): Callables que recebem os eventos detalhados.
+    """
+
+    def __init__(self, nivel=EVENTOS, capacidade=65536, saidas=None):
+        self.nivel = nivel
+        self.eventos = np.zeros(capacidade, dtype=DTYPE_CORRECAO)
+        self.total = 0
+        self.saidas = list(saidas) if saidas else []
+
+    def registrar_correcao(self, i, j, metodo, x1N_bruto, x1N_ajustado, argumento):
+        self.eventos[self.total % len(self.eventos)] = (
+            i, j, METODOS.index(metodo), x1N_bruto, x1N_ajustado,
+            0 if argumento == 0 or math.isnan(argumento) else (1 if argumento > 0 else -1),
+        )
+        self.total += 1
+
+    def emitir(self, evento, *args):
+        for saida in self.saidas:
+            saida(evento, *args)
+
+    def exportar(self):
+        """
+        Eventos registrados em ordem cronológica.
+
+        Returns:
+            np.ndarray: Cópia do buffer com dtype DTYPE_CORRECAO (só os
+            últimos `capacidade` eventos, se houve sobrescrita).
+        """
+        capacidade = len(self.eventos)
+        if self.total <= capacidade:
+            return self.eventos[:self.total].copy()
+        inicio = self.total % capacidade
+        return np.concatenate((self.eventos[inicio:], self.eventos[:inicio]))
+
+    def para_dataframe(self):
+        """Eventos como DataFrame, com o nome do método por extenso."""
+        import pandas as pd
+
+        df = pd.DataFrame(self.exportar())
+        df["metodo"] = [METODOS[k] for k in df["metodo"]]
+        return df
+
+    def limpar(self):
+        self.total = 0
+
+
+class SaidaTerminal:
+    """
+    Saída opcional que imprime cada etapa da correção com as funções de
+    print_functions, como o solver fazia antes do registro de eventos.
+    """
+
+    _PRINTS = {
+        "entrada_correcao": print_else_entry,
+        "raiz": print_root_short,
+        "debug_x1n": print_debug_raiz_x1n,
+        "ajuste": print_adjust_info,
+        "iterador": print_iterador,
+        "resumo": print_caminho_correcao,
+    }
+
+    def __call__(self, evento, *args):
+        if evento == "retroacao":
+            i, j, R, D = args
+            print(f"Debug: i={i}, j={j}, R={R:.5f}, D={D:.5f}")
+        else:
+            self._PRINTS[evento](*args)
@@ -0,0 +1,129 @@
+from dataclasses import dataclass, fields, asdict
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class Veiculo:
+    """
+    Parâmetros do veículo, nas unidades dos argumentos de loop.
+
+    Imutável e com hash pelos valores: a mesma configuração pode ser usada
+    como chave de cache e enviada a outros processos por pickle.
+
+    Atributos:
+        fx, fy (float): Fatores de aderência longitudinal e lateral.
+        P (float): Potência [cv] (usada sem powertrain).
+        m (float): Massa [kg].
+        Cl, Cd, Af (float): Sustentação, arrasto e área frontal [m²].
+        Crr (float): Coeficiente de resistência ao rolamento.
+        ld, lt, h (float): Distâncias do CG aos eixos dianteiro e traseiro e
+            altura do CG [m].
+        Tracao (str): Eixo de tração.
+        Vo, Vmax (float): Velocidade inicial e máxima [km/h].
+        Frenagem (float): Fator da desaceleração máxima.
+        mu, nu (float): Coeficientes de atrito longitudinal e lateral.
+    """
+
+    fx: float
+    fy: float
+    P: float
+    m: float
+    Cl: float
+    Cd: float
+    Af: float
+    Crr: float
+    ld: float
+    lt: float
+    h: float
+    Tracao: str
+    Vo: float
+    Frenagem: float
+    Vmax: float
+    mu: float
+    nu: float
+
+    @classmethod
+    def de_dict(cls, parametros):
+        """Veículo a partir de um dict com (ao menos) os argumentos de veículo de loop."""
+        return cls(**{campo.name: parametros[campo.name] for campo in fields(cls)})
+
+    def como_dict(self):
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class Powertrain:
+    """
+    Motor e transmissão (loop com marcha=True).
+
+    Listas são guardadas como tuplas de float, para o objeto ter hash.
+
+    Atributos:
+        Ps (tuple): Potência do motor [cv] em cada rotação de ns.
+        ns (tuple): Rotações [rpm].
+        finaldrive (float): Relação do diferencial.
+        gearslist (tuple): Relações de marcha.
+        rw (float): Raio da roda [m].
+    """
+
+    Ps: tuple
+    ns: tuple
+    finaldrive: float
+    gearslist: tuple
+    rw: float
+
+    def __post_init__(self):
+        for nome in ("Ps", "ns", "gearslist"):
+            object.__setattr__(self, nome, tuple(float(v) for v in getattr(self, nome)))
+
+    @classmethod
+    def de_dict(cls, parametros):
+        """Powertrain a partir de um dict com Ps, ns, finaldrive, gearslist e rw."""
+        return cls(**{campo.name: parametros[campo.name] for campo in fields(cls)})
+
+    def como_dict(self):
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PistaPreprocessada:
+    """
+    Pista pronta para os solvers: geometria e inclinação efetiva em arrays
+    float64 contíguos e as constantes do veículo em unidades SI.
+
+    Saída de preprocessar_simulacao. Com n segmentos, D, R, angle, c e
+    slope seguem o formato de preprocessar_geometria.
+
+    Atributos:
+        D, R, angle, c (np.ndarray): Geometria (ver preprocessar_geometria).
+        slope (np.ndarray): Inclinação efetiva (inclinacao_efetiva).
+        V0, Vmax (float): Velocidade inicial e máxima [m/s].
+        P (float): Potência [W].
+        pcurve (tuple or list): Saída de powercurve ([] sem powertrain).
+        Pv (TabelaPotencia or list): Consulta da curva ([] sem powertrain).
+        g (float): Gravidade [m/s²].
+        meq (float): Massa equivalente [kg].
+        kl, ka (float): Termos de sustentação e arrasto (coef. * área * ρ / 2).
+        k (float): Termo de V² da equação de movimento.
+    """
+
+    D: np.ndarray
+    R: np.ndarray
+    angle: np.ndarray
+    c: np.ndarray
+    slope: np.ndarray
+    V0: float
+    Vmax: float
+    P: float
+    pcurve: object
+    Pv: object
+    g: float
+    meq: float
+    kl: float
+    ka: float
+    k: float
+
+    def __post_init__(self):
+        for nome in ("D", "R", "angle", "c", "slope"):
+            object.__setattr__(self, nome, np.ascontiguousarray(getattr(self, nome), dtype=np.float64))
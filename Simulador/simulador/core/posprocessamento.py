@@ -0,0 +1,235 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+import math
+from simulador.core.tools.geometria import curva
+from simulador.core.tools.powertrain import TabelaPotencia
+
+def _alinhar(valores, n, inicio=0):
+    # Posiciona `valores` a partir de `inicio` num vetor de tamanho n, completando com NaN
+    saida = np.full(n, np.nan)
+    k = max(0, min(len(valores), n - inicio))
+    saida[inicio:inicio + k] = valores[:k]
+    return saida
+
+def tempos_segmento(V, D):
+    """
+    Tempo de cada segmento com aceleração constante, 2D / (V[i] + V[i + 1]).
+
+    Equivale a ΔV/Ax (e a D/V sem aceleração), sem o cancelamento numérico
+    de ΔV/Ax quando Ax é quase zero.
+
+    Args:
+        V (np.ndarray): Velocidades, um ponto a mais que D.
+        D (np.ndarray): Comprimento de cada segmento.
+    """
+    with np.errstate(divide='ignore'):
+        return 2 * D / (V[:-1] + V[1:])
+
+def construir_dataframe_simulacao(V, D, R, x, y, m, c=None):
+    """
+    Monta o DataFrame de canais da volta a partir do perfil de velocidade.
+
+    Com n = len(V), todos os canais têm n linhas: Ax e Ay começam em 0 (o
+    segmento i preenche a linha i + 1), CurvatureRadius é deslocado duas
+    linhas (R[i] é o raio no ponto i + 1) e Time termina em [0, NaN].
+    Posições sem dado ficam NaN.
+    """
+    V = np.asarray(V, dtype=float)
+    D = np.asarray(D, dtype=float)
+    R = np.asarray(R, dtype=float)
+    n = len(V)
+
+    if c is None:
+        c = curva(x, y)
+    c = np.asarray(c, dtype=float)
+
+    # Segmentos com V[i], V[i + 1], D[i] e R[i] disponíveis
+    k = max(0, min(len(R), len(D), n - 1))
+    kc = min(k, len(c))
+
+    Ax = _alinhar((V[1:k + 1] ** 2 - V[:k] ** 2) / (2 * D[:k]), n, inicio=1)
+    Ay = _alinhar(V[1:kc + 1] ** 2 / R[:kc] * c[:kc], n, inicio=1)
+    if n:
+        Ax[0] = Ay[0] = 0.0
+
+    nt = max(0, n - 2)
+    dt = tempos_segmento(V[:nt + 1], D[:nt])
+    t = np.concatenate((np.cumsum(dt), [0.0, np.nan]))[:n]
+
+    df = pd.DataFrame({
+        'Distance': _alinhar(np.cumsum(D), n),
+        'Speed': V,
+        'Ay': Ay,
+        'Ax': Ax,
+        'CurvatureRadius': _alinhar(R, n, inicio=2),
+        'Time': t,
+    })
+
+    df['Force'] = m * Ax
+
+    return df
+
+def adicionar_dados_de_marcha(df, pcurve, gearslist, finaldrive, rw, canais_potencia=False):
+    """
+    Adiciona os canais de marcha, relação e rotação do motor ao DataFrame.
+
+    A marcha vem de uma busca ordenada da velocidade nas velocidades de troca
+    (pcurve[2]); a rotação é limitada inferiormente em 1000 rpm.
+
+    Args:
+        canais_potencia (bool): Se True, adiciona também EnginePower [W], a
+            potência disponível na marcha engatada, e WheelTorque [N·m], o
+            torque correspondente na roda.
+    """
+    Vs = np.asarray(pcurve[2][1:-1], dtype=float)
+    speed = df['Speed'].to_numpy(dtype=float)
+
+    # Marcha j + 2 quando speed > Vs[j]; abaixo da primeira troca, 1ª marcha
+    gears = np.searchsorted(Vs, speed, side='left') + 1
+    gears[np.isnan(speed)] = 1
+    df['Gears'] = gears
+
+    gr = np.asarray(gearslist, dtype=float)[gears - 1]
+    df['GRatios'] = gr
+
+    df['RPM'] = np.maximum(speed * gr * finaldrive * 30 / (rw * math.pi), 1000)
+
+    if canais_potencia:
+        potencia = TabelaPotencia(pcurve)(speed)
+        df['EnginePower'] = potencia
+        with np.errstate(divide='ignore', invalid='ignore'):
+            df['WheelTorque'] = potencia * rw / speed
+
+    return df
+
+
+# Chave dos metadados no schema Arrow e no arquivo .npz
+CHAVE_METADADOS = 'simulador'
+
+FORMATOS_EXPORTACAO = ('parquet', 'feather', 'npz', 'csv')
+
+
+def metadados_simulacao(veiculo, x, y, z, use_z=False, **extras):
+    """
+    Metadados de uma simulação para gravar junto com os canais.
+
+    Args:
+        veiculo (dict): Parâmetros do veículo e do powertrain usados em loop.
+        x, y, z (array-like): Trajetória, identificada pelo hash de chave_geometria.
+        use_z (bool): Se a inclinação foi usada.
+        **extras: Outros campos livres (ex.: nome da pista).
+
+    Returns:
+        dict: {'veiculo', 'pista', 'n_pontos', 'use_z', ...}
+    """
+    from simulador.core.cache_geometria import chave_geometria
+
+    return {
+        'veiculo': veiculo,
+        'pista': chave_geometria(x, y, z, use_z),
+        'n_pontos': len(x),
+        'use_z': bool(use_z),
+        **extras,
+    }
+
+
+def _json_padrao(valor):
+    # Tipos numpy dentro dos metadados
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    raise TypeError(f"Metadado não serializável: {type(valor).__name__}")
+
+
+def _formato(caminho, formato):
+    formato = (formato or os.path.splitext(caminho)[1].lstrip('.')).lower()
+    if formato not in FORMATOS_EXPORTACAO:
+        raise ValueError(f"Formato de exportação não suportado: '{formato}' "
+                         f"(use {', '.join(FORMATOS_EXPORTACAO)})")
+    return formato
+
+
+def _tabela_arrow(df, texto):
+    try:
+        import pyarrow as pa
+    except ImportError as erro:
+        raise ImportError("Exportação em Parquet/Feather requer pyarrow; "
+                          "use formato='npz' ou 'csv'") from erro
+
+    tabela = pa.Table.from_pandas(df, preserve_index=False)
+    return tabela.replace_schema_metadata({**(tabela.schema.metadata or {}),
+                                           CHAVE_METADADOS.encode(): texto.encode()})
+
+
+def exportar_resultado(df, caminho, formato=None, metadados=None):
+    """
+    Grava os canais da simulação com os metadados da execução.
+
+    Os metadados são df.attrs (modo do solver, contagens) somados a
+    `metadados`, serializados em JSON: no schema do arquivo em Parquet e
+    Feather, na entrada '__metadados__' do .npz e num arquivo
+    '<caminho>.json' ao lado do CSV.
+
+    Args:
+        df (pd.DataFrame): Saída de loop.
+        caminho (str): Arquivo de saída.
+        formato (str, optional): 'parquet', 'feather', 'npz' ou 'csv';
+            padrão pela extensão de `caminho`.
+        metadados (dict, optional): Ex.: saída de metadados_simulacao.
+    """
+    formato = _formato(caminho, formato)
+    texto = json.dumps({**df.attrs, **(metadados or {})}, default=_json_padrao,
+                       ensure_ascii=False)
+
+    if formato == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(_tabela_arrow(df, texto), caminho)
+    elif formato == 'feather':
+        import pyarrow.feather as feather
+        feather.write_feather(_tabela_arrow(df, texto), caminho)
+    elif formato == 'npz':
+        with open(caminho, 'wb') as arquivo:
+            np.savez(arquivo, __metadados__=np.array(texto),
+                     **{coluna: df[coluna].to_numpy() for coluna in df.columns})
+    else:
+        df.to_csv(caminho, index=False)
+        with open(f"{caminho}.json", 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto)
+
+
+def ler_resultado(caminho, formato=None):
+    """
+    Lê um arquivo gravado por exportar_resultado.
+
+    Returns:
+        pd.DataFrame: Canais, com os metadados em df.attrs.
+    """
+    formato = _formato(caminho, formato)
+    texto = None
+
+    if formato in ('parquet', 'feather'):
+        if formato == 'parquet':
+            import pyarrow.parquet as pq
+            tabela = pq.read_table(caminho)
+        else:
+            import pyarrow.feather as feather
+            tabela = feather.read_table(caminho)
+        texto = (tabela.schema.metadata or {}).get(CHAVE_METADADOS.encode())
+        df = tabela.to_pandas()
+    elif formato == 'npz':
+        with np.load(caminho) as dados:
+            df = pd.DataFrame({nome: dados[nome] for nome in dados.files if nome != '__metadados__'})
+            if '__metadados__' in dados.files:
+                texto = str(dados['__metadados__'])
+    else:
+        df = pd.read_csv(caminho)
+        if os.path.exists(f"{caminho}.json"):
+            with open(f"{caminho}.json", encoding='utf-8') as arquivo:
+                texto = arquivo.read()
+
+    if texto:
+        df.attrs.update(json.loads(texto))
+    return df
@@ -0,0 +1,184 @@
+# core/preprocessamento.py
+
+import math
+import numpy as np
+from simulador.core.tools.geometria import radiusXYZ, distanceXYZ, grading, curva
+from simulador.core.tools.powertrain import powercurve, TabelaPotencia
+from simulador.core.modelos import PistaPreprocessada, Powertrain
+
+def preprocessar_geometria(x, y, z, use_z, fechada=False):
+    """
+    Calcula a geometria da pista, que não depende do veículo.
+
+    Com fechada=True a trajetória é tratada como periódica (o último ponto
+    liga ao primeiro, que não deve ser repetido no fim): todos os arrays têm
+    um valor por ponto, com raio, inclinação e sentido calculados através
+    da emenda.
+
+    Returns:
+        dict: {"R": raios, "D": distâncias, "angle": inclinações,
+        "c": sentido das curvas} como np.ndarray.
+    """
+    x, y, z = np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(z, dtype=float)
+
+    if fechada:
+        # Os dois primeiros pontos repetidos no fim fecham as trincas da emenda
+        n = len(x)
+        x, y, z = (np.concatenate((c, c[:2])) for c in (x, y, z))
+        geometria = preprocessar_geometria(x, y, z, use_z)
+        geometria["D"] = geometria["D"][:n]
+        geometria["angle"] = np.clip(geometria["angle"], -0.2, 0.2)
+        return geometria
+
+    R = radiusXYZ(x, y, z)
+    D = distanceXYZ(x, y, z=z, use_z=True) if use_z else distanceXYZ(x, y, use_z=False)
+    angle = grading(z, D) if use_z else np.zeros(len(R))
+
+    c = curva(x, y)
+
+    return {"R": R, "D": D, "angle": angle, "c": c}
+
+
+def remover_ponto_repetido(x, y, z, tolerancia=1e-9):
+    """
+    Remove o último ponto de um circuito quando ele repete o primeiro.
+
+    Os pontos são considerados iguais a menos de tolerancia vezes a extensão
+    da pista: o fechamento de uma volta gerada por seno e cosseno fica a
+    ~1e-14 m do início, não exatamente nele.
+    """
+    if len(x) > 1:
+        xa, ya, za = (np.asarray(c, dtype=float) for c in (x, y, z))
+        escala = max(np.ptp(xa), np.ptp(ya), np.ptp(za))
+        distancia = np.hypot(np.hypot(xa[-1] - xa[0], ya[-1] - ya[0]), za[-1] - za[0])
+        if distancia <= tolerancia * escala:
+            return x[:-1], y[:-1], z[:-1]
+    return x, y, z
+
+
+def preprocessar_simulacao(veiculo, x, y, z, use_z, powertrain=None, geometria=None,
+                           fechada=False):
+    """
+    Prepara a pista e as constantes do veículo para os solvers.
+
+    Args:
+        veiculo (Veiculo): Parâmetros do veículo.
+        x, y, z (array-like): Trajetória.
+        use_z (bool): Usa a inclinação.
+        powertrain (Powertrain, optional): Motor e transmissão; sem ele, a
+            potência é constante (veiculo.P).
+        geometria (dict, optional): Saída de preprocessar_geometria para os
+            mesmos x, y, z e use_z; quando fornecida, não é recalculada.
+        fechada (bool): Geometria periódica (ver preprocessar_geometria).
+
+    Returns:
+        PistaPreprocessada
+    """
+    return _preprocessar(veiculo.P, powertrain, x, y, z, veiculo.Vo, veiculo.Vmax, veiculo.m,
+                         veiculo.Cl, veiculo.Cd, veiculo.Af, veiculo.Crr, use_z, geometria, fechada)
+
+
+def preprocessar_condicoes_iniciais(P, Ps, marcha, ns, finaldrive, gearslist, rw,
+                                     x, y, z, Vo, Vmax, m, Cl, Cd, Af, Crr,
+                                     use_z, geometria=None, fechada=False):
+    """
+    Prepara as condições iniciais da simulação (forma em dict de
+    preprocessar_simulacao).
+
+    geometria (dict, optional): saída de preprocessar_geometria para os mesmos
+    x, y, z e use_z; quando fornecida, a geometria não é recalculada.
+    fechada (bool): geometria periódica (ver preprocessar_geometria).
+    """
+    powertrain = Powertrain(Ps, ns, finaldrive, gearslist, rw) if marcha else None
+    pista = _preprocessar(P, powertrain, x, y, z, Vo, Vmax, m, Cl, Cd, Af, Crr,
+                          use_z, geometria, fechada)
+    return {
+        "P": pista.P, "Pv": pista.Pv, "pcurve": pista.pcurve, "g": pista.g,
+        "R": pista.R, "D": pista.D, "angle": pista.angle, "c": pista.c,
+        "V": [pista.V0], "Vmax": pista.Vmax, "meq": pista.meq,
+        "kl": pista.kl, "ka": pista.ka, "k": pista.k,
+        "slope": pista.slope
+    }
+
+
+def _preprocessar(P, powertrain, x, y, z, Vo, Vmax, m, Cl, Cd, Af, Crr, use_z, geometria, fechada):
+    # Conversão de potência para Watts
+    P = P * 735.499
+
+    if powertrain is not None:
+        Ps = [i * 735.499 for i in powertrain.Ps]
+        pcurve = powercurve(Ps, powertrain.ns, powertrain.finaldrive, powertrain.gearslist,
+                            powertrain.rw)
+        Pv = TabelaPotencia(pcurve)
+    else:
+        pcurve = []
+        Pv = []
+
+    # Constantes
+    g = 9.81
+
+    # Geometria
+    if geometria is None:
+        geometria = preprocessar_geometria(x, y, z, use_z, fechada)
+    R, D, angle, c = geometria["R"], geometria["D"], geometria["angle"], geometria["c"]
+
+
+    # Velocidades iniciais
+    V0 = Vo / 3.6 + 0.0001
+    Vmax = Vmax / 3.6
+
+    # Massa equivalente
+    meq = m * 1.05
+
+    # Coeficientes aerodinâmicos
+    rhoAR = 1.25
+    kl = Cl * Af * rhoAR / 2
+    ka = Cd * Af * rhoAR / 2
+    k = (ka - kl * Crr) / meq
+
+    # Inclinação efetiva
+    slope = inclinacao_efetiva(angle, Crr, m, meq, use_z)
+
+    return PistaPreprocessada(
+        D=D, R=R, angle=angle, c=c, slope=slope, V0=V0, Vmax=Vmax, P=P,
+        pcurve=pcurve, Pv=Pv, g=g, meq=meq, kl=kl, ka=ka, k=k
+    )
+
+
+def inclinacao_efetiva(angle, Crr, m, meq, use_z):
+    """
+    Inclinação efetiva de cada segmento (rampa + rolamento, escalada pela
+    massa equivalente); zeros quando use_z é False.
+    """
+    angle = np.asarray(angle, dtype=float)
+    if use_z:
+        return (angle + Crr * np.cos(angle)) * m / meq
+    return np.zeros(len(angle))
+
+
+def coeficientes_aderencia(angle, g, kl, m, fx, fy, mu, nu, ld, lt, h, Tracao):
+    """
+    Separa os limites de aceleração do Círculo de Kamm em um termo por
+    segmento e um termo proporcional a V², de forma que:
+
+        Axmax = Ax0 - cAx * V²
+        Aymax = Ay0 - cAy * V²
+
+    Os termos Ax0 e Ay0 dependem só da inclinação e são calculados em lote.
+
+    Returns:
+        tuple: (Ax0, cAx, Ay0, cAy)
+    """
+    cos_ang = np.cos(np.asarray(angle, dtype=float))
+
+    if Tracao == 'D':
+        cA = lt * fx * mu / (ld + h * mu + lt)
+    else:
+        cA = ld * fx * mu / (ld - h * mu + lt)
+
+    Ax0 = cA * g * cos_ang
+    cAx = cA * kl / m
+    Ay0 = fy * nu * g * cos_ang
+    cAy = fy * kl / m
+
+    return Ax0, cAx, Ay0, cAy
@@ -0,0 +1,9 @@
+import importlib.util
+
+
+def numba_disponivel():
+    """
+    Indica se o Numba está instalado, sem importá-lo: o backend 'numba'
+    (core/solver/kernels.py) só é carregado quando usado.
+    """
+    return importlib.util.find_spec("numba") is not None
@@ -0,0 +1,467 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Rótulos de limitação de cada ponto do perfil de velocidade
+LIMITES = ("Frenagem", "Tração", "Potência", "Aderência lateral", "Velocidade máxima")
+
+# Menor trecho (em pontos) que vale a pena enviar a um processo
+TAMANHO_MIN_TRECHO = 20_000
+
+
+def velocidade_limite_curva(R, Ay0, cAy, Vmax):
+    """
+    Velocidade máxima de contorno de curva em cada ponto, V = sqrt(R * Aymax),
+    com Aymax = Ay0 - cAy * V² resolvido de forma fechada.
+
+    Args:
+        R (array-like): Raio em cada segmento (ponto i + 1 do perfil).
+        Ay0, cAy: Termos de coeficientes_aderencia.
+        Vmax (float): Velocidade máxima [m/s].
+
+    Returns:
+        tuple: (Vcap, por_vmax) — limite por ponto e máscara dos pontos em
+        que Vmax é mais restritivo que a aderência.
+    """
+    R = np.asarray(R, dtype=float)
+    den = 1 + R * cAy
+    with np.errstate(divide='ignore', invalid='ignore'):
+        V2 = np.where(den > 0, R * np.asarray(Ay0, dtype=float) / den, np.inf)
+    Vcurva = np.sqrt(np.maximum(V2, 0))
+    return np.minimum(Vcurva, Vmax), Vcurva >= Vmax
+
+
+def velocidade_final_potencia(Vo2, D, gs, k, Vlo, Vhi, hhi, Axmax, marcha, v_min_pot, Pv, P, m):
+    """
+    Velocidade no fim de um segmento limitado pela potência, com a
+    aceleração avaliada na própria velocidade final:
+
+        V² = Vo² + 2 D (apot(V) - k V² - gs)
+
+    Vhi é a velocidade limitada pela tração, onde o resíduo hhi =
+    V² - Vo² - 2 D (...) é positivo, e Vlo a obtida com a aceleração
+    avaliada em Vhi, onde ele não é positivo. A raiz é achada por falsa
+    posição (Illinois); em segmentos curtos o primeiro passo já basta, e em
+    segmentos longos a velocidade não cai abaixo do equilíbrio entre
+    potência e arrasto, como cairia com a aceleração de Vhi.
+
+    A aceleração pela potência é a de arealP (Axmax abaixo de v_min_pot).
+    """
+    if marcha:
+        apot = Axmax if Vlo < v_min_pot else Pv(Vlo) / m / Vlo
+    else:
+        apot = P / m / Vlo
+    hlo = Vlo * Vlo - Vo2 - 2 * D * (apot - k * Vlo * Vlo - gs)
+    if hlo > 0:
+        return Vlo
+    lado = 0
+    for _ in range(50):
+        v = Vhi - hhi * (Vhi - Vlo) / (hhi - hlo)
+        if not Vlo < v < Vhi:
+            break
+        if marcha:
+            apot = Axmax if v < v_min_pot else Pv(v) / m / v
+        else:
+            apot = P / m / v
+        h = v * v - Vo2 - 2 * D * (apot - k * v * v - gs)
+        if abs(h) <= 1e-10 * v * v:
+            return v
+        if h > 0:
+            Vhi, hhi = v, h
+            if lado == 1:
+                hlo /= 2
+            lado = 1
+        else:
+            Vlo, hlo = v, h
+            if lado == -1:
+                hhi /= 2
+            lado = -1
+    return Vlo if -hlo < hhi else Vhi
+
+
+def resolver_dois_passos(V0, R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+                         pcurve, m, Pv, marcha, P, Vmax, backend='python'):
+    """
+    Perfil de velocidade em tempo linear por dois passes, alternativa à
+    marcha com corrigir_velocidade:
+
+        1. limite de curva Vcap em cada ponto (aderência lateral e Vmax);
+        2. passe para frente limitado pela tração (raiz x2 de Roots) e pela potência;
+        3. passe para trás limitado pela frenagem no Círculo de Kamm;
+        4. V = min(frente, trás) ponto a ponto.
+
+    Os índices seguem a marcha original: o segmento i liga V[i] a V[i + 1]
+    usando D[i], R[i] e slope[i]. Com backend='numba' os passes 2 e 3 rodam
+    em dois_passos_kernel.
+
+    Diferença para a marcha: quando Roots não tem solução (ponto rápido
+    demais para a curva), corrigir_velocidade troca a velocidade pela de
+    regime na curva — a da fórmula V1, em que a tração equilibra arrasto e
+    rampa no Círculo de Kamm, com Axmax e Aymax da velocidade de chegada,
+    ou 0,99 * sqrt(R * Aymax) — e freia para trás até ela. Aqui a curva é
+    limitada só pela aderência lateral (Vcap) e a velocidade cai por
+    arrasto e rampa dentro da elipse, sem voltar ao regime. O perfil fica
+    igual ou acima do da marcha: nas pistas sintéticas do benchmark
+    (3000 pontos), tempo de volta 0,2 a 0,5% menor, 95% dos pontos a menos
+    de 3,5% e até ~8% nas curvas em subida, onde a correção mais atua.
+
+    Returns:
+        tuple: (V, contagem_limites, limite)
+            V (list): Velocidades [m/s], len(R) + 1 pontos.
+            contagem_limites (dict): Pontos limitados por frenagem, tração,
+            potência, aderência lateral e velocidade máxima.
+            limite (np.ndarray): Índice em LIMITES para cada ponto (-1 em V[0]).
+    """
+    Vf, Vb, Vcap, por_vmax, por_potencia = passes_dois_passos(
+        V0, R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+        pcurve, m, Pv, marcha, P, Vmax, backend=backend
+    )
+    return envelope_limites(Vf, Vb, V0, Vcap, por_vmax, por_potencia)
+
+
+def passes_dois_passos(V0, R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+                       pcurve, m, Pv, marcha, P, Vmax, backend='python', Vfim=None):
+    """
+    Passos 1 a 3 de resolver_dois_passos, sem o envelope.
+
+    Vfim (float, optional): limite adicional de velocidade no último ponto,
+    onde começa o passe para trás (padrão: só Vcap).
+
+    Returns:
+        tuple: (Vf, Vb, Vcap, por_vmax, por_potencia) — passes para frente e
+        para trás, limite de curva (Vcap[0] = inf) e as máscaras de pontos
+        limitados por Vmax e por potência, todos com len(R) + 1 pontos.
+    """
+    n = len(R)
+    R = np.asarray(R, dtype=float)
+    D = np.asarray(D, dtype=float)[:n]
+    gs = g * np.asarray(slope, dtype=float)
+    Ax0 = np.asarray(Ax0, dtype=float)
+    Ay0 = np.asarray(Ay0, dtype=float)
+
+    # ⇨ 1. LIMITE DE CURVA (Vcap[i + 1] vem de R[i])
+    Vcap = np.empty(n + 1)
+    Vcap[0] = np.inf
+    Vcap[1:], por_vmax = velocidade_limite_curva(R, Ay0, cAy, Vmax)
+    Vcap_passes = Vcap
+    if Vfim is not None:
+        Vcap_passes = Vcap.copy()
+        Vcap_passes[n] = min(Vcap[n], Vfim)
+
+    if backend == 'numba':
+        from simulador.core.solver.kernels import dois_passos_kernel, curva_potencia_arrays
+
+        pv_v, pv_p = curva_potencia_arrays(pcurve, marcha)
+        Vf, Vb, por_potencia = dois_passos_kernel(
+            float(V0), R, D, gs, Ax0, cAx, Ay0, cAy, Vcap_passes, Axmin, k,
+            pv_v, pv_p, marcha, P, m
+        )
+        return Vf, Vb, Vcap, por_vmax, por_potencia
+
+    # Termos do segmento pré-calculados, convertidos para float nos passes
+    q = 2 * D * k + 1
+    D2x4 = 4 * D ** 2
+    R2 = R ** 2
+    Rl, Dl, gsl, ql = R.tolist(), D.tolist(), gs.tolist(), q.tolist()
+    D2x4l, R2l = D2x4.tolist(), R2.tolist()
+    Ax0l, Ay0l, Vcapl = Ax0.tolist(), Ay0.tolist(), Vcap_passes.tolist()
+    v_min_pot = pcurve[1][0] if marcha else 0.0
+
+    # ⇨ 2. PASSE PARA FRENTE (tração e potência)
+    Vf = [0.0] * (n + 1)
+    por_potencia = np.zeros(n + 1, dtype=bool)
+    Vf[0] = V0
+    for i in range(n):
+        Vo2 = Vf[i] ** 2
+        Axmax = Ax0l[i] - cAx * Vo2
+        Aymax = Ay0l[i] - cAy * Vo2
+        Ay2R2 = Aymax ** 2 * R2l[i]
+        den = Axmax ** 2 * D2x4l[i] + Ay2R2 * ql[i] ** 2
+        disc = Axmax ** 2 * Ay2R2 * (den - (Vo2 - 2 * Dl[i] * gsl[i]) ** 2)
+
+        if disc < 0:
+            # Nenhuma aceleração atende a elipse: quem define o ponto é a frenagem
+            Vf[i + 1] = Vcapl[i + 1]
+            continue
+
+        x2 = (disc ** 0.5 - 2 * Axmax ** 2 * Dl[i] * Vo2 - Ay2R2 * ql[i] * (gsl[i] + k * Vo2)) / den
+        V2 = Vo2 + 2 * x2 * Dl[i]
+        Vfim = V2 ** 0.5 if V2 > 0 else 0.0
+
+        if x2 > 0 and Vfim > 0:
+            if marcha:
+                apot = Axmax if Vfim < v_min_pot else Pv(Vfim) / m / Vfim
+            else:
+                apot = P / m / Vfim
+            axreal = apot - k * Vfim ** 2 - gsl[i]
+            if axreal < x2:
+                V2 = Vo2 + 2 * axreal * Dl[i]
+                if V2 > 0:
+                    Vfim = velocidade_final_potencia(Vo2, Dl[i], gsl[i], k, V2 ** 0.5, Vfim,
+                                                     2 * Dl[i] * (x2 - axreal), Axmax,
+                                                     marcha, v_min_pot, Pv, P, m)
+                else:
+                    Vfim = 0.0
+                por_potencia[i + 1] = True
+
+        Vf[i + 1] = min(Vfim, Vcapl[i + 1])
+
+    # ⇨ 3. PASSE PARA TRÁS (frenagem)
+    Vb = [0.0] * (n + 1)
+    Vb[n] = Vcapl[n]
+    for i in range(n - 1, -1, -1):
+        Vfim2 = Vb[i + 1] ** 2
+        Aymax = Ay0l[i] - cAy * Vfim2
+        razao = Vfim2 / (Rl[i] * Aymax) if Aymax > 0 else 1.0
+        lateral = (1 - razao ** 2) ** 0.5 if razao < 1 else 0.0
+        x1 = -Axmin * lateral - gsl[i] - k * Vfim2
+        V2 = Vfim2 - 2 * x1 * Dl[i]
+        Vb[i] = min(V2 ** 0.5 if V2 > 0 else 0.0, Vcapl[i])
+
+    return np.asarray(Vf), np.asarray(Vb), Vcap, por_vmax, por_potencia
+
+
+def envelope_limites(Vf, Vb, V0, Vcap, por_vmax, por_potencia):
+    """
+    Passo 4 de resolver_dois_passos: V = min(Vf, Vb), com V[0] = V0, e o
+    limite ativo em cada ponto. Retorna o mesmo que resolver_dois_passos.
+    """
+    # ⇨ 4. ENVELOPE E CLASSIFICAÇÃO DOS LIMITES
+    V = np.minimum(Vf, Vb)
+    V[0] = V0
+
+    limite = np.where(por_potencia, 2, 1)
+    limite = np.where(V >= Vcap, 3, limite)
+    limite[1:] = np.where((V[1:] >= Vcap[1:]) & por_vmax, 4, limite[1:])
+    limite = np.where((Vb < Vf) & (V < Vcap), 0, limite)
+    limite[0] = -1
+
+    contagem_limites = {nome: int(np.sum(limite == j)) for j, nome in enumerate(LIMITES)}
+
+    return V.tolist(), contagem_limites, limite
+
+
+def resolver_volta_lancada(R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+                           pcurve, m, Pv, marcha, P, Vmax, backend='python',
+                           tol=1e-9, max_iter=100):
+    """
+    Volta lançada em circuito fechado: perfil periódico, com a velocidade
+    de início igual à de fim.
+
+    Os arrays têm um valor por segmento (N para N pontos); o segmento N - 1
+    liga o último ponto ao primeiro e R[i] é o raio no ponto (i + 1) % N.
+
+    A volta é girada para começar no ponto de menor Vcap, que quase sempre
+    é um ápice preso ao limite de curva; aí uma única execução dos passes
+    já é periódica. Quando não é (o passe para frente não volta a alcançar
+    Vcap, ou o passe para trás não sai dele), a velocidade na emenda é
+    iterada até o ponto fixo. Cada iteração refaz só o trecho entre a emenda
+    e o primeiro ponto em que o passe encosta em Vcap (o último, no passe
+    para trás): dali em diante ele não depende da condição na emenda.
+
+    Returns:
+        tuple: (V, contagem_limites, limite, iteracoes, convergiu)
+            V (list): Velocidades [m/s] nos N pontos mais o retorno ao
+            primeiro (N + 1 valores, V[N] = V[0]).
+            contagem_limites (dict): Pontos por limite, contando os N pontos.
+            limite (np.ndarray): Índice em LIMITES em cada um dos N + 1 pontos.
+            iteracoes (int): Execuções de passes (1 quando já periódico).
+            convergiu (bool): False se max_iter acabou antes de a velocidade
+            na emenda chegar ao ponto fixo (a menos de tol).
+    """
+    R = np.asarray(R, dtype=float)
+    n = len(R)
+    Ay0 = np.asarray(Ay0, dtype=float)
+
+    # Início no ponto de menor Vcap (Vcap do ponto (s + 1) % n vem de R[s])
+    s = int(np.argmin(velocidade_limite_curva(R, Ay0, cAy, Vmax)[0]))
+    p0 = (s + 1) % n
+    Rr, Dr, sr, Ax0r, Ay0r = (np.roll(np.asarray(a, dtype=float)[:n], -p0)
+                              for a in (R, D, slope, Ax0, Ay0))
+
+    def passes(V0, a, b, Vfim=None):
+        return passes_dois_passos(V0, Rr[a:b], Dr[a:b], sr[a:b], Ax0r[a:b], cAx, Ay0r[a:b], cAy,
+                                  Axmin, g, k, pcurve, m, Pv, marcha, P, Vmax,
+                                  backend=backend, Vfim=Vfim)
+
+    V0 = velocidade_limite_curva(Rr[-1:], Ay0r[-1:], cAy, Vmax)[0][0]
+    Vf, Vb, Vcap, por_vmax, por_potencia = passes(V0, 0, n)
+    iteracoes = 1
+
+    # ⇨ PONTO FIXO DO PASSE PARA FRENTE: V0 = Vf[n]
+    while Vf[n] < V0 - tol and iteracoes < max_iter:
+        V0 = Vf[n]
+        presos = np.flatnonzero(Vf[1:] >= Vcap[1:]) + 1
+        for q in list(presos) + [n]:
+            Vf_j, _, _, _, pot_j = passes(V0, 0, q)
+            iteracoes += 1
+            if q == n or Vf_j[-1] >= Vcap[q]:
+                break
+        Vf[:q + 1] = Vf_j
+        por_potencia[1:q + 1] = pot_j[1:]
+
+    # ⇨ PONTO FIXO DO PASSE PARA TRÁS: Vb[n] = min(Vcap[n], Vb[0])
+    Vfim = Vb[n]
+    while Vb[0] < Vfim - tol and iteracoes < max_iter:
+        Vfim = Vb[0]
+        presos = np.flatnonzero(Vb[1:n] >= Vcap[1:n]) + 1
+        for q in list(presos[::-1]) + [0]:
+            _, Vb_j, _, _, _ = passes(Vf[q], q, n, Vfim=Vfim)
+            iteracoes += 1
+            if q == 0 or Vb_j[0] >= Vcap[q]:
+                break
+        Vb[q:] = Vb_j
+        Vb[q] = min(Vb[q], Vcap[q])
+
+    convergiu = not (Vf[n] < V0 - tol or Vb[0] < Vfim - tol)
+    if not convergiu:
+        print(f'⚠️ Volta lançada não convergiu em {max_iter} iterações '
+              f'(Δ = {max(V0 - Vf[n], Vfim - Vb[0]):.2e} m/s)')
+
+    Vinicio = min(V0, Vb[0])
+    Vr, _, limite_r = envelope_limites(Vf, Vb, Vinicio, Vcap, por_vmax, por_potencia)
+    Vr[n] = Vinicio
+    limite_r[0] = limite_r[n]
+
+    # Volta à numeração original dos pontos
+    V = np.roll(np.asarray(Vr[:n]), p0)
+    limite = np.roll(limite_r[:n], p0)
+    contagem_limites = {nome: int(np.sum(limite == j)) for j, nome in enumerate(LIMITES)}
+
+    return (np.append(V, V[0]).tolist(), contagem_limites,
+            np.append(limite, limite[0]), iteracoes, convergiu)
+
+
+def ancoras_apice(Vcap, Vmax, partes):
+    """
+    Candidatos a ápice para dividir o perfil em trechos independentes.
+
+    O perfil [0, n] é dividido em `partes` janelas iguais e, em cada uma,
+    fica o ponto de menor Vcap, se ele for limitado pela aderência lateral
+    (Vcap < Vmax). O ponto mais lento de uma janela longa quase sempre é
+    alcançado pelo perfil, ou seja, V = Vcap nele.
+
+    Args:
+        Vcap (np.ndarray): Limite de curva por ponto (passes_dois_passos).
+        Vmax (float): Velocidade máxima [m/s].
+        partes (int): Número de janelas.
+
+    Returns:
+        np.ndarray: Índices das âncoras, incluindo 0 e n.
+    """
+    n = len(Vcap) - 1
+    limites = np.linspace(1, n, partes + 1).astype(np.intp)
+    ancoras = [0]
+    for a, b in zip(limites[:-1], limites[1:]):
+        if b - a < 2:
+            continue
+        i = a + int(np.argmin(Vcap[a:b]))
+        if Vcap[i] < Vmax and i > ancoras[-1]:
+            ancoras.append(i)
+    if ancoras[-1] != n:
+        ancoras.append(n)
+    return np.asarray(ancoras)
+
+
+def _resolver_trecho(V0, R, D, slope, Ax0, Ay0, constantes, backend):
+    # Tarefa dos processos: passes de um trecho entre duas âncoras
+    cAx, cAy, Axmin, g, k, pcurve, m, Pv, marcha, P, Vmax = constantes
+    return passes_dois_passos(V0, R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+                              pcurve, m, Pv, marcha, P, Vmax, backend=backend)
+
+
+def resolver_dois_passos_paralelo(V0, R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+                                  pcurve, m, Pv, marcha, P, Vmax, backend='python',
+                                  processos=None, partes=None):
+    """
+    resolver_dois_passos com os trechos entre ápices resolvidos em paralelo.
+
+    Num ponto em que V = Vcap os passes para frente e para trás valem
+    exatamente Vcap, o que desacopla os dois lados. A pista é dividida nas
+    âncoras de ancoras_apice, cada trecho é resolvido num processo com
+    V0 = Vcap na âncora inicial e os trechos são emendados. Se o passe para
+    frente do trecho anterior não chega a Vcap na âncora (ex.: arrasto na
+    curva), o trecho seguinte é refeito a partir do valor que chegou; se o
+    passe para trás do trecho seguinte não sai de Vcap, os dois trechos são
+    unidos e refeitos. O resultado é idêntico ao de resolver_dois_passos.
+
+    Args:
+        processos (int, optional): Processos do pool (padrão e máximo:
+            os.cpu_count()). Com um processo, ou menos de duas partes, resolve
+            em série sem abrir o pool.
+        partes (int, optional): Janelas de busca de ápices (padrão: 4 por
+            processo, com trechos de pelo menos TAMANHO_MIN_TRECHO pontos).
+
+    Returns:
+        tuple: (V, contagem_limites, limite, trechos) — os três primeiros como
+        em resolver_dois_passos; trechos é o nº de trechos da emenda final.
+    """
+    R = np.asarray(R, dtype=float)
+    n = len(R)
+    D, slope, Ax0, Ay0 = (np.asarray(a, dtype=float)[:n] for a in (D, slope, Ax0, Ay0))
+    nucleos = os.cpu_count() or 1
+    processos = min(processos or nucleos, nucleos)
+    if partes is None:
+        partes = min(4 * processos, n // TAMANHO_MIN_TRECHO)
+
+    def serial():
+        V, contagem_limites, limite = resolver_dois_passos(
+            V0, R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+            pcurve, m, Pv, marcha, P, Vmax, backend=backend
+        )
+        return V, contagem_limites, limite, 1
+
+    # Com um núcleo ou pista curta o pool só acrescenta custo
+    if processos == 1 or partes < 2:
+        return serial()
+
+    Vcap = np.empty(n + 1)
+    Vcap[0] = np.inf
+    Vcap[1:] = velocidade_limite_curva(R, Ay0, cAy, Vmax)[0]
+    ancoras = ancoras_apice(Vcap, Vmax, partes)
+    if len(ancoras) <= 2:
+        return serial()
+
+    constantes = (cAx, cAy, Axmin, g, k, pcurve, m, Pv, marcha, P, Vmax)
+    # início -> [fim, V0 do trecho, resultado de passes_dois_passos (None = a resolver)]
+    trechos = {a: [b, V0 if a == 0 else Vcap[a], None] for a, b in zip(ancoras[:-1], ancoras[1:])}
+
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        while True:
+            pendentes = [(a, executor.submit(_resolver_trecho, Va, R[a:b], D[a:b], slope[a:b],
+                                             Ax0[a:b], Ay0[a:b], constantes, backend))
+                         for a, (b, Va, res) in trechos.items() if res is None]
+            if not pendentes:
+                break
+            for a, futuro in pendentes:
+                trechos[a][2] = futuro.result()
+
+            # Confere cada emenda com o trecho da esquerda já resolvido
+            inicios = sorted(trechos)
+            esq = inicios[0]
+            for a in inicios[1:]:
+                if trechos[esq][2] is None:
+                    esq = a
+                    continue
+                Vf_esq = trechos[esq][2][0][-1]
+                if trechos[a][2][1][0] < Vcap[a]:
+                    # O passe para trás não sai de Vcap: une os dois trechos
+                    trechos[esq] = [trechos.pop(a)[0], trechos[esq][1], None]
+                    continue
+                if trechos[a][1] != Vf_esq:
+                    # O passe para frente não chegou a Vcap: recomeça deste valor
+                    trechos[a] = [trechos[a][0], float(Vf_esq), None]
+                esq = a
+
+    # ⇨ EMENDA: o ponto de junção fica com o valor do trecho que termina nele
+    V, limite = [np.array([V0])], [np.array([-1])]
+    for a in sorted(trechos):
+        _, Va, (Vf, Vb, Vcap_t, por_vmax, por_potencia) = trechos[a]
+        V_t, _, limite_t = envelope_limites(Vf, Vb, Va, Vcap_t, por_vmax, por_potencia)
+        V.append(np.asarray(V_t[1:]))
+        limite.append(limite_t[1:])
+    V, limite = np.concatenate(V), np.concatenate(limite)
+    contagem_limites = {nome: int(np.sum(limite == j)) for j, nome in enumerate(LIMITES)}
+
+    return V.tolist(), contagem_limites, limite, len(trechos)
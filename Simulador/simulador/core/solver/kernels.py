@@ -0,0 +1,360 @@
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_DISPONIVEL = True
+except ImportError:  # backend 'numba' indisponível, loop volta ao caminho em Python
+    NUMBA_DISPONIVEL = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+# Kernels compilados (Numba) da marcha, de Roots, de corrigir_velocidade e dos
+# dois passes. Reproduzem as expressões do caminho em Python, que segue sendo a
+# referência; as raízes complexas do Python viram NaN aqui. Onde a referência
+# para com TypeError, os kernels levantam ValueError:
+#   - roots_kernel: velocidade complexa depois da correção pela potência;
+#   - _corrigir_kernel: Roots sem solução durante a retroação (o Python
+#     indexa o False retornado) e argumento negativo na raiz de x1N (o Python
+#     compara o x1N complexo), exceto com tolerante=True, que segue a
+#     retroação tolerante de corrigir_velocidade.
+
+
+@njit(cache=True)
+def _raiz(a):
+    # Equivalente a a ** 0.5, com NaN onde o Python daria um complexo
+    if a < 0:
+        return np.nan
+    return math.sqrt(a)
+
+
+@njit(cache=True)
+def _interp_potencia(v, pv_v, pv_p):
+    # Mesma conta de TabelaPotencia(v): malha uniforme de powercurve
+    n = pv_v.shape[0]
+    pos = (v - pv_v[0]) / (pv_v[1] - pv_v[0])
+    i = min(max(math.floor(pos), 0), n - 2)
+    return pv_p[i] + (pos - i) * (pv_p[i + 1] - pv_p[i])
+
+
+@njit(cache=True)
+def _arealP(v, marcha, Axmax, pv_v, pv_p, m, P):
+    if marcha:
+        if v < pv_v[0]:
+            return Axmax
+        return _interp_potencia(v, pv_v, pv_p) / m / v
+    return P / m / v
+
+
+@njit(cache=True)
+def _raiz_valida(s, Vo2, D, Axmax, Axmin, g, slope, k):
+    # Filtros de Roots: raiz real, dentro da elipse de aderência e com V² >= 0
+    if math.isnan(s):
+        return False
+    if not (-Axmin - g * slope - k * (Vo2 + 2*s * D) - 0.00001 <= s <= Axmax - g * slope - k * (Vo2 + 2*s * D) + 0.00001):
+        return False
+    return Vo2 + 2 * s * D >= 0
+
+
+@njit(cache=True)
+def roots_kernel(Vo, D, R, Axmax, Axmin, Aymax, slope, g, k, pv_v, pv_p, marcha, P, m):
+    """
+    Roots escalar compilado.
+
+    Returns:
+        tuple: (ok, inter_min, inter_max, V_min, V_max); ok=False onde Roots
+        retornaria False.
+    """
+    # Mesmas expressões de Roots, com os termos comuns às três raízes
+    # calculados uma vez só (mesma ordem de operações, mesmo resultado)
+    Vo2 = Vo**2
+    Ay2R2 = Aymax**2*R**2
+    q = 2*D*k + 1
+    termo_lateral = Aymax**2*(2*D*k*R + R)**2
+    termo_v = (Vo2 - 2*D*g*slope)**2
+    termo_gk = Ay2R2*q*(g*slope + k*Vo2)
+
+    Axmin2 = Axmin**2
+    den_min = 4*Axmin2*D**2 + Ay2R2*q**2
+    raiz_min = _raiz(Axmin2*Aymax**2*R**2*(4*Axmin2*D**2 + termo_lateral - termo_v))
+    x1 = -(raiz_min + 2*Axmin2*D*Vo2 + termo_gk)/den_min
+    x12 = (raiz_min - 2*Axmin2*D*Vo2 - termo_gk)/den_min
+
+    Axmax2 = Axmax**2
+    x2 = (_raiz(Axmax2*Aymax**2*R**2*(4*Axmax2*D**2 + termo_lateral - termo_v))
+        - 2*Axmax2*D*Vo2 - termo_gk)/(4*Axmax2*D**2 + Ay2R2*q**2)
+
+    # Sem alocações: roots_kernel roda milhões de vezes na retroação
+    ok1 = not (x1 > -g * slope - k * (Vo2 + x1 * D)) and _raiz_valida(x1, Vo2, D, Axmax, Axmin, g, slope, k)
+    ok12 = not (x12 > -g * slope - k * (Vo2 + x1 * D)) and _raiz_valida(x12, Vo2, D, Axmax, Axmin, g, slope, k)
+    ok2 = not (x2 < -g * slope - k * (Vo2 + x2 * D)) and _raiz_valida(x2, Vo2, D, Axmax, Axmin, g, slope, k)
+
+    n_sol = 0
+    s0 = s1 = s2 = np.nan
+    for s, valida in ((x1, ok1), (x12, ok12), (x2, ok2)):
+        if valida:
+            if n_sol == 0:
+                s0 = s
+            elif n_sol == 1:
+                s1 = s
+            else:
+                s2 = s
+            n_sol += 1
+
+    if n_sol == 0:
+        return False, np.nan, np.nan, np.nan, np.nan
+    # Ordena as até três soluções válidas (no lugar de np.sort)
+    if n_sol >= 2 and s1 < s0:
+        s0, s1 = s1, s0
+    if n_sol == 3:
+        if s2 < s1:
+            s1, s2 = s2, s1
+        if s1 < s0:
+            s0, s1 = s1, s0
+
+    if n_sol == 2:
+        inter0, inter1 = s0, s1
+        V0, V1 = _raiz(Vo ** 2 + 2 * s0 * D), _raiz(Vo ** 2 + 2 * s1 * D)
+    else:
+        inter0, inter1 = -Vo ** 2 / (2 * D), s0
+        V0, V1 = 0.0, _raiz(Vo ** 2 + 2 * s0 * D)
+
+    axreal = _arealP(V1, marcha, Axmax, pv_v, pv_p, m, P) - k*V1**2 - g*slope
+    if not (axreal >= inter1) and inter1 > 0:
+        inter1 = axreal
+        V1 = _raiz(Vo ** 2 + 2 * inter1 * D)
+        if math.isnan(V1):
+            raise ValueError("Roots: velocidade complexa após correção pela potência")
+    return True, inter0, inter1, V0, V1
+
+
+@njit(cache=True)
+def _corrigir_kernel(i, V, R, D, slope, AxmaxL, Axmin, AymaxL, k, g,
+                     pv_v, pv_p, marcha, P, m, contagem, tolerante):
+    # Mesma lógica de corrigir_velocidade; contagem = [Torricelli, V1, j=0, j>0].
+    # Retorna (j, método: 0 Torricelli / 1 V1, chamadas de roots_kernel)
+    j = 0
+    Vymax = _raiz(R[i - j] * AymaxL[i - j]) * 0.99
+
+    Vi_corrigido = _raiz((Vymax ** 2 + (2 * g * slope[i - j] * D[i - j]) / (1 + D[i - j] * k)) /
+                         (1 - (2 * D[i - j] * k) / (1 + k * D[i - j])))
+
+    if math.isnan(Vi_corrigido) or Vi_corrigido > Vymax:
+        arg = (AxmaxL[i - j] ** 2 * AymaxL[i - j] ** 2 * R[i - j] ** 2 *
+               (AxmaxL[i - j] ** 2 + AymaxL[i - j] ** 2 * (k ** 2) * R[i - j] ** 2
+                - g ** 2 * slope[i - j] ** 2))
+        num = AymaxL[i - j] ** 2 * g * k * R[i - j] ** 2 * slope[i - j]
+        den = AxmaxL[i - j] ** 2 + AymaxL[i - j] ** 2 * (k ** 2) * R[i - j] ** 2
+        if arg >= 0:
+            absV1 = abs((-math.sqrt(arg) + num) / den)
+        else:
+            absV1 = math.sqrt(num ** 2 - arg) / abs(den)  # módulo do V1 complexo
+
+        Vi_corrigido = absV1 ** 0.5
+        Vymax = Vi_corrigido
+        metodo = 1
+    else:
+        metodo = 0
+    contagem[metodo] += 1
+
+    V[i - j] = Vi_corrigido
+    V[i + 1] = Vymax
+
+    chamadas = 0
+    while (i - j) >= 2:
+        chamadas += 1
+        ok, _, _, Vint0, Vint1 = roots_kernel(
+            V[i - j - 1], D[i - j - 1], R[i - j - 1],
+            AxmaxL[i - j - 1], Axmin, AymaxL[i - j - 1],
+            slope[i - j - 1], g, k, pv_v, pv_p, marcha, P, m
+        )
+        if not ok and not tolerante:
+            raise ValueError("corrigir_velocidade: Roots sem solução durante a retroação")
+
+        if ok and Vint0 <= V[i - j] <= Vint1:
+            break
+
+        argumento = 1 - V[i - j] ** 4 / (R[i - j - 1] ** 2 * AymaxL[i - j - 1] ** 2)
+        if argumento < 0:
+            if not tolerante:
+                raise ValueError("corrigir_velocidade: argumento negativo na raiz de x1N")
+            V[i - j] = _raiz(R[i - j - 1] * AymaxL[i - j - 1])
+            argumento = 0.0
+
+        x1N_ajustado = (
+            -Axmin * math.sqrt(argumento)
+            - g * slope[i - j - 1]
+            - k * V[i - j - 1] ** 2
+        ) / (1 + k * D[i - j - 1])
+
+        if x1N_ajustado > V[i - j] ** 2 / (2 * D[i - j - 1]):
+            x1N_ajustado = V[i - j] ** 2 / (2 * D[i - j - 1]) * 0.99
+
+        if x1N_ajustado < (-Axmin - g * slope[i - j - 1] - k * V[i - j - 1] ** 2):
+            x1N_ajustado = -Axmin - g * slope[i - j - 1] - k * V[i - j - 1] ** 2
+
+        V_freada = _raiz(V[i - j] ** 2 - 2 * x1N_ajustado * D[i - j - 1])
+        V[i - j - 1] = min(V[i - j - 1], V_freada) if tolerante else V_freada
+        j += 1
+
+    if j == 0:
+        contagem[2] += 1
+    else:
+        contagem[3] += 1
+    return j, metodo, chamadas
+
+
+@njit(cache=True)
+def marcha_kernel(V0, R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+                  pv_v, pv_p, marcha, P, m, Vmax, tolerante=False):
+    """
+    Marcha para frente de loop com correção retroativa, compilada;
+    tolerante como em corrigir_velocidade. O custo acompanha chamadas_roots:
+    cada passo de retroação refaz um roots_kernel.
+
+    Returns:
+        tuple: (V, contagem, metodos, profundidades, chamadas_roots) com V de
+        len(R) + 1 pontos, contagem = [Torricelli Modificado, fórmula V1,
+        correção local, correção retroativa], o método e a profundidade j de
+        cada correção, em ordem, e o total de chamadas de roots_kernel.
+    """
+    n = R.shape[0]
+    V = np.empty(n + 1)
+    V[0] = V0
+    AxmaxL = np.empty(n)
+    AymaxL = np.empty(n)
+    contagem = np.zeros(4, dtype=np.int64)
+    metodos = np.empty(n, dtype=np.int64)
+    profundidades = np.empty(n, dtype=np.int64)
+    correcoes = 0
+    chamadas_roots = n
+
+    for i in range(n):
+        AymaxL[i] = Ay0[i] - cAy * V[i]**2
+        AxmaxL[i] = Ax0[i] - cAx * V[i]**2
+
+        ok, _, _, _, Viplus1 = roots_kernel(V[i], D[i], R[i], AxmaxL[i], Axmin, AymaxL[i],
+                                            slope[i], g, k, pv_v, pv_p, marcha, P, m)
+        if ok:
+            if Viplus1 > Vmax:
+                Viplus1 = Vmax
+            V[i + 1] = Viplus1
+        else:
+            j, metodo, chamadas = _corrigir_kernel(i, V, R, D, slope, AxmaxL, Axmin, AymaxL,
+                                                   k, g, pv_v, pv_p, marcha, P, m, contagem,
+                                                   tolerante)
+            if tolerante and V[i + 1] > Vmax:
+                V[i + 1] = Vmax
+            metodos[correcoes] = metodo
+            profundidades[correcoes] = j
+            correcoes += 1
+            chamadas_roots += chamadas
+
+    return V, contagem, metodos[:correcoes], profundidades[:correcoes], chamadas_roots
+
+
+@njit(cache=True)
+def _velocidade_final_potencia(Vo2, D, gs, k, Vlo, Vhi, hhi, Axmax, marcha, pv_v, pv_p, P, m):
+    # Mesma falsa posição de dois_passos.velocidade_final_potencia
+    hlo = Vlo * Vlo - Vo2 - 2 * D * (_arealP(Vlo, marcha, Axmax, pv_v, pv_p, m, P) - k * Vlo * Vlo - gs)
+    if hlo > 0:
+        return Vlo
+    lado = 0
+    for _ in range(50):
+        v = Vhi - hhi * (Vhi - Vlo) / (hhi - hlo)
+        if not (Vlo < v and v < Vhi):
+            break
+        h = v * v - Vo2 - 2 * D * (_arealP(v, marcha, Axmax, pv_v, pv_p, m, P) - k * v * v - gs)
+        if abs(h) <= 1e-10 * v * v:
+            return v
+        if h > 0:
+            Vhi = v
+            hhi = h
+            if lado == 1:
+                hlo /= 2
+            lado = 1
+        else:
+            Vlo = v
+            hlo = h
+            if lado == -1:
+                hhi /= 2
+            lado = -1
+    return Vlo if -hlo < hhi else Vhi
+
+
+@njit(cache=True)
+def dois_passos_kernel(V0, R, D, gs, Ax0, cAx, Ay0, cAy, Vcap, Axmin, k,
+                       pv_v, pv_p, marcha, P, m):
+    """
+    Passes para frente e para trás de resolver_dois_passos, compilados.
+
+    Returns:
+        tuple: (Vf, Vb, por_potencia)
+    """
+    n = R.shape[0]
+    Vf = np.empty(n + 1)
+    Vb = np.empty(n + 1)
+    por_potencia = np.zeros(n + 1, dtype=np.bool_)
+    v_min_pot = pv_v[0] if marcha else 0.0
+
+    Vf[0] = V0
+    for i in range(n):
+        q = 2 * D[i] * k + 1
+        Vo2 = Vf[i] ** 2
+        Axmax = Ax0[i] - cAx * Vo2
+        Aymax = Ay0[i] - cAy * Vo2
+        Ay2R2 = Aymax ** 2 * R[i] ** 2
+        den = Axmax ** 2 * (4 * D[i] ** 2) + Ay2R2 * q ** 2
+        disc = Axmax ** 2 * Ay2R2 * (den - (Vo2 - 2 * D[i] * gs[i]) ** 2)
+
+        if disc < 0:
+            Vf[i + 1] = Vcap[i + 1]
+            continue
+
+        x2 = (disc ** 0.5 - 2 * Axmax ** 2 * D[i] * Vo2 - Ay2R2 * q * (gs[i] + k * Vo2)) / den
+        V2 = Vo2 + 2 * x2 * D[i]
+        Vfim = V2 ** 0.5 if V2 > 0 else 0.0
+
+        if x2 > 0 and Vfim > 0:
+            if marcha:
+                if Vfim < v_min_pot:
+                    apot = Axmax
+                else:
+                    apot = _interp_potencia(Vfim, pv_v, pv_p) / m / Vfim
+            else:
+                apot = P / m / Vfim
+            axreal = apot - k * Vfim ** 2 - gs[i]
+            if axreal < x2:
+                V2 = Vo2 + 2 * axreal * D[i]
+                if V2 > 0:
+                    Vfim = _velocidade_final_potencia(Vo2, D[i], gs[i], k, V2 ** 0.5, Vfim,
+                                                      2 * D[i] * (x2 - axreal), Axmax,
+                                                      marcha, pv_v, pv_p, P, m)
+                else:
+                    Vfim = 0.0
+                por_potencia[i + 1] = True
+
+        Vf[i + 1] = min(Vfim, Vcap[i + 1])
+
+    Vb[n] = Vcap[n]
+    for i in range(n - 1, -1, -1):
+        Vfim2 = Vb[i + 1] ** 2
+        Aymax = Ay0[i] - cAy * Vfim2
+        razao = Vfim2 / (R[i] * Aymax) if Aymax > 0 else 1.0
+        lateral = (1 - razao ** 2) ** 0.5 if razao < 1 else 0.0
+        x1 = -Axmin * lateral - gs[i] - k * Vfim2
+        V2 = Vfim2 - 2 * x1 * D[i]
+        Vb[i] = min(V2 ** 0.5 if V2 > 0 else 0.0, Vcap[i])
+
+    return Vf, Vb, por_potencia
+
+
+def curva_potencia_arrays(pcurve, marcha):
+    # Curva de potência como arrays contíguos para os kernels
+    if marcha:
+        return (np.ascontiguousarray(pcurve[1], dtype=np.float64),
+                np.ascontiguousarray(pcurve[0], dtype=np.float64))
+    return np.empty(0), np.empty(0)
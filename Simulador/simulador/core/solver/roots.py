@@ -0,0 +1,210 @@
+#import sys
+#import os
+
+#sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+#from tools import *
+
+import numpy as np
+
+def print_roots_info(x1, x12, x2, sol, inter=None, Vint=None): # Função para printar o acompanhamento do roots 
+    print(f"\n{'='*50}")
+    print(" RESULTADO - Roots()")
+    print(f"{'='*50}")
+    print(f"x1   : {x1:.5f} m/s²")
+    print(f"x12  : {x12:.5f} m/s²")
+    print(f"x2   : {x2:.5f} m/s²")
+    print(f"Válidos (soluções) : {sol}")
+    if inter and Vint:
+        print(f"\nIntervalo de aceleração permitido: {inter}")
+        print(f"Velocidades correspondentes: {Vint}")
+    print(f"{'='*50}\n")
+
+
+def arealP(v, marcha, Axmax, pcurve, Pv, m, P): # Aceleração disponível pela potência na velocidade v
+    if marcha == True:
+        if v < pcurve[1][0]:
+            return Axmax
+        else:
+            return Pv(v)/m/v
+    else:
+        return P/m/v
+
+
+def Roots(Vo, D, R, Axmax, Axmin, Aymax, slope, g, k,pcurve,m,Pv,marcha,P, verbose=False):
+
+    x1 = -((Axmin**2*Aymax**2*R**2*(4*Axmin**2*D**2 + \
+    Aymax**2*(2*D*k*R + R)**2 - (Vo**2 - 2*D*g*slope)**2))**0.5 + \
+    2*Axmin**2*D*Vo**2 + Aymax**2*R**2*(2*D*k + 1)*(g*slope +
+    k*Vo**2))/(4*Axmin**2*D**2 + \
+    Aymax**2*R**2*(2*D*k + 1)**2)
+
+    x12 = ((Axmin**2*Aymax**2*R**2*(4*Axmin**2*D**2 + Aymax**2*(2*D*k*R +
+    R)**2\
+    - (Vo**2 - 2*D*g*slope)**2))**0.5 - 2*Axmin**2*D*Vo**2 - \
+    Aymax**2*R**2*(2*D*k + 1)*(g*slope + k*Vo**2))/(4*Axmin**2*D**2\
+    + Aymax**2*R**2*(2*D*k + 1)**2)
+
+    x2 = ((Axmax**2*Aymax**2*R**2*(4*Axmax**2*D**2\
+    + Aymax**2*(2*D*k*R + R)**2 - (Vo**2 - 2*D*g*slope)**2))**0.5\
+    - 2*Axmax**2*D*Vo**2 - Aymax**2*R**2*(2*D*k + 1)*(g*slope + k*Vo**2))\
+    /(4*Axmax**2*D**2 + Aymax**2*R**2*(2*D*k + 1)**2)
+
+    sol = [x1,x12, x2]
+    
+    if verbose:
+        print_roots_info(x1, x12, x2, sol)
+
+
+    if type(x1) == float and x1 > -g * slope - k * (Vo ** 2 + x1 * D): # alteracao possível aqui, multiplicar por 2
+        sol.remove(x1)
+
+    if type(x2) == float and x2 < -g * slope - k * (Vo ** 2 + x2 * D): # alteracao possível aqui, multiplicar por 2
+        sol.remove(x2)
+
+    if type(x12) == float and x12 > -g * slope - k * (Vo ** 2 + x1 * D): # alteracao possível aqui, multiplicar por 2
+        sol.remove(x12)
+
+    sol = [i for i in sol if type(i) == float]
+    
+    sol = [i for i in sol if -Axmin - g * slope - k * (Vo ** 2 + 2*i * D)- 0.00001 <= i <= Axmax - g * slope - k * (Vo ** 2 + 2*i * D) + 0.00001] # alteracao possivel, multiplicar por 2 
+
+    sol = [i for i in sol if type((Vo ** 2 + 2 * i * D) ** 0.5) == float]
+    sol.sort()
+
+    if len(sol) == 0:
+
+        return False
+    else:
+        if len(sol) == 2:
+            inter = sol
+            Vint = [(Vo ** 2 + 2 * sol[0] * D) ** 0.5, (Vo ** 2 + 2 * sol[1] * D) ** 0.5]
+
+        else:
+            inter = [-Vo ** 2 / (2 * D), sol[0]]
+            Vint = [0, (Vo ** 2 + 2 * sol[0] * D) ** 0.5]
+            
+    axreal = arealP(Vint[1], marcha, Axmax, pcurve, Pv, m, P) - k*Vint[1]**2 - g*slope
+    if axreal >= inter[1]:
+        pass
+    else:# #corrigir para que a aceleracao maxima seja guiada pela potencia:
+        if inter[1] <= 0:
+            pass
+        else:
+            inter[1] = axreal
+            Vint[1] = float((Vo ** 2 + 2 * inter[1] * D) ** 0.5)
+    return inter, Vint
+
+
+def termos_roots(D, R, slope, g, k):
+    """
+    Pré-calcula os termos de Roots que dependem apenas do segmento.
+
+    Args:
+        D, R, slope (array-like): Distância, raio e inclinação efetiva por segmento.
+        g (float): Gravidade.
+        k (float): Coeficiente aerodinâmico equivalente.
+
+    Returns:
+        dict: Termos reutilizáveis por RootsVetorizado.
+    """
+    D = np.asarray(D, dtype=float)
+    R = np.asarray(R, dtype=float)
+    gs = g * np.asarray(slope, dtype=float)
+    q = 2 * D * k + 1
+    return {
+        "D": D, "gs": gs, "q": q,
+        "R2q2": R ** 2 * q ** 2,   # Aymax² * R² * (2Dk + 1)² sem o Aymax²
+        "R2": R ** 2,
+        "D2x4": 4 * D ** 2,
+        "Dgs2": 2 * D * gs,
+    }
+
+
+def RootsVetorizado(Vo, D, R, Axmax, Axmin, Aymax, slope, g, k, pcurve, m, Pv, marcha, P, termos=None):
+    """
+    Versão em lote de Roots: resolve as quadráticas do Círculo de Kamm para
+    todos os segmentos de uma vez.
+
+    Raízes complexas viram NaN e as filtragens de Roots viram máscaras, de modo
+    que cada linha reproduz o resultado da chamada escalar correspondente.
+
+    Args:
+        Vo, D, R, Axmax, Aymax, slope (array-like): Valores por segmento.
+        Axmin, g, k, m, P (float): Constantes da simulação.
+        pcurve, Pv, marcha: Curva de potência, como em Roots.
+        termos (dict, optional): Saída de termos_roots para os mesmos D, R, slope.
+
+    Returns:
+        tuple: (inter, Vint, valido)
+            inter (np.ndarray): (N, 2) intervalo de aceleração admissível.
+            Vint (np.ndarray): (N, 2) intervalo de velocidade correspondente.
+            valido (np.ndarray): máscara booleana; onde False, Roots retornaria
+            False e as linhas de inter/Vint são NaN.
+    """
+    if termos is None:
+        termos = termos_roots(D, R, slope, g, k)
+
+    Vo = np.asarray(Vo, dtype=float)
+    Axmax = np.broadcast_to(np.asarray(Axmax, dtype=float), Vo.shape)
+    Aymax = np.asarray(Aymax, dtype=float)
+    D, gs, q = termos["D"], termos["gs"], termos["q"]
+
+    Vo2 = Vo ** 2
+    Ay2R2q2 = Aymax ** 2 * termos["R2q2"]
+    Ay2R2 = Aymax ** 2 * termos["R2"]
+    w = (Vo2 - termos["Dgs2"]) ** 2
+    c = Ay2R2 * q * (gs + k * Vo2)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Raízes do lado da frenagem (Axmin): x1 e x12 compartilham o discriminante
+        den1 = Axmin ** 2 * termos["D2x4"] + Ay2R2q2
+        s1 = np.sqrt(Axmin ** 2 * Ay2R2 * (den1 - w))
+        b1 = 2 * Axmin ** 2 * D * Vo2 + c
+        x1 = -(s1 + b1) / den1
+        x12 = (s1 - b1) / den1
+
+        # Raiz do lado da tração (Axmax)
+        den2 = Axmax ** 2 * termos["D2x4"] + Ay2R2q2
+        s2 = np.sqrt(Axmax ** 2 * Ay2R2 * (den2 - w))
+        x2 = (s2 - 2 * Axmax ** 2 * D * Vo2 - c) / den2
+
+        base = -gs - k * Vo2
+        sol = np.stack((x1, x12, x2), axis=-1)
+        manter = np.isfinite(sol)
+        manter[..., 0] &= ~(x1 > base - k * x1 * D)
+        manter[..., 1] &= ~(x12 > base - k * x1 * D)
+        manter[..., 2] &= ~(x2 < base - k * x2 * D)
+
+        lim = base[..., None] - 2 * k * sol * D[..., None]
+        manter &= (-Axmin + lim - 0.00001 <= sol) & (sol <= Axmax[..., None] + lim + 0.00001)
+        manter &= Vo2[..., None] + 2 * sol * D[..., None] >= 0
+
+        sol = np.sort(np.where(manter, sol, np.nan), axis=-1)
+        n_sol = manter.sum(axis=-1)
+        valido = n_sol > 0
+
+        # Duas soluções: intervalo entre elas; uma (ou três): da parada até a menor
+        dois = n_sol == 2
+        inter_min = np.where(dois, sol[..., 0], -Vo2 / (2 * D))
+        inter_max = np.where(dois, sol[..., 1], sol[..., 0])
+        V_min = np.where(dois, np.sqrt(Vo2 + 2 * inter_min * D), 0.0)
+        V_max = np.sqrt(Vo2 + 2 * inter_max * D)
+
+        # Correção para que a aceleração máxima seja guiada pela potência
+        if marcha == True:
+            # Linhas sem solução (V_max NaN) não entram na consulta da curva
+            v_curva = np.where(np.isnan(V_max), pcurve[1][0], V_max)
+            apot = np.where(V_max < pcurve[1][0], Axmax, Pv(v_curva) / m / V_max)
+        else:
+            apot = P / m / V_max
+        axreal = apot - k * V_max ** 2 - gs
+        corrigir = ~(axreal >= inter_max) & (inter_max > 0)
+        inter_max = np.where(corrigir, axreal, inter_max)
+        V_max = np.where(corrigir, np.sqrt(Vo2 + 2 * inter_max * D), V_max)
+
+    inter = np.stack((inter_min, inter_max), axis=-1)
+    Vint = np.stack((V_min, V_max), axis=-1)
+    inter[~valido] = np.nan
+    Vint[~valido] = np.nan
+    return inter, Vint, valido
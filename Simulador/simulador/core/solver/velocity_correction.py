@@ -0,0 +1,147 @@
+from simulador.core.logger.eventos import EVENTOS, DETALHADO
+from simulador.core.solver.roots import Roots
+
+def corrigir_velocidade(i, V, R, D, slope, AxmaxL, Axmin, AymaxL, k, g,
+                        pcurve, m, Pv, marcha, P, mu,
+                        contagem_metodo, contagem_sucesso, registro=None,
+                        estatisticas=None, tolerante=False):
+    """
+    Realiza correção retroativa da velocidade caso Roots retorne False,
+    respeitando os limites impostos pelo Círculo de Kamm e Equação de Torricelli.
+    Atualiza separadamente:
+        - o método de correção utilizado (direto ou via V1),
+        - e a profundidade da correção (j == 0 ou j > 0).
+
+    registro (RegistroSolver, optional): recebe os eventos de correção
+    (nível EVENTOS) e as etapas detalhadas (nível DETALHADO). Sem registro,
+    nada é impresso nem gravado.
+
+    estatisticas (EstatisticasSolver, optional): recebe o método, a
+    profundidade j e o nº de chamadas de Roots da correção.
+
+    tolerante (bool): na retroação, Roots sem solução ou raiz de x1N
+    complexa deixam de interromper a simulação (TypeError): a frenagem para
+    trás continua, V[i - j] desce ao limite lateral do segmento anterior
+    quando passa dele, e as velocidades só são reduzidas.
+    """
+
+    eventos = registro is not None and registro.nivel >= EVENTOS
+    detalhado = registro is not None and registro.nivel >= DETALHADO
+
+    j = 0
+    if detalhado:
+        registro.emitir("entrada_correcao", i, j, R, V, AymaxL, AxmaxL, slope, D)
+    Vymax = ((R[i - j] * AymaxL[i - j]) ** 0.5) * 0.99
+
+    Vi_corrigido = ((Vymax ** 2 + (2 * g * slope[i - j] * D[i - j]) / (1 + D[i - j] * k)) /
+                    (1 - (2 * D[i - j] * k) / (1 + k * D[i - j]))) ** 0.5
+
+    metodo_corrigido = "Correção por Torricelli Modificado"
+
+    # Verifica se a correção direta é inválida
+    if isinstance(Vi_corrigido, complex) or Vi_corrigido > Vymax:
+        V1 = (-(AxmaxL[i - j] ** 2 * AymaxL[i - j] ** 2 * R[i - j] ** 2 *
+                (AxmaxL[i - j] ** 2 + AymaxL[i - j] ** 2 * (k ** 2) * R[i - j] ** 2
+                 - g ** 2 * slope[i - j] ** 2)) ** 0.5 +
+              AymaxL[i - j] ** 2 * g * k * R[i - j] ** 2 * slope[i - j]) / \
+             (AxmaxL[i - j] ** 2 + AymaxL[i - j] ** 2 * (k ** 2) * R[i - j] ** 2)
+
+        Vi_corrigido = abs(V1) ** 0.5
+        Vymax = Vi_corrigido
+        metodo_corrigido = "Correção por fórmula V1"
+
+    # Atualiza contador do método utilizado
+    if contagem_metodo is not None and metodo_corrigido in contagem_metodo:
+        contagem_metodo[metodo_corrigido] += 1
+
+    V[i - j] = Vi_corrigido
+    #print_v_info(i, j, Vymax, V[i - j])
+    V.append(Vymax)
+
+    # Tenta retroagir, se necessário
+    chamadas_roots = 0
+    while (i - j) >= 2:
+        Vi_ant = V[i - j - 1]
+
+        if detalhado:
+            registro.emitir("retroacao", i, j, R[i - j - 1], D[i - j - 1])
+
+        chamadas_roots += 1
+        resultado_roots = Roots(
+            Vi_ant, D[i - j - 1], R[i - j - 1],
+            AxmaxL[i - j - 1], Axmin, AymaxL[i - j - 1],
+            slope[i - j - 1], g, k,
+            pcurve, m, Pv, marcha, P, verbose=False
+        )
+
+        if tolerante and resultado_roots == False:
+            # Sem solução, o ponto anterior também é rápido demais: segue freando
+            intervalo = None
+        else:
+            intervalo = resultado_roots[1]
+            if detalhado:
+                Vcalc = (V[i - j - 1]**2 + 2 * intervalo[1] * D[i - j - 1]) ** 0.5
+                registro.emitir("raiz", i, j, intervalo, Vcalc)
+
+        if intervalo is not None and intervalo[0] <= V[i - j] <= intervalo[1]:
+            break
+        else:
+            if detalhado:
+                registro.emitir("debug_x1n", i, j, V, R, AymaxL)
+
+            #teste, colocar o argumento fora da fórmula do x1N
+            argumento = 1 - V[i - j] ** 4 / (R[i - j - 1] ** 2 * AymaxL[i - j - 1] ** 2)
+            argumento_bruto = argumento   # o registro guarda o sinal antes do ajuste
+            if tolerante and argumento < 0:
+                # V[i - j] passa do limite lateral do segmento anterior (a raiz
+                # ficaria complexa): desce ao limite, sem aderência para frear
+                V[i - j] = (R[i - j - 1] * AymaxL[i - j - 1]) ** 0.5
+                argumento = 0.0
+
+            x1N = (
+                -Axmin * (argumento) ** 0.5
+                - g * slope[i - j - 1]
+                - k * V[i - j - 1] ** 2
+            ) / (1 + k * D[i - j - 1])
+
+            x1N_bruto = x1N
+            x1N_ajustado = x1N_bruto
+
+            if x1N_ajustado > V[i - j] ** 2 / (2 * D[i - j - 1]):
+                x1N_ajustado = V[i - j] ** 2 / (2 * D[i - j - 1]) * 0.99
+
+            if x1N_ajustado < (-Axmin - g * slope[i - j - 1] - k * V[i - j - 1] ** 2):
+                x1N_ajustado = -Axmin - g * slope[i - j - 1] - k * V[i - j - 1] ** 2
+
+            if detalhado:
+                registro.emitir("debug_x1n", i, j, V, R, AymaxL, x1N_bruto, x1N_ajustado)
+
+            V_freada = (V[i - j] ** 2 - 2 * x1N_ajustado * D[i - j - 1]) ** 0.5
+            # Tolerante, a frenagem para trás não ergue o que a potência segurou abaixo
+            V[i - j - 1] = min(V[i - j - 1], V_freada) if tolerante else V_freada
+            if eventos:
+                registro.registrar_correcao(i, j, metodo_corrigido, x1N_bruto, x1N_ajustado,
+                                            argumento_bruto)
+            if detalhado:
+                registro.emitir("ajuste", i, j, V, x1N_ajustado, D)
+
+            j += 1
+            if detalhado:
+                registro.emitir("iterador", j)
+
+    # Atualiza o contador de sucesso (profundidade da correção)
+    if contagem_sucesso is not None:
+        if j == 0:
+            contagem_sucesso["Correção local (j=0) "] += 1
+        else:
+            contagem_sucesso["Correção retroativa (j>0) "] += 1
+
+    if estatisticas is not None:
+        estatisticas.registrar_correcao(metodo_corrigido, j, chamadas_roots)
+
+    if eventos and j == 0:
+        registro.registrar_correcao(i, 0, metodo_corrigido, float('nan'), float('nan'), 0)
+    if detalhado:
+        registro.emitir("resumo", i, j, metodo_corrigido, contagem_metodo, contagem_sucesso)
+
+    return V
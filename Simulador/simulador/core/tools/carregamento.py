@@ -0,0 +1,253 @@
+import os
+import xml.etree.ElementTree as ET
+from array import array
+
+import numpy as np
+import pandas as pd
+
+COLUNAS_PADRAO = {'x': 'x', 'y': 'y', 'z': 'z'}
+
+
+def _fatores(escala):
+    # Fator de conversão para metros por coordenada
+    if isinstance(escala, dict):
+        return {eixo: float(escala.get(eixo, 1.0)) for eixo in 'xyz'}
+    return {eixo: float(escala) for eixo in 'xyz'}
+
+
+def ler_csv_trajetoria(caminho, colunas=None, escala=1.0, tamanho_bloco=500_000, **kwargs_csv):
+    """
+    Lê uma trajetória de CSV em blocos, direto para arrays float64 contíguos.
+
+    Args:
+        caminho (str): Arquivo CSV.
+        colunas (dict, optional): Nome da coluna de cada eixo, ex.:
+            {'x': 'Easting', 'y': 'Northing', 'z': 'Alt'}. Com 'z': None (ou
+            ausente), z é preenchido com zeros. Padrão: colunas x, y, z.
+        escala (float or dict): Fator para converter cada eixo em metros,
+            único ou por eixo, ex.: {'z': 0.3048} para altitude em pés.
+        tamanho_bloco (int): Linhas lidas por bloco.
+        **kwargs_csv: Repassados a pd.read_csv (sep, decimal, ...).
+
+    Returns:
+        tuple: x, y, z (np.ndarray float64)
+    """
+    colunas = {**COLUNAS_PADRAO, **(colunas or {})}
+    eixos = [eixo for eixo in 'xyz' if colunas.get(eixo)]
+    fatores = _fatores(escala)
+
+    blocos = {eixo: [] for eixo in eixos}
+    leitor = pd.read_csv(caminho, usecols=[colunas[eixo] for eixo in eixos],
+                         dtype={colunas[eixo]: np.float64 for eixo in eixos},
+                         chunksize=tamanho_bloco, **kwargs_csv)
+    for bloco in leitor:
+        for eixo in eixos:
+            blocos[eixo].append(bloco[colunas[eixo]].to_numpy(dtype=np.float64))
+
+    coords = {}
+    for eixo in eixos:
+        coords[eixo] = np.concatenate(blocos[eixo]) if blocos[eixo] else np.empty(0)
+        blocos[eixo] = None
+        if fatores[eixo] != 1.0:
+            coords[eixo] *= fatores[eixo]
+
+    if 'z' not in coords:
+        coords['z'] = np.zeros_like(coords['x'])
+
+    return coords['x'], coords['y'], coords['z']
+
+
+def salvar_binario_trajetoria(caminho, x, y, z):
+    """
+    Grava a trajetória em .npy com forma (3, N), um eixo contíguo por linha.
+    """
+    np.save(caminho, np.vstack([np.asarray(c, dtype=np.float64) for c in (x, y, z)]))
+
+
+def ler_binario_trajetoria(caminho, escala=1.0):
+    """
+    Lê uma trajetória gravada por salvar_binario_trajetoria com memory map.
+
+    Returns:
+        tuple: x, y, z — views somente leitura do arquivo (sem cópia), ou
+        arrays em memória se escala != 1.
+    """
+    dados = np.load(caminho, mmap_mode='r')
+    if dados.ndim != 2 or dados.shape[0] != 3:
+        raise ValueError(f"Trajetória binária deve ter forma (3, N); encontrado {dados.shape}")
+
+    fatores = _fatores(escala)
+    return tuple(dados[k] * fatores[eixo] if fatores[eixo] != 1.0 else dados[k]
+                 for k, eixo in enumerate('xyz'))
+
+
+def _nome_local(tag):
+    # Tag sem o namespace: '{http://www.topografix.com/GPX/1/1}trkpt' -> 'trkpt'
+    return tag.rsplit('}', 1)[-1]
+
+
+def _trilhas_gpx(caminho):
+    # Gera (nome, lat, lon, ele) por <trk>/<rte>; pontos de vários <trkseg>
+    # do mesmo <trk> ficam na mesma trilha
+    nome, pai, lat, lon, ele = None, None, None, None, None
+    no_ponto = False
+    for evento, elem in ET.iterparse(caminho, events=('start', 'end')):
+        tag = _nome_local(elem.tag)
+        if evento == 'start':
+            if tag in ('trk', 'rte'):
+                nome, lat, lon, ele = None, array('d'), array('d'), array('d')
+            if tag in ('trkseg', 'rte'):
+                pai = elem
+            no_ponto = no_ponto or tag in ('trkpt', 'rtept')
+            continue
+
+        if tag in ('trkpt', 'rtept'):
+            no_ponto = False
+            lat.append(float(elem.get('lat')))
+            lon.append(float(elem.get('lon')))
+            alt = next((filho.text for filho in elem if _nome_local(filho.tag) == 'ele'), None)
+            ele.append(float(alt) if alt else np.nan)
+            # Descarta os pontos já lidos para a árvore não crescer
+            pai.clear()
+        elif tag == 'name' and lat is not None and nome is None and not no_ponto:
+            nome = (elem.text or '').strip()
+        elif tag in ('trk', 'rte'):
+            yield nome, lat, lon, ele
+            elem.clear()
+            lat = None
+
+
+def _trilhas_kml(caminho):
+    # Gera (nome, lat, lon, ele) por <Placemark> com <LineString> ou <gx:Track>
+    nome, pai, lat, lon, ele = None, None, None, None, None
+    na_linha = False
+    for evento, elem in ET.iterparse(caminho, events=('start', 'end')):
+        tag = _nome_local(elem.tag)
+        if evento == 'start':
+            if tag == 'Placemark':
+                nome, lat, lon, ele = None, array('d'), array('d'), array('d')
+            elif tag == 'Track':
+                pai = elem
+            elif tag == 'LineString':
+                na_linha = True
+            continue
+
+        if lat is None:
+            continue
+        if tag == 'name' and nome is None:
+            nome = (elem.text or '').strip()
+        elif tag == 'LineString':
+            na_linha = False
+        elif tag == 'coordinates' and na_linha and elem.text and elem.text.strip():
+            # Tuplas 'lon,lat[,alt]' separadas por espaço; o mesmo bloco pode
+            # misturar tuplas com e sem altitude, que fica NaN onde falta
+            tuplas = [tupla if tupla.count(',') >= 2 else f"{tupla},nan" for tupla in elem.text.split()]
+            valores = np.array(','.join(tuplas).split(','), dtype=np.float64).reshape(-1, 3)
+            lon.extend(valores[:, 0])
+            lat.extend(valores[:, 1])
+            ele.extend(valores[:, 2])
+            elem.clear()
+        elif tag == 'coord':
+            # <gx:coord>lon lat alt</gx:coord>
+            valores = [float(v) for v in elem.text.split()]
+            lon.append(valores[0])
+            lat.append(valores[1])
+            ele.append(valores[2] if len(valores) > 2 else np.nan)
+            pai.clear()
+        elif tag == 'when':
+            pai.clear()
+        elif tag == 'Placemark':
+            if len(lat):
+                yield nome, lat, lon, ele
+            elem.clear()
+            lat = None
+
+
+def _preencher_elevacao(ele):
+    # Pontos sem elevação recebem a interpolação linear dos vizinhos; sem
+    # nenhuma elevação, z = 0
+    faltando = np.isnan(ele)
+    if faltando.all():
+        return np.zeros_like(ele)
+    if faltando.any():
+        indices = np.arange(len(ele))
+        ele[faltando] = np.interp(indices[faltando], indices[~faltando], ele[~faltando])
+    return ele
+
+
+def ler_trajetorias_gps(caminho, method='utm', utm_epsg=None, elevacao=True):
+    """
+    Lê as trilhas de um arquivo GPX ou KML com leitura incremental (iterparse).
+
+    A árvore XML nunca fica inteira em memória: cada ponto é lido, guardado
+    em buffers contíguos e descartado. Cada <trk>/<rte> do GPX e cada
+    <Placemark> do KML com <LineString> ou <gx:Track> vira uma trajetória.
+
+    Args:
+        caminho (str): Arquivo .gpx ou .kml.
+        method (str): Conversão de latlon_to_xy ('utm', 'haversine' ou 'geodesica').
+        utm_epsg (str, optional): EPSG UTM; se None, é o da zona do primeiro
+            ponto do arquivo, o mesmo para todas as trilhas.
+        elevacao (bool): Usa a elevação do arquivo como z (pontos sem
+            elevação são interpolados); se False, z = 0.
+
+    Returns:
+        list: Um dict por trilha com 'nome' e x, y, z (np.ndarray float64),
+        prontos para interpolar_trajetoria.
+    """
+    from simulador.core.tools.gps_processing import latlon_to_xy, calcular_utm_epsg
+
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == '.gpx':
+        trilhas = _trilhas_gpx(caminho)
+    elif extensao == '.kml':
+        trilhas = _trilhas_kml(caminho)
+    else:
+        raise ValueError(f"Formato GPS não suportado: '{extensao}'")
+
+    resultado = []
+    for nome, lat, lon, ele in trilhas:
+        if not len(lat):
+            continue
+        lat, lon = np.frombuffer(lat), np.frombuffer(lon)
+        if method == 'utm' and utm_epsg is None:
+            utm_epsg = calcular_utm_epsg(lat[0], lon[0])
+        x, y = latlon_to_xy(lat, lon, method=method, utm_epsg=utm_epsg)
+        if elevacao:
+            z = _preencher_elevacao(np.array(ele, dtype=np.float64))
+        else:
+            z = np.zeros_like(x)
+        resultado.append({'nome': nome or f'trilha {len(resultado) + 1}', 'x': x, 'y': y, 'z': z})
+
+    if not resultado:
+        raise ValueError(f"Nenhuma trilha com pontos em '{caminho}'")
+    return resultado
+
+
+def carregar_arquivo_trajetoria(caminho, colunas=None, escala=1.0, trilha=0, **kwargs):
+    """
+    Carrega a trajetória escolhendo o leitor pela extensão (.csv, .npy,
+    .gpx ou .kml).
+
+    Args:
+        trilha (int): Trilha usada em arquivos GPX/KML com várias; as demais
+            ficam disponíveis em ler_trajetorias_gps. kwargs vão para
+            ler_trajetorias_gps (GPX/KML) ou ler_csv_trajetoria (CSV).
+
+    Returns:
+        tuple: x, y, z (np.ndarray float64)
+    """
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao in ('.gpx', '.kml'):
+        trilhas = ler_trajetorias_gps(caminho, **kwargs)
+        if len(trilhas) > 1:
+            print(f"⚠️ {len(trilhas)} trilhas em '{caminho}'; usando '{trilhas[trilha]['nome']}'.")
+        escolhida = trilhas[trilha]
+        fatores = _fatores(escala)
+        return tuple(escolhida[eixo] * fatores[eixo] if fatores[eixo] != 1.0 else escolhida[eixo]
+                     for eixo in 'xyz')
+    if extensao == '.npy':
+        return ler_binario_trajetoria(caminho, escala=escala)
+    if extensao in ('.csv', '.txt'):
+        return ler_csv_trajetoria(caminho, colunas=colunas, escala=escala, **kwargs)
+    raise ValueError(f"Formato de trajetória não suportado: '{extensao}'")
@@ -0,0 +1,131 @@
+import functools
+import numpy as np
+from scipy.signal import butter, sosfiltfilt
+
+# Talvez colocar mais alguns filtros possíveis para processamento de sinal futuramente 
+
+
+@functools.lru_cache(maxsize=64)
+def projetar_butterworth(ordem, cutoff, fs):
+    """
+    Passa-baixas Butterworth em seções de segunda ordem (SOS), projetado
+    uma única vez por (ordem, cutoff, fs).
+
+    Returns:
+        np.ndarray: Matriz sos, compartilhada pelo cache (não alterar).
+    """
+    nyq = 0.5 * fs
+    return butter(ordem, cutoff / nyq, btype='low', analog=False, output='sos')
+
+
+def frequencia_amostragem(x, y, z=None, use_z=False):
+    """
+    Frequência de amostragem espacial [amostras/m]: nº de intervalos
+    dividido pelo comprimento de arco da trajetória.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    d2 = np.diff(x) ** 2 + np.diff(y) ** 2
+    if use_z and z is not None:
+        d2 += np.diff(np.asarray(z, dtype=float)) ** 2
+    return (len(x) - 1) / np.sum(np.sqrt(d2))
+
+
+def filtrar_zero_fase(sinais, sos, tamanho_bloco=None, sobreposicao=None):
+    """
+    Filtragem de fase zero (sosfiltfilt) das colunas de `sinais` de uma vez.
+
+    Com tamanho_bloco, o sinal é filtrado em blocos: cada um é filtrado com
+    `sobreposicao` amostras a mais de cada lado e só o miolo é mantido, o
+    que limita a memória temporária ao tamanho do bloco.
+
+    Args:
+        sinais (np.ndarray): Forma (n,) ou (n, k), filtrado ao longo do eixo 0.
+        sos (np.ndarray): Filtro de projetar_butterworth.
+        tamanho_bloco (int, optional): Amostras por bloco (None = tudo de uma vez).
+        sobreposicao (int, optional): Amostras extras de cada lado do bloco,
+            que devem cobrir o transitório do filtro (padrão: tamanho_bloco // 4).
+
+    Returns:
+        np.ndarray: Sinais filtrados, com a forma de `sinais`.
+    """
+    sinais = np.asarray(sinais, dtype=float)
+    n = len(sinais)
+    if tamanho_bloco is None or n <= tamanho_bloco:
+        return sosfiltfilt(sos, sinais, axis=0)
+
+    if sobreposicao is None:
+        sobreposicao = tamanho_bloco // 4
+    saida = np.empty_like(sinais)
+    for inicio in range(0, n, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, n)
+        a = max(inicio - sobreposicao, 0)
+        b = min(fim + sobreposicao, n)
+        saida[inicio:fim] = sosfiltfilt(sos, sinais[a:b], axis=0)[inicio - a:fim - a]
+    return saida
+
+
+def aplicar_butterworth(x, y, z=None, use_z=False, butter_cutoff=0.1, butter_order=4, fs=None,
+                        tamanho_bloco=None, sobreposicao=None):
+    """
+    Aplica o filtro Butterworth em x, y (e z se fornecido).
+
+    O filtro é projetado em seções de segunda ordem (guardado em cache por
+    ordem, corte e fs) e x, y, z são filtrados juntos, como colunas de uma
+    única matriz.
+
+    Args:
+        x, y, z (array-like): Coordenadas.
+        use_z (bool): Considerar z na filtragem.
+        butter_cutoff (float): Frequência de corte.
+        butter_order (int): Ordem do filtro.
+        fs (float): Frequência de amostragem. Se None, usa a espacial da
+            trajetória (frequencia_amostragem: amostras por metro de arco).
+        tamanho_bloco, sobreposicao (int, optional): Filtragem em blocos para
+            arrays grandes (ver filtrar_zero_fase). A sobreposição padrão é de
+            20 períodos de corte (20 * fs / butter_cutoff amostras), em que o
+            transitório do filtro já caiu abaixo da precisão de float64.
+
+    Returns:
+        tuple: (x_filtrado, y_filtrado, z_filtrado)
+
+        ## Frequência de Corte Recomendada para o Filtro Butterworth
+s
+    A escolha da frequência de corte (`cutoff`) depende diretamente do espaçamento entre os pontos interpolados (`deltaD`). 
+
+    A tabela abaixo sugere valores típicos para projetos de análise e simulação de trajetórias baseadas em dados GPS/KML:
+
+    | deltaD (Espaçamento dos pontos) | Frequência de Amostragem fs = 1/deltaD (Hz) | Frequência de Corte sugerida (cutoff) | Comentário |
+    |---------------------------------|----------------------------------------------|----------------------------------------|------------|
+    | 0.1 m                           | 10 Hz                                       | 0.5 a 1 Hz                             | Dados muito detalhados, remove apenas ruído fino |
+    | 0.5 m                           | 2 Hz                                        | 0.2 a 0.5 Hz                           | Caminhos detalhados, com leve suavização |
+    | 1.0 m                           | 1 Hz                                        | 0.1 a 0.3 Hz                           | Uso geral para dados KML / GPS urbanos |
+    | 2.0 m                           | 0.5 Hz                                      | 0.05 a 0.2 Hz                          | Grandes trajetos urbanos ou mistos |
+    | 5.0 m                           | 0.2 Hz                                      | 0.03 a 0.1 Hz                          | Estradas, rodovias, percursos longos |
+    | 10.0 m                          | 0.1 Hz                                      | 0.02 a 0.05 Hz                         | Mapas de longa distância, macro trajetos |
+
+    ---
+
+    ### Regras gerais:
+
+    - Frequência de Amostragem:
+    ```python
+    fs = 1 / deltaD
+
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    if use_z:
+        z = np.asarray(z)
+
+    if fs is None:
+        fs = frequencia_amostragem(x, y, z, use_z)
+
+    sos = projetar_butterworth(int(butter_order), float(butter_cutoff), float(fs))
+    if tamanho_bloco is not None and sobreposicao is None:
+        sobreposicao = int(np.ceil(20 * fs / butter_cutoff))
+    colunas = np.column_stack((x, y, z) if use_z else (x, y))
+    filtrado = filtrar_zero_fase(colunas, sos, tamanho_bloco, sobreposicao)
+
+    x_f, y_f = filtrado[:, 0], filtrado[:, 1]
+    z_f = filtrado[:, 2] if use_z else np.zeros_like(x_f)
+
+    return x_f, y_f, z_f
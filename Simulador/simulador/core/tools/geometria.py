@@ -0,0 +1,353 @@
+import numpy as np
+
+def _ajustar_janela(coords, dist, method, s):
+    # Ajuste local sobre a distância acumulada (em metros) dos pontos da janela
+    from scipy.interpolate import interp1d, splprep, splev
+
+    if method in ['quadratic', 'cubic']:
+        return interp1d(dist, np.column_stack(coords), kind=method, axis=0)
+    tck, _ = splprep(coords, u=dist, s=s)
+    return lambda alvo: np.column_stack(splev(alvo, tck))
+
+
+def _reamostrar_em_janelas(coords, distance, alvo, method, s, janela, sobreposicao):
+    """
+    Reamostra as coordenadas nas distâncias `alvo` com um ajuste por janela.
+
+    A rota é dividida em blocos de `janela` metros de comprimento. Cada
+    bloco é ajustado com os pontos de entrada a até `sobreposicao` metros
+    das suas bordas e avaliado nas amostras a até sobreposicao / 2 delas;
+    na faixa de sobreposicao metros em torno de cada emenda os dois ajustes
+    vizinhos são misturados com pesos lineares que somam 1.
+    """
+    n_entrada = len(distance)
+    total = distance[-1]
+    meia = sobreposicao / 2
+    saida = np.zeros((len(alvo), len(coords)))
+
+    for inicio in np.arange(0, total, janela):
+        fim = inicio + janela
+        # Pontos de entrada do ajuste (com folga para as condições de contorno)
+        a = max(np.searchsorted(distance, inicio - sobreposicao, side='right') - 4, 0)
+        b = min(np.searchsorted(distance, fim + sobreposicao, side='left') + 4, n_entrada)
+        # Amostras avaliadas por este bloco
+        ia = np.searchsorted(alvo, inicio - meia, side='left') if inicio > 0 else 0
+        ib = np.searchsorted(alvo, fim + meia, side='right') if fim < total else len(alvo)
+        if ib <= ia:
+            continue
+
+        ajuste = _ajustar_janela([c[a:b] for c in coords], distance[a:b], method, s)
+        trecho = alvo[ia:ib]
+        peso = np.ones(len(trecho))
+        if inicio > 0:
+            peso = np.minimum(peso, np.clip((trecho - (inicio - meia)) / sobreposicao, 0, 1))
+        if fim < total:
+            peso = np.minimum(peso, np.clip(((fim + meia) - trecho) / sobreposicao, 0, 1))
+        saida[ia:ib] += peso[:, None] * ajuste(trecho)
+
+    return saida
+
+
+def _interpolar_em_janelas(x, y, z, deltaD, use_z, method, s, janela, sobreposicao):
+    # Modo em janelas de interpolar_trajetoria, na mesma malha do ajuste único
+    if method not in ['quadratic', 'cubic', 'splineS']:
+        raise ValueError("method must be 'quadratic', 'cubic' or 'splineS'")
+
+    # Distância acumulada em metros, sem montar a matriz de pontos
+    distance = np.concatenate(([0.0], np.cumsum(distanceXYZ(x, y, z, use_z))))
+    total_dist = distance[-1]
+    num_points = int(total_dist / deltaD) + 1
+    if sobreposicao is None:
+        sobreposicao = max(0.1 * janela, 20 * deltaD)
+
+    coords = [x, y, z] if use_z else [x, y]
+    return _reamostrar_em_janelas(coords, distance, np.linspace(0, total_dist, num_points),
+                                  method, s, janela, sobreposicao)
+
+
+def interpolar_trajetoria(x, y, z, deltaD, use_z=False, method='quadratic', butter_params=None, s=20, auto_fs=True,
+                          janela=None, sobreposicao=None, adaptativo=None):
+    """
+    Interpola pontos ao longo de uma trajetória.
+
+    Args:
+        x, y, z (array-like): Coordenadas da trajetória.
+        deltaD (float): Distância desejada entre os novos pontos (m).
+        use_z (bool): Considerar ou não a coordenada z na interpolação.
+        method (str): 'quadratic', 'cubic' ou 'splineS'.
+        butter_params (dict, optional): Parâmetros do filtro Butterworth:
+            {'cutoff': frequência de corte, 'order': ordem do filtro, 'fs': freq. de amostragem (opcional)}
+        s (float): Parâmetro de suavização da splineS (default = 20)
+        auto_fs (bool): Se True, calcula automaticamente fs como 1/deltaD. Se False, espera butter_params['fs']
+        janela (float, optional): Comprimento [m] de cada bloco do modo em
+            janelas, para rotas longas: cada bloco é ajustado só com os pontos
+            próximos e as emendas são misturadas, com memória proporcional ao
+            bloco e não à rota. None faz um único ajuste sobre a rota inteira.
+            As amostras ficam na mesma malha uniforme nos dois modos; na
+            splineS, s vale para cada bloco.
+        sobreposicao (float, optional): Largura [m] da mistura nas emendas
+            (padrão: 10% da janela, no mínimo 20 * deltaD).
+        adaptativo (dict, optional): Reamostragem com espaçamento variável,
+            aplicada depois da interpolação e do filtro, com os argumentos de
+            reamostrar_adaptativo, ex.: {'tolerancia': 0.005, 'passo_max': 50}.
+            deltaD passa a ser o passo mínimo, usado nas curvas.
+
+    Returns:
+        tuple: x_interp, y_interp, z_interp (arrays interpolados)
+    """
+
+    # scipy.interpolate é carregado só aqui: a simulação não depende dele
+    from scipy.interpolate import interp1d, splprep, splev
+
+    x, y, z = np.asarray(x), np.asarray(y), np.asarray(z)
+
+    if janela is not None:
+        interp_points = _interpolar_em_janelas(x, y, z, deltaD, use_z, method, s, janela, sobreposicao)
+
+    else:
+        # Cria pontos 2D ou 3D conforme configuração
+        points = np.column_stack((x, y, z)) if use_z else np.column_stack((x, y))
+
+        # Distância incremental e total
+        segment_dist = np.sqrt(np.sum(np.diff(points, axis=0) ** 2, axis=1))
+        total_dist = np.sum(segment_dist)
+
+        # Distância acumulada normalizada
+        distance = np.insert(np.cumsum(segment_dist), 0, 0)
+        distance /= distance[-1]
+
+        num_points = int(total_dist / deltaD) + 1
+        alpha = np.linspace(0, 1, num_points)
+
+        # Interpolação
+        if method in ['quadratic', 'cubic']:
+            interpolator = interp1d(distance, points, kind=method, axis=0)
+            interp_points = interpolator(alpha)
+
+        elif method == 'splineS':
+            tck, _ = splprep([x, y, z] if use_z else [x, y], s=s)
+            res = splev(np.linspace(0, 1, num_points), tck)
+            x_s, y_s = res[0], res[1]
+            z_s = res[2] if use_z else np.zeros_like(x_s)
+            interp_points = np.column_stack((x_s, y_s, z_s))
+
+        else:
+            raise ValueError("method must be 'quadratic', 'cubic' or 'splineS'")
+
+    if not use_z:
+        z_col = np.zeros((interp_points.shape[0], 1))
+        interp_points = np.hstack((interp_points[:, :2], z_col))
+
+    x_interp, y_interp, z_interp = interp_points.T
+
+    # Aplica filtro Butterworth após interpolar
+    if butter_params:
+        from simulador.core.tools.filtros import aplicar_butterworth
+
+        if auto_fs:
+            fs = 1 / deltaD
+        else:
+            if 'fs' not in butter_params:
+                raise ValueError("Frequência de amostragem 'fs' deve ser fornecida em butter_params se auto_fs=False")
+            fs = butter_params['fs']
+
+        x_interp, y_interp, z_interp = aplicar_butterworth(x_interp, y_interp, z_interp, use_z,
+                                                            fs=fs,
+                                                            butter_cutoff=butter_params['cutoff'],
+                                                            butter_order=butter_params['order'])
+
+    if adaptativo is not None:
+        x_interp, y_interp, z_interp = reamostrar_adaptativo(x_interp, y_interp, z_interp,
+                                                             use_z=use_z, **adaptativo)
+
+    return x_interp, y_interp, z_interp
+
+
+def distanceXYZ(x, y, z=None, use_z=False):
+    """
+    Calcula distância entre pontos consecutivos.
+    Se use_z=True, inclui a componente de altitude (z).
+
+    Returns:
+        np.ndarray: vetor com len(x) - 1 distâncias.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    d2 = np.diff(x) ** 2 + np.diff(y) ** 2
+    if use_z and z is not None:
+        d2 += np.diff(np.asarray(z, dtype=float)) ** 2
+    return np.sqrt(d2)
+
+def radiusXYZ(x, y, z=None):
+    """
+    Calcula o raio de curvatura baseado em três pontos consecutivos.
+
+    Usa a fórmula de Heron para a área do triângulo; trincas degeneradas
+    (colineares ou repetidas, área² <= 0) recebem raio 1e10.
+
+    Returns:
+        np.ndarray: vetor com len(x) - 2 raios.
+    """
+    pts = [np.asarray(x, dtype=float), np.asarray(y, dtype=float)]
+    if z is not None:
+        pts.append(np.asarray(z, dtype=float))
+    pts = np.stack(pts)
+
+    a = np.sqrt(np.sum((pts[:, 1:-1] - pts[:, :-2]) ** 2, axis=0))
+    b = np.sqrt(np.sum((pts[:, 2:] - pts[:, 1:-1]) ** 2, axis=0))
+    c = np.sqrt(np.sum((pts[:, 2:] - pts[:, :-2]) ** 2, axis=0))
+
+    p = (a + b + c) / 2
+    A2 = p * (p - a) * (p - b) * (p - c)
+
+    R = np.full(A2.shape, 1e10)
+    valido = A2 > 0
+    R[valido] = a[valido] * b[valido] * c[valido] / (4 * np.sqrt(A2[valido]))
+    return R
+
+#Inclinacao da pista:
+def grading(altitude,distanceseg):
+    """
+    Calcula o ângulo de inclinação de cada segmento a partir de i = 1.
+
+    O ângulo é limitado em ±0.2 rad, exceto no último elemento, que
+    permanece sem limitação como no laço original.
+
+    Returns:
+        np.ndarray: vetor com len(distanceseg) - 1 ângulos (rad).
+    """
+    altitude = np.asarray(altitude, dtype=float)
+    distanceseg = np.asarray(distanceseg, dtype=float)
+    angle = np.arcsin(np.diff(altitude[1:len(distanceseg) + 1]) / distanceseg[1:])
+    angle[:-1] = np.clip(angle[:-1], -0.2, 0.2) # limitando a inclinacao em 0.2 rad
+    return angle
+
+#Identificacao da direcao da curva (-1 para esquerda, 1 para direita):
+def curva(x,y):
+    """
+    Retorna o sentido da curva em cada trinca de pontos consecutivos.
+
+    Equivale ao sinal de det([[y0, x0, 1], [y1, x1, 1], [y2, x2, 1]]),
+    calculado diretamente pela fórmula do produto vetorial.
+
+    Returns:
+        np.ndarray: vetor com len(x) - 2 valores em {-1, 0, 1}.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    det = (y[1:-1] - y[:-2]) * (x[2:] - x[:-2]) - (y[2:] - y[:-2]) * (x[1:-1] - x[:-2])
+    return np.sign(det).astype(int)
+
+
+def _media_movel(valores, n):
+    # Média móvel centrada de n pontos, com as bordas repetidas
+    if n <= 1 or len(valores) < n:
+        return valores
+    estendido = np.concatenate((np.full(n // 2, valores[0]), valores, np.full(n - 1 - n // 2, valores[-1])))
+    return np.convolve(estendido, np.ones(n) / n, mode='valid')
+
+
+def passo_adaptativo(x, y, z, tolerancia=0.005, passo_max=50.0, use_z=False, raio_reta=1000.0,
+                     crescimento=0.3, escala_aceleracao=1000.0):
+    """
+    Espaçamento local [m] para reamostrar a trajetória, limitado pela
+    tolerância relativa no perfil de velocidade.
+
+    Em cada ponto, o menor entre:
+        - 4 * sqrt(tolerancia * κ / |κ''|): a curvatura amostrada no ápice
+          difere da real de ~|κ''| h² / 8, e a velocidade limite de curva
+          (∝ κ^-1/2) erra no máximo `tolerancia` (relativo);
+        - sqrt(24 * tolerancia) / κ: a corda difere do arco de no máximo
+          `tolerancia` (relativo);
+        - tolerancia / |dθ/ds|, com use_z: a inclinação θ varia no máximo
+          `tolerancia` rad num segmento (erro de g·sinθ até tolerancia·g);
+        - 2 * tolerancia * escala_aceleracao: o solver aplica a aceleração
+          de cada segmento com erro de primeira ordem no passo, ~h·a / (2V²)
+          na velocidade; escala_aceleracao é um V² / a típico. Sem este
+          limite o passo nas retas não cai com a tolerância e o erro no
+          tempo de volta deixa de diminuir;
+        - passo_max.
+    κ é a curvatura em planta suavizada (κ'' calculada com sinal), nunca abaixo de 1 / raio_reta, de modo que
+    curvas mais abertas que raio_reta são tratadas como reta; no critério
+    da corda entra também a curvatura sem suavização. O espaçamento vai até
+    metade do espaçamento da própria trajetória (onde fica abaixo dele,
+    reamostrar_adaptativo mantém todos os pontos) e varia no máximo
+    `crescimento` metro por metro percorrido, para o passo crescer aos
+    poucos na saída das curvas e diminuir antes da entrada.
+
+    Args:
+        x, y, z (array-like): Trajetória fina e uniforme (ex.: saída de
+            interpolar_trajetoria sem `adaptativo`).
+        tolerancia (float): Erro relativo admitido por segmento.
+        passo_max (float): Espaçamento máximo [m].
+        use_z (bool): Considera a altitude na distância e na inclinação.
+        raio_reta (float): Raio [m] a partir do qual a curva conta como reta.
+        crescimento (float): Variação máxima do passo por metro.
+        escala_aceleracao (float): V² / a típico do veículo [m].
+
+    Returns:
+        tuple: (s, h) — distância acumulada [m] e espaçamento [m] em cada ponto.
+    """
+    x, y, z = np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(z, dtype=float)
+    D = distanceXYZ(x, y, z, use_z)
+    s = np.concatenate(([0.0], np.cumsum(D)))
+    passo_fino = float(np.median(D))
+    suavizacao = 5
+
+    # Curvatura em planta, com sinal, nos pontos internos, repetida nas
+    # pontas; com o sinal, κ'' não tem pico nas inflexões, onde |κ| passa
+    # por zero. A altimetria entra pelo critério de inclinação
+    kappa_bruta = curva(x, y) / radiusXYZ(x, y)
+    kappa_bruta = np.concatenate((kappa_bruta[:1], kappa_bruta, kappa_bruta[-1:]))
+    kappa = _media_movel(kappa_bruta, suavizacao)
+    d2kappa = np.abs(np.gradient(np.gradient(kappa, s), s))
+    kappa = np.maximum(np.abs(kappa), 1 / raio_reta)
+    # A corda pula os pontos internos do segmento: o critério da corda usa a
+    # curvatura sem suavização, para quinas curtas não encurtarem a pista
+    kappa_corda = np.maximum(kappa, np.abs(kappa_bruta))
+
+    with np.errstate(divide='ignore'):
+        h = np.minimum(4 * np.sqrt(tolerancia * kappa / d2kappa), np.sqrt(24 * tolerancia) / kappa_corda)
+        h = np.minimum(h, 2 * tolerancia * escala_aceleracao)
+        if use_z:
+            theta = np.arcsin(np.clip(np.diff(z) / np.where(D > 0, D, 1.0), -1, 1))
+            theta = _media_movel(np.concatenate((theta, theta[-1:])), suavizacao)
+            h = np.minimum(h, tolerancia / np.abs(np.gradient(theta, s)))
+    h[np.isnan(h)] = passo_fino  # pontos repetidos (ds = 0)
+    h = np.clip(h, passo_fino / 2, passo_max)
+
+    # Passo com variação limitada: h[i] <= h[j] + crescimento * |s[i] - s[j]|
+    h = np.minimum.accumulate(h - crescimento * s) + crescimento * s
+    h = (np.minimum.accumulate((h + crescimento * s)[::-1]) - crescimento * s[::-1])[::-1]
+    return s, h
+
+
+def reamostrar_adaptativo(x, y, z, tolerancia=0.005, passo_max=50.0, use_z=False, raio_reta=1000.0,
+                          crescimento=0.3, escala_aceleracao=1000.0):
+    """
+    Reamostra a trajetória com espaçamento variável: fino nas curvas e nas
+    mudanças de inclinação, largo nas retas (ver passo_adaptativo).
+
+    Os novos pontos são um subconjunto dos pontos de entrada, escolhidos
+    para que o nº de pontos entre s = 0 e s acompanhe ∫ ds / h(s); assim o
+    espaçamento entre eles segue h e os pontos continuam sobre a curva
+    ajustada. A entrada deve ser fina e uniforme (o filtro de Butterworth
+    supõe amostragem uniforme e deve ser aplicado antes).
+
+    Solver e pós-processamento usam D e R de cada segmento e o tempo
+    2D / (V[i] + V[i + 1]), válidos com espaçamento variável.
+
+    Returns:
+        tuple: x, y, z (np.ndarray) com o primeiro e o último ponto da entrada.
+    """
+    x, y, z = np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(z, dtype=float)
+    if len(x) < 4:
+        return x, y, z
+
+    s, h = passo_adaptativo(x, y, z, tolerancia, passo_max, use_z, raio_reta, crescimento,
+                            escala_aceleracao)
+
+    # Nº acumulado de segmentos: integral de ds / h pela regra do trapézio
+    contagem = np.concatenate(([0.0], np.cumsum(np.diff(s) * 0.5 * (1 / h[:-1] + 1 / h[1:]))))
+    n_segmentos = max(int(np.ceil(contagem[-1])), 2)
+    alvo = np.linspace(0, contagem[-1], n_segmentos + 1)
+    indices = np.unique(np.rint(np.interp(alvo, contagem, np.arange(len(x)))).astype(np.intp))
+    return x[indices], y[indices], z[indices]
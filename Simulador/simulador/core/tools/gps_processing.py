@@ -0,0 +1,102 @@
+import functools
+import numpy as np
+from pyproj import Geod, Transformer
+
+# Pontos convertidos por bloco em latlon_to_xy
+TAMANHO_BLOCO = 1_000_000
+
+_GEOD_WGS84 = Geod(ellps='WGS84')
+
+
+def calcular_utm_epsg(lat, lon):
+    """
+    Calcula o código EPSG UTM automaticamente baseado na latitude e longitude.
+
+    Args:
+        lat (float): Latitude.
+        lon (float): Longitude.
+
+    Returns:
+        str: Código EPSG adequado para a zona UTM.
+    """
+    zona = int((lon + 180) / 6) + 1
+    hemisferio = 326 if lat >= 0 else 327
+    epsg_code = f"EPSG:{hemisferio}{zona:02d}"
+    return epsg_code
+
+
+@functools.lru_cache(maxsize=None)
+def transformador_utm(utm_epsg):
+    """
+    Transformer WGS84 -> utm_epsg, criado uma única vez por código EPSG.
+    """
+    return Transformer.from_crs("EPSG:4326", utm_epsg, always_xy=True)
+
+
+def _offsets_geodesicos(lat, lon, lat_ref, lon_ref):
+    # Distâncias geodésicas (WGS84) do ponto de referência ao longo do paralelo
+    # e do meridiano de referência, com o sinal da direção, em uma chamada
+    ref_lat = np.full(lat.shape, lat_ref)
+    ref_lon = np.full(lon.shape, lon_ref)
+    _, _, dx = _GEOD_WGS84.inv(ref_lon, ref_lat, lon, ref_lat)
+    _, _, dy = _GEOD_WGS84.inv(ref_lon, ref_lat, ref_lon, lat)
+    return np.copysign(dx, lon - lon_ref), np.copysign(dy, lat - lat_ref)
+
+
+def latlon_to_xy(lat, lon, method='haversine', utm_epsg=None, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Converte latitude e longitude para coordenadas em metros.
+
+    A conversão é feita em blocos de tamanho_bloco pontos, escritos direto
+    nos arrays de saída, para limitar a memória temporária em logs longos.
+
+    Args:
+        lat (array-like): Vetor de latitudes.
+        lon (array-like): Vetor de longitudes.
+        method (str): Método de conversão. Opções:
+                      'haversine', 'geodesica', 'utm'
+                      ('geopy' é aceito como sinônimo de 'geodesica')
+        utm_epsg (str, optional): Código EPSG UTM. Se None e method='utm', calcula automaticamente.
+        tamanho_bloco (int): Pontos convertidos por vez.
+
+    Returns:
+        tuple: (x, y) em metros
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    if method == 'geopy':
+        method = 'geodesica'
+
+    if method == 'haversine':
+        R = 6378137
+        lat0, lon0 = np.radians(lat[0]), np.radians(lon[0])
+        escala_x = R * np.cos(lat0)
+
+        def converter(la, lo):
+            return (np.radians(lo) - lon0) * escala_x, (np.radians(la) - lat0) * R
+
+    elif method == 'geodesica':
+        # Deslocamentos geodésicos em x (paralelo) e y (meridiano) a partir do primeiro ponto
+        lat_ref, lon_ref = lat[0], lon[0]
+
+        def converter(la, lo):
+            return _offsets_geodesicos(la, lo, lat_ref, lon_ref)
+
+    elif method == 'utm':
+        if utm_epsg is None:
+            utm_epsg = calcular_utm_epsg(lat[0], lon[0])
+        transformer = transformador_utm(utm_epsg)
+
+        def converter(la, lo):
+            return transformer.transform(lo, la)
+
+    else:
+        raise ValueError("method deve ser 'haversine', 'geodesica' ou 'utm'")
+
+    x = np.empty(lat.shape)
+    y = np.empty(lat.shape)
+    for inicio in range(0, len(lat), tamanho_bloco):
+        bloco = slice(inicio, inicio + tamanho_bloco)
+        x[bloco], y[bloco] = converter(lat[bloco], lon[bloco])
+
+    return x, y
@@ -0,0 +1,257 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.figure import Figure
+
+# Baldes da decimação min/max (~ largura do gráfico em pixels)
+LARGURA_PIXELS = 2000
+# Células por eixo da grade de decimar_dispersao: com figuras de 8 pol. a
+# 150 dpi, cada célula tem ~2 px, menos que o marcador (s=10, ~6 px)
+CELULAS_DISPERSAO = 500
+# Acima deste nº de pontos (após decimar_dispersao), as dispersões são rasterizadas
+LIMIAR_RASTER = 20_000
+
+
+def decimar_minmax(x, y, baldes=LARGURA_PIXELS):
+    """
+    Decimação que preserva a forma de uma curva: divide os pontos em
+    `baldes` grupos consecutivos e mantém, de cada um, o mínimo e o máximo
+    de y (na ordem em que aparecem), além do primeiro e do último ponto.
+
+    Returns:
+        tuple: (x, y) decimados, com no máximo 2 * baldes + 2 pontos.
+    """
+    x, y = np.asarray(x), np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= 2 * baldes + 2:
+        return x, y
+
+    tamanho = -(-n // baldes)
+    cheio = np.full(tamanho * baldes, np.nan)
+    cheio[:n] = y
+    grupos = cheio.reshape(baldes, tamanho)
+    validos = ~np.isnan(grupos).all(axis=1)
+    base = np.arange(baldes)[validos] * tamanho
+    i_min = base + np.nanargmin(grupos[validos], axis=1)
+    i_max = base + np.nanargmax(grupos[validos], axis=1)
+
+    indices = np.unique(np.concatenate(([0, n - 1], i_min, i_max)))
+    return x[indices], y[indices]
+
+
+def decimar_dispersao(x, y, pixels=CELULAS_DISPERSAO):
+    """
+    Índices de um ponto por célula de uma grade pixels x pixels sobre a
+    extensão de (x, y): pontos que cairiam no mesmo pixel são descartados,
+    exceto o primeiro.
+
+    Returns:
+        np.ndarray: Índices mantidos, em ordem crescente.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    validos = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if len(validos) <= pixels:
+        return validos
+
+    celulas = []
+    for c in (x[validos], y[validos]):
+        extensao = c.max() - c.min()
+        escala = (pixels - 1) / extensao if extensao > 0 else 0.0
+        celulas.append(((c - c.min()) * escala).astype(np.int64))
+    _, primeiros = np.unique(celulas[0] * pixels + celulas[1], return_index=True)
+    return validos[np.sort(primeiros)]
+
+
+def _nova_figura(figsize, arquivo):
+    # Com arquivo, a figura não passa pelo pyplot (não precisa de tela); o
+    # pyplot, que escolhe o backend gráfico ao ser importado, só entra no
+    # modo interativo
+    if arquivo:
+        fig = Figure(figsize=figsize)
+        return fig, fig.add_subplot()
+    import matplotlib.pyplot as plt
+    fig = plt.figure(figsize=figsize)
+    return fig, fig.add_subplot()
+
+
+def _finalizar(fig, arquivo, dpi=150):
+    if arquivo:
+        fig.savefig(arquivo, dpi=dpi)
+    else:
+        import matplotlib.pyplot as plt
+        plt.show()
+
+
+def plot_speed_vs_distance(df, distance_range=None, downsampling=None, arquivo=None,
+                           pixels=LARGURA_PIXELS):
+    df_plot = aplicar_slicing(df, distance_range, downsampling)
+
+    fig, ax = _nova_figura((10, 5), arquivo)
+    ax.plot(*decimar_minmax(df_plot['Distance'] / 1000, df_plot['Speed'] * 3.6, pixels), 'r')
+    ax.set_xlabel('Distância (km)')
+    ax.set_ylabel('Velocidade (km/h)')
+    ax.set_title('Velocidade vs Distância')
+    ax.grid()
+    _finalizar(fig, arquivo)
+
+
+def plot_accelerations(df, distance_range=None, downsampling=None, arquivo=None,
+                       pixels=LARGURA_PIXELS):
+    df_plot = aplicar_slicing(df, distance_range, downsampling)
+
+    fig, ax = _nova_figura((10, 5), arquivo)
+    km = df_plot['Distance'] / 1000
+    ax.plot(*decimar_minmax(km, df_plot['Ay'], pixels), 'b:', label='Ay (m/s²)')
+    ax.plot(*decimar_minmax(km, df_plot['Ax'], pixels), 'g--', label='Ax (m/s²)')
+    ax.set_xlabel('Distância (km)')
+    ax.set_ylabel('Aceleração (m/s²)')
+    ax.set_title('Acelerações vs Distância')
+    ax.legend()
+    ax.grid()
+    _finalizar(fig, arquivo)
+
+
+def plot_trajectory_colored_by_speed(df, x, y, distance_range=None, downsampling=None, arquivo=None,
+                                     pixels=CELULAS_DISPERSAO):
+    df_plot = aplicar_slicing(df, distance_range, downsampling)
+
+    # Linha i do DataFrame corresponde ao ponto i da trajetória
+    indices = df_plot.index.to_numpy()
+    x_plot = np.asarray(x)[indices]
+    y_plot = np.asarray(y)[indices]
+    speed = 3.6 * df_plot['Speed'].to_numpy()
+    mantidos = decimar_dispersao(x_plot, y_plot, pixels)
+
+    fig, ax = _nova_figura((8, 8), arquivo)
+    sc = ax.scatter(x_plot[mantidos], y_plot[mantidos], c=speed[mantidos], cmap='jet', s=10,
+                    vmin=np.nanmin(speed), vmax=np.nanmax(speed),
+                    rasterized=len(mantidos) > LIMIAR_RASTER)
+    cbar = fig.colorbar(sc, ax=ax, orientation='horizontal')
+    cbar.set_label('Velocidade (km/h)')
+    ax.axis('off')
+    ax.set_title('Velocidade no Trajeto')
+    _finalizar(fig, arquivo)
+
+
+def plot_speed_histogram(df, distance_range=None, downsampling=None, arquivo=None):
+    df_plot = aplicar_slicing(df, distance_range, downsampling)
+
+    fig, ax = _nova_figura((8, 5), arquivo)
+    ax.hist(3.6 * df_plot['Speed'].dropna(), bins=30, color='skyblue', edgecolor='black')
+    ax.set_xlabel('Velocidade (km/h)')
+    ax.set_ylabel('Frequência')
+    ax.set_title('Histograma de Velocidade')
+    ax.grid()
+    _finalizar(fig, arquivo)
+
+
+def plot_ax_vs_ay(df, distance_range=None, downsampling=None, arquivo=None, pixels=CELULAS_DISPERSAO):
+    df_plot = aplicar_slicing(df, distance_range, downsampling)
+
+    ax_, ay_ = df_plot['Ax'].to_numpy(), df_plot['Ay'].to_numpy()
+    speed = 3.6 * df_plot['Speed'].to_numpy()
+    mantidos = decimar_dispersao(ax_, ay_, pixels)
+
+    fig, ax = _nova_figura((8, 8), arquivo)
+    sc = ax.scatter(ax_[mantidos], ay_[mantidos], c=speed[mantidos], cmap='jet', s=10,
+                    vmin=np.nanmin(speed), vmax=np.nanmax(speed),
+                    rasterized=len(mantidos) > LIMIAR_RASTER)
+    ax.set_xlabel('Ax (m/s²)')
+    ax.set_ylabel('Ay (m/s²)')
+    ax.set_title('Ax vs Ay')
+    fig.colorbar(sc, ax=ax, label='Velocidade (km/h)')
+    ax.grid()
+    _finalizar(fig, arquivo)
+
+
+# Nome do arquivo de cada gráfico de graph e colunas do DataFrame que ele usa
+GRAFICOS = {
+    'velocidade': (plot_speed_vs_distance, ['Distance', 'Speed']),
+    'aceleracoes': (plot_accelerations, ['Distance', 'Ax', 'Ay']),
+    'trajeto': (plot_trajectory_colored_by_speed, ['Distance', 'Speed']),
+    'histograma': (plot_speed_histogram, ['Distance', 'Speed']),
+    'ax_ay': (plot_ax_vs_ay, ['Distance', 'Speed', 'Ax', 'Ay']),
+}
+
+
+def _renderizar(funcao, args, kwargs):
+    funcao(*args, **kwargs)
+    return kwargs['arquivo']
+
+
+def graph(df, x, y, distance_range=None, downsampling=None, pasta=None, formato='png',
+          processos=None):
+    """
+    Gera todos os gráficos principais da simulação.
+    
+    Parameters:
+    - df: DataFrame da simulação
+    - x, y: coordenadas do trajeto
+    - distance_range: tupla (min_km, max_km) para slicing opcional
+    - downsampling: inteiro para reduzir número de pontos (ex.: 10 plota 1 a cada 10)
+    - pasta: se informada, modo sem tela: cada gráfico é salvo em
+      pasta/<nome>.<formato> (nomes em GRAFICOS) em vez de aberto na tela
+    - formato: extensão dos arquivos ('png', 'pdf', 'svg', ...)
+    - processos: processos que desenham os gráficos em paralelo no modo
+      sem tela (padrão: um por gráfico, até os.cpu_count(); 1 = em série)
+
+    Returns:
+    - list: caminhos dos arquivos gerados (vazia no modo interativo)
+    """
+    if df.empty:
+        print('⚠️ DataFrame está vazio. Nenhum gráfico gerado.')
+        return []
+
+    print('Gerando gráficos...')
+    if pasta is None:
+        plot_speed_vs_distance(df, distance_range, downsampling)
+        plot_accelerations(df, distance_range, downsampling)
+        plot_trajectory_colored_by_speed(df, x, y, distance_range, downsampling)
+        plot_speed_histogram(df, distance_range, downsampling)
+        plot_ax_vs_ay(df, distance_range, downsampling)
+        print('✅ Gráficos gerados.')
+        return []
+
+    os.makedirs(pasta, exist_ok=True)
+    tarefas = []
+    for nome, (funcao, colunas) in GRAFICOS.items():
+        # Cada processo recebe só as colunas do seu gráfico
+        args = (df[colunas], x, y) if funcao is plot_trajectory_colored_by_speed else (df[colunas],)
+        kwargs = {'distance_range': distance_range, 'downsampling': downsampling,
+                  'arquivo': os.path.join(pasta, f'{nome}.{formato}')}
+        tarefas.append((funcao, args, kwargs))
+
+    processos = processos or min(len(tarefas), os.cpu_count() or 1)
+    if processos == 1:
+        arquivos = [_renderizar(*tarefa) for tarefa in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            arquivos = list(executor.map(_renderizar, *zip(*tarefas)))
+
+    print(f'✅ Gráficos salvos em {pasta}.')
+    return arquivos
+
+
+def aplicar_slicing(df, distance_range=None, downsampling=None):
+    """
+    Função auxiliar para aplicar filtros de distância e downsampling.
+
+    Parameters:
+    - distance_range: tupla (min_km, max_km) ou None
+    - downsampling: inteiro ou None
+
+    Returns:
+    - df_plot: DataFrame filtrado
+    """
+    df_plot = df.dropna(subset=["Distance"]).copy()
+
+    if distance_range:
+        min_km, max_km = distance_range
+        df_plot = df_plot[(df_plot['Distance'] / 1000 >= min_km) &
+                           (df_plot['Distance'] / 1000 <= max_km)]
+
+    if downsampling:
+        df_plot = df_plot.iloc[::downsampling]
+
+    return df_plot
@@ -0,0 +1,111 @@
+import math
+import numpy as np
+
+#Criacao das curvas de potncia em funcao da marcha e da velocidade:
+def powercurve(Ps, ns, relacaoFinal, relacoesMarcha, rw, passo_v=0.01, amostras_troca=1000):
+    """
+    Monta a curva de potência disponível na roda em função da velocidade.
+
+    As velocidades de troca são os cruzamentos das curvas potência x velocidade
+    de marchas consecutivas, achados por busca vetorizada de mudança de sinal
+    em uma malha comum; sem cruzamento, usa o ponto médio entre o fim da marcha
+    i e o início da marcha i + 1.
+
+    Args:
+        Ps, ns (array-like): Potência [W] e rotação [rpm] do motor.
+        relacaoFinal (float): Relação do diferencial.
+        relacoesMarcha (array-like): Relações de marcha.
+        rw (float): Raio da roda [m].
+        passo_v (float): Espaçamento da malha uniforme de velocidade [m/s].
+        amostras_troca (int): Pontos da malha usada na busca de cada troca.
+
+    Returns:
+        tuple: (Plist, Vlist, Vs)
+            Plist (np.ndarray): Potência [W] em cada ponto da malha.
+            Vlist (np.ndarray): Malha uniforme de velocidade [m/s].
+            Vs (list): Velocidade mínima da 1ª marcha, velocidades de troca e
+            velocidade máxima da última marcha.
+    """
+
+    from scipy.interpolate import interp1d
+
+    Ps = np.asarray(Ps)
+    ns = np.asarray(ns)
+    relacoesMarcha = np.asarray(relacoesMarcha)
+
+    # Cria função potência em função do RPM
+    P = interp1d(ns, Ps, fill_value='extrapolate')
+
+    # Velocidade inicial e final de cada marcha
+    k_v = math.pi * rw / (30 * relacaoFinal)
+    Vini = ns[0] * k_v / relacoesMarcha
+    Vfim = ns[-1] * k_v / relacoesMarcha
+
+    Vs = [Vini[0]]
+
+    # Para cada troca de marcha
+    for i in range(len(relacoesMarcha) - 1):
+        # Malha comum no trecho em que as marchas i e i+1 se sobrepõem
+        v = np.linspace(Vini[i + 1], Vfim[i], amostras_troca)
+        dif = P(v / (k_v / relacoesMarcha[i])) - P(v / (k_v / relacoesMarcha[i + 1]))
+
+        cruzamentos = np.nonzero(np.sign(dif[:-1]) * np.sign(dif[1:]) <= 0)[0] if Vini[i + 1] < Vfim[i] else []
+
+        if len(cruzamentos) == 0:
+            Vtroca = (Vfim[i] + Vini[i + 1]) / 2  # Chute conservador
+        else:
+            j = cruzamentos[0]
+            if dif[j] == dif[j + 1]:
+                Vtroca = v[j]
+            else:
+                Vtroca = v[j] + (v[j + 1] - v[j]) * dif[j] / (dif[j] - dif[j + 1])
+
+        Vs.append(float(Vtroca))
+
+    # Última velocidade máxima da última marcha
+    Vs.append(Vfim[-1])
+
+    # Curva final em malha uniforme; em v == Vs[i + 1] ainda vale a marcha i
+    n_pontos = max(int(math.ceil((Vs[-1] - Vs[0]) / passo_v)) + 1, 2)
+    Vlist = np.linspace(Vs[0], Vs[-1], n_pontos)
+    marcha = np.searchsorted(np.asarray(Vs[1:-1]), Vlist, side='left')
+    Plist = P(Vlist * relacoesMarcha[marcha] / k_v)
+
+    return Plist, Vlist, Vs
+
+
+class TabelaPotencia:
+    """
+    Consulta O(1) da curva de powercurve: índice na malha uniforme e
+    interpolação linear entre os dois pontos vizinhos, com extrapolação
+    linear fora da malha (como interp1d(..., fill_value='extrapolate')).
+
+    Aceita escalares (retorna float) e arrays (retorna np.ndarray).
+    """
+
+    __slots__ = ("v0", "dv", "n", "P", "_P_lista")
+
+    def __init__(self, pcurve):
+        V = np.asarray(pcurve[1], dtype=float)
+        self.P = np.asarray(pcurve[0], dtype=float)
+        self.v0 = float(V[0])
+        self.dv = float(V[1] - V[0])
+        self.n = len(V)
+        self._P_lista = self.P.tolist()
+
+    def __call__(self, v):
+        """Potência [W] na velocidade v [m/s]."""
+        if isinstance(v, (float, int)):
+            pos = (v - self.v0) / self.dv
+            i = min(max(math.floor(pos), 0), self.n - 2)
+            P = self._P_lista
+            return P[i] + (pos - i) * (P[i + 1] - P[i])
+
+        pos = (np.asarray(v, dtype=float) - self.v0) / self.dv
+        # NaN em v vira índice 0 e devolve NaN (pos - i continua NaN)
+        i = np.clip(np.nan_to_num(np.floor(pos)), 0, self.n - 2).astype(np.intp)
+        return self.P[i] + (pos - i) * (self.P[i + 1] - self.P[i])
+
+    def forca(self, v):
+        """Força trativa [N] na velocidade v [m/s]."""
+        return self(v) / v
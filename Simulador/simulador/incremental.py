@@ -0,0 +1,214 @@
+import numpy as np
+
+from simulador.core.preprocessamento import (preprocessar_geometria, preprocessar_condicoes_iniciais,
+                                   coeficientes_aderencia, inclinacao_efetiva)
+from simulador.core.posprocessamento import construir_dataframe_simulacao, adicionar_dados_de_marcha
+from simulador.core.solver.dois_passos import (LIMITES, passes_dois_passos, envelope_limites,
+                                     velocidade_limite_curva)
+from simulador.core.solver import numba_disponivel
+
+# Pontos presos ao limite de curva (aderência lateral ou Vmax): V = Vcap
+_ANCORAS = (LIMITES.index("Aderência lateral"), LIMITES.index("Velocidade máxima"))
+
+
+def _substituir(a, inicio, fim, novo):
+    # a[inicio:fim] trocado por `novo`, que pode ter outro tamanho
+    return np.concatenate((a[:inicio], novo, a[fim:]))
+
+
+class SimulacaoIncremental:
+    """
+    Simulação com o solver 'dois_passos' que pode ser refeita localmente
+    depois de editar trechos da trajetória.
+
+    A geometria, os coeficientes por segmento e o perfil de velocidade da
+    última execução ficam guardados. Em editar, a geometria é recalculada só
+    nos pontos alterados mais um estêncil de dois pontos de cada lado, e o
+    perfil é resolvido apenas entre as âncoras mais próximas da edição:
+    pontos em que V = Vcap (aderência lateral ou Vmax) na solução anterior.
+    Numa âncora os passes para frente e para trás valem exatamente Vcap, o
+    que desacopla os dois lados. Se, depois da edição, o passe para frente
+    não alcançar Vcap na âncora final (ou o passe para trás na inicial), a
+    janela é estendida até a âncora seguinte e resolvida de novo.
+
+    O resultado é idêntico ao de loop(..., solver='dois_passos') sobre a
+    trajetória completa editada.
+
+    Args:
+        x, y, z (array-like): Trajetória inicial.
+        use_z (bool): Usa a inclinação.
+        backend (str): 'python' ou 'numba' (passes de resolver_dois_passos).
+        canais_potencia (bool): Repassado a adicionar_dados_de_marcha.
+        **parametros: Argumentos de veículo de loop (fx, fy, P, m, Cl, Cd,
+            Af, Crr, ld, lt, h, Tracao, Vo, Frenagem, Vmax, mu, nu e, com
+            marcha=True, Ps, ns, finaldrive, gearslist, rw).
+
+    Atributos:
+        df (pd.DataFrame): Resultado atual, no formato de loop.
+        janela (tuple): (a1, a2), pontos de V resolvidos na última edição.
+    """
+
+    def __init__(self, x, y, z, use_z=False, backend='python', canais_potencia=False,
+                 **parametros):
+        if backend == 'numba' and not numba_disponivel():
+            print('⚠️ Numba não está instalado. Usando backend python.')
+            backend = 'python'
+        self.use_z = use_z
+        self.backend = backend
+        self.canais_potencia = canais_potencia
+
+        self.x = np.array(x, dtype=float)
+        self.y = np.array(y, dtype=float)
+        self.z = np.array(z, dtype=float)
+        self.geometria = preprocessar_geometria(self.x, self.y, self.z, use_z)
+
+        self.parametros = {}
+        self.alterar_parametros(**parametros)
+
+    def alterar_parametros(self, **novos):
+        """
+        Troca parâmetros do veículo e resolve a volta inteira, reaproveitando
+        a geometria (que não depende do veículo).
+
+        Returns:
+            pd.DataFrame: Novo resultado.
+        """
+        self.parametros.update(novos)
+        p = {'marcha': False, 'Ps': 0, 'ns': 0, 'finaldrive': 0, 'gearslist': 0, 'rw': 0,
+             **self.parametros}
+        self._p = p
+
+        dados = preprocessar_condicoes_iniciais(
+            P=p['P'], Ps=p['Ps'], marcha=p['marcha'], ns=p['ns'],
+            finaldrive=p['finaldrive'], gearslist=p['gearslist'], rw=p['rw'],
+            x=self.x, y=self.y, z=self.z, Vo=p['Vo'], Vmax=p['Vmax'], m=p['m'],
+            Cl=p['Cl'], Cd=p['Cd'], Af=p['Af'], Crr=p['Crr'],
+            use_z=self.use_z, geometria=self.geometria
+        )
+        self._dados = dados
+        self._Axmin = p['Frenagem'] * dados["g"] * p['fx']
+
+        self.slope = np.asarray(dados["slope"], dtype=float)
+        self.Ax0, self._cAx, self.Ay0, self._cAy = self._coeficientes(self.geometria["angle"])
+
+        Vf, Vb, self.Vcap, por_vmax, por_potencia = self._passes(
+            dados["V"][0], self.geometria["R"], self.geometria["D"], self.slope, self.Ax0, self.Ay0
+        )
+        V, _, self.limite = envelope_limites(Vf, Vb, dados["V"][0], self.Vcap, por_vmax, por_potencia)
+        self.V = np.asarray(V)
+        self.janela = (0, len(self.V) - 1)
+        return self._montar_resultado()
+
+    def editar(self, inicio, fim, x, y, z):
+        """
+        Substitui os pontos [inicio, fim) da trajetória por (x, y, z) e
+        refaz só a parte afetada da simulação.
+
+        O novo trecho pode ter outro número de pontos (inserção ou remoção);
+        com inicio == fim os pontos são apenas inseridos.
+
+        Returns:
+            pd.DataFrame: Resultado completo da trajetória editada.
+        """
+        x, y, z = (np.atleast_1d(np.asarray(c, dtype=float)) for c in (x, y, z))
+        N = len(self.x)
+        if not 0 <= inicio <= fim <= N:
+            raise ValueError(f"Trecho inválido [{inicio}, {fim}) para {N} pontos")
+        L = len(x)
+        delta = L - (fim - inicio)
+        N2 = N + delta
+        if N2 < 3:
+            raise ValueError("A trajetória editada precisa de pelo menos 3 pontos")
+
+        self.x = _substituir(self.x, inicio, fim, x)
+        self.y = _substituir(self.y, inicio, fim, y)
+        self.z = _substituir(self.z, inicio, fim, z)
+
+        # ⇨ GEOMETRIA: pontos [lo, hi) recalculados (edição + estêncil de 2 pontos)
+        lo = max(inicio - 2, 0)
+        hi = min(inicio + L + 2, N2)
+        geo = preprocessar_geometria(self.x[lo:hi], self.y[lo:hi], self.z[lo:hi], self.use_z)
+        if hi < N2 and len(geo["angle"]):
+            # grading não limita o último ângulo; aqui ele não é o último da pista
+            geo["angle"][-1] = np.clip(geo["angle"][-1], -0.2, 0.2)
+
+        # D[i] vem dos pontos i, i + 1; R, angle e c de i .. i + 2
+        self.geometria["D"] = _substituir(self.geometria["D"], lo, hi - 1 - delta, geo["D"])
+        for nome in ("R", "angle", "c"):
+            self.geometria[nome] = _substituir(self.geometria[nome], lo, hi - 2 - delta, geo[nome])
+
+        p = self._p
+        slope = inclinacao_efetiva(geo["angle"], p['Crr'], p['m'], self._dados["meq"], self.use_z)
+        Ax0, _, Ay0, _ = self._coeficientes(geo["angle"])
+        Vcap, _ = velocidade_limite_curva(geo["R"], Ay0, self._cAy, self._dados["Vmax"])
+
+        self.slope = _substituir(self.slope, lo, hi - 2 - delta, slope)
+        self.Ax0 = _substituir(self.Ax0, lo, hi - 2 - delta, Ax0)
+        self.Ay0 = _substituir(self.Ay0, lo, hi - 2 - delta, Ay0)
+        # Vcap[i + 1] vem de R[i]
+        self.Vcap = _substituir(self.Vcap, lo + 1, hi - 1 - delta, Vcap)
+
+        # ⇨ PERFIL: segmentos [lo, hi - 1) mudaram; resolve entre âncoras da solução anterior
+        n2 = N2 - 2  # nº de segmentos da pista editada (V tem n2 + 1 pontos)
+        b = min(hi - 1, n2)
+        ancora_antiga = np.isin(self.limite, _ANCORAS)
+        ancora_antiga[0] = ancora_antiga[-1] = True
+        antes = np.flatnonzero(ancora_antiga[:lo + 1])
+        depois = np.flatnonzero(ancora_antiga[b - delta:]) + b  # em índices novos
+        ia, ib = len(antes) - 1, 0
+
+        while True:
+            a1, a2 = antes[ia], depois[ib]
+            V0 = self.V[a1]
+            Vf, Vb, Vcap_j, por_vmax, por_potencia = self._passes(
+                V0, self.geometria["R"][a1:a2], self.geometria["D"][a1:a2],
+                self.slope[a1:a2], self.Ax0[a1:a2], self.Ay0[a1:a2]
+            )
+            # O passe para frente precisa chegar a Vcap na âncora final e o
+            # passe para trás, na inicial; senão a edição vaza além delas
+            fim_ok = a2 == n2 or Vf[-1] >= self.Vcap[a2]
+            inicio_ok = a1 == 0 or Vb[0] >= V0
+            if fim_ok and inicio_ok:
+                break
+            if not fim_ok:
+                ib += 1
+            if not inicio_ok:
+                ia -= 1
+
+        V, _, limite = envelope_limites(Vf, Vb, V0, Vcap_j, por_vmax, por_potencia)
+        limite[0] = self.limite[a1]
+
+        a2_antigo = a2 - delta
+        self.V = _substituir(self.V, a1, a2_antigo + 1, np.asarray(V))
+        self.limite = _substituir(self.limite, a1, a2_antigo + 1, limite)
+        self.janela = (int(a1), int(a2))
+        return self._montar_resultado()
+
+    def _coeficientes(self, angle):
+        p, dados = self._p, self._dados
+        return coeficientes_aderencia(angle, dados["g"], dados["kl"], p['m'], p['fx'], p['fy'],
+                                      p['mu'], p['nu'], p['ld'], p['lt'], p['h'], p['Tracao'])
+
+    def _passes(self, V0, R, D, slope, Ax0, Ay0):
+        p, dados = self._p, self._dados
+        return passes_dois_passos(
+            V0, R, D, slope, Ax0, self._cAx, Ay0, self._cAy, self._Axmin, dados["g"], dados["k"],
+            dados["pcurve"], p['m'], dados["Pv"], p['marcha'], dados["P"], dados["Vmax"],
+            backend=self.backend
+        )
+
+    def _montar_resultado(self):
+        p = self._p
+        df = construir_dataframe_simulacao(self.V, self.geometria["D"], self.geometria["R"],
+                                           self.x, self.y, p['m'], c=self.geometria["c"])
+        if p['marcha']:
+            df = adicionar_dados_de_marcha(df, self._dados["pcurve"], p['gearslist'],
+                                           p['finaldrive'], p['rw'],
+                                           canais_potencia=self.canais_potencia)
+
+        df.attrs["solver"] = 'dois_passos'
+        df.attrs["backend"] = self.backend
+        df.attrs["contagem_limites"] = {nome: int(np.sum(self.limite == j))
+                                        for j, nome in enumerate(LIMITES)}
+        self.df = df
+        return df
@@ -0,0 +1,290 @@
+import numpy as np
+import pandas as pd
+import math
+import time
+from simulador.core.preprocessamento import preprocessar_simulacao, coeficientes_aderencia, remover_ponto_repetido
+from simulador.core.posprocessamento import construir_dataframe_simulacao, adicionar_dados_de_marcha, tempos_segmento
+from simulador.core.solver.roots import Roots
+from simulador.core.solver.velocity_correction import corrigir_velocidade
+from simulador.core.solver.dois_passos import (resolver_dois_passos, resolver_dois_passos_paralelo,
+                                     resolver_volta_lancada)
+from simulador.core.solver import numba_disponivel
+from simulador.core.logger.estatisticas import EstatisticasSolver
+from simulador.core.cache_resultados import chave_resultado, ARGUMENTOS_FORA_DA_CHAVE, ATTRS_FORA_DO_CACHE
+from simulador.core.modelos import Veiculo, Powertrain
+
+def loop(fx,fy,x,y,z,P,m,Cl,Cd,Af,Crr,ld,lt,h,Tracao,Vo,
+        Frenagem,Vmax,mu,nu,marcha=False,Ps=0,ns=0,finaldrive=0,
+        gearslist=0,rw=0, use_z=False, **opcoes):
+    """
+    Executa a simulação sobre a trajetória, com os parâmetros do veículo
+    (e, com marcha=True, do powertrain) como argumentos avulsos.
+
+    Monta Veiculo e Powertrain (core/modelos.py) e chama simular. use_z
+    usa a inclinação (altitude); as demais opções (solver, backend, ...)
+    são as de simular.
+    """
+    veiculo = Veiculo(fx=fx, fy=fy, P=P, m=m, Cl=Cl, Cd=Cd, Af=Af, Crr=Crr, ld=ld, lt=lt,
+                      h=h, Tracao=Tracao, Vo=Vo, Frenagem=Frenagem, Vmax=Vmax, mu=mu, nu=nu)
+    powertrain = Powertrain(Ps, ns, finaldrive, gearslist, rw) if marcha else None
+    return simular(veiculo, x, y, z, powertrain=powertrain, use_z=use_z, **opcoes)
+
+
+def simular(veiculo, x, y, z, powertrain=None, use_z=False, solver='marcha', backend='python',
+            geometria=None, cache_geometria=None, canais_potencia=False,
+            registro=None, estatisticas=False, circuito_fechado=False, processos=1,
+            cache_resultados=None, retroacao_tolerante=False):
+    """
+    Executa a simulação sobre a trajetória.
+
+    veiculo:
+        Veiculo (core/modelos.py) com os parâmetros do veículo.
+
+    powertrain:
+        Powertrain opcional; com ele a potência vem da curva do motor e o
+        resultado ganha marchas e RPM (marcha=True em loop).
+
+    solver:
+        'marcha'      — marcha para frente com corrigir_velocidade (referência).
+        'dois_passos' — passes para frente e para trás em tempo linear; a
+                        contagem de pontos por tipo de limite fica em
+                        df.attrs["contagem_limites"].
+    Com 'marcha', as contagens de correção ficam em df.attrs["contagem_metodo"]
+    e df.attrs["contagem_sucesso"]. O solver e o backend usados ficam em
+    df.attrs["solver"] e df.attrs["backend"].
+
+    backend:
+        'python' — implementação de referência.
+        'numba'  — kernels compilados (core/solver/kernels.py); sem Numba
+                   instalado, volta ao backend 'python'.
+
+    geometria:
+        Saída de preprocessar_geometria(x, y, z, use_z) já calculada, para
+        reaproveitar a geometria entre veículos na mesma pista.
+
+    cache_geometria:
+        CacheGeometria opcional; sem geometria informada, ela é lida do cache
+        em disco (ou calculada e gravada nele).
+
+    canais_potencia:
+        Com marcha=True, adiciona EnginePower e WheelTorque ao resultado.
+
+    registro:
+        RegistroSolver (core/logger/eventos.py) que recebe os eventos de
+        corrigir_velocidade no solver 'marcha' com backend 'python'.
+
+    estatisticas:
+        Se True, retorna (df, EstatisticasSolver) com o tempo de cada etapa,
+        as chamadas de Roots e as correções por método e profundidade
+        (core/logger/estatisticas.py).
+
+    circuito_fechado:
+        Trata a trajetória como circuito (geometria periódica, o último ponto
+        liga ao primeiro) e resolve a volta lançada: a velocidade de início é
+        encontrada igual à de fim e Vo é ignorado. Requer solver='dois_passos'.
+        V tem um ponto a mais que a trajetória (o retorno ao primeiro); o
+        tempo da volta completa fica em df.attrs["tempo_volta"], as
+        execuções dos passes em df.attrs["iteracoes_volta"] e, em
+        df.attrs["volta_convergiu"], se a velocidade de início chegou à de
+        fim (False quando as iterações se esgotam).
+
+    processos:
+        Com solver='dois_passos' e trajetória aberta, resolve em paralelo os
+        trechos entre ápices limitados pela aderência lateral
+        (resolver_dois_passos_paralelo), com este nº de processos, limitado
+        ao nº de núcleos; None usa todos. O nº de trechos emendados fica em
+        df.attrs["trechos"]. Pistas curtas, ou máquinas com um núcleo, são
+        resolvidas em série.
+
+    cache_resultados:
+        CacheResultados (core/cache_resultados.py) opcional; uma chamada com
+        a mesma trajetória e os mesmos parâmetros devolve o resultado
+        guardado (em memória ou em disco) sem simular. Ignorado com
+        registro ou estatisticas=True. Com cache, df.attrs não traz
+        "trechos" (ATTRS_FORA_DO_CACHE), nem no acerto nem na falta.
+
+    retroacao_tolerante:
+        No solver 'marcha', a retroação de corrigir_velocidade segue freando
+        quando Roots não tem solução ou a raiz de x1N fica complexa, casos
+        em que a referência falha com TypeError (ValueError no backend
+        'numba'). Sem esses casos o resultado é o mesmo.
+    """
+    argumentos = dict(locals())
+    marcha = powertrain is not None
+    if solver not in ('marcha', 'dois_passos'):
+        raise ValueError("solver deve ser 'marcha' ou 'dois_passos'")
+    if backend not in ('python', 'numba'):
+        raise ValueError("backend deve ser 'python' ou 'numba'")
+    if circuito_fechado and solver != 'dois_passos':
+        raise ValueError("circuito_fechado requer solver='dois_passos'")
+    if backend == 'numba' and not numba_disponivel():
+        print('⚠️ Numba não está instalado. Usando backend python.')
+        backend = 'python'
+
+    chave = None
+    if cache_resultados is not None and registro is None and not estatisticas:
+        parametros = {nome: valor for nome, valor in argumentos.items()
+                      if nome not in ARGUMENTOS_FORA_DA_CHAVE}
+        parametros.update(veiculo.como_dict(), **(powertrain.como_dict() if marcha else {}),
+                          marcha=marcha)
+        chave = chave_resultado(x, y, z, parametros)
+        df = cache_resultados.obter(chave)
+        if df is not None:
+            return df
+
+    stats = EstatisticasSolver() if estatisticas else None
+    inicio = time.perf_counter()
+    tempo_correcoes = 0.0
+    
+    if circuito_fechado:
+        x, y, z = remover_ponto_repetido(x, y, z)
+
+    if geometria is None and cache_geometria is not None:
+        geometria = cache_geometria.obter(x, y, z, use_z, fechada=circuito_fechado)
+
+        # ⇨ PRÉ-PROCESSAMENTO MODULARIZADO
+    pista = preprocessar_simulacao(veiculo, x, y, z, use_z, powertrain=powertrain,
+                                   geometria=geometria, fechada=circuito_fechado)
+
+    # ⇨ CONSTANTES DO VEÍCULO
+    m, mu = veiculo.m, veiculo.mu
+    P, Pv, pcurve, g, k, Vmax = pista.P, pista.Pv, pista.pcurve, pista.g, pista.k, pista.Vmax
+    # Geometria chega como np.ndarray; só a marcha escalar converte para float
+    # do Python, pois Roots detecta raízes complexas via type(x) == float
+    R, D, slope = pista.R, pista.D, pista.slope
+    V = [pista.V0]
+
+    
+    Axmin = veiculo.Frenagem * g * veiculo.fx
+    AxmaxL, AymaxL = [], []
+
+
+    contagem_metodo = {
+        "Correção por Torricelli Modificado": 0,
+        "Correção por fórmula V1": 0
+    }
+
+    contagem_sucesso = {
+        "Correção local (j=0) ": 0,
+        "Correção retroativa (j>0) ": 0
+    }
+
+
+
+    # ⇨ TERMOS INDEPENDENTES DE V CALCULADOS EM LOTE (só V[i] fica no laço)
+    Ax0, cAx, Ay0, cAy = coeficientes_aderencia(
+        pista.angle, g, pista.kl, m, veiculo.fx, veiculo.fy, mu, veiculo.nu,
+        veiculo.ld, veiculo.lt, veiculo.h, veiculo.Tracao
+    )
+
+    inicio_marcha = time.perf_counter()
+    if circuito_fechado:
+        V, contagem_limites, _, iteracoes_volta, volta_convergiu = resolver_volta_lancada(
+            R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+            pcurve, m, Pv, marcha, P, Vmax, backend=backend
+        )
+        R_loop = []
+    elif solver == 'dois_passos' and processos != 1:
+        V, contagem_limites, _, trechos = resolver_dois_passos_paralelo(
+            V[0], R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+            pcurve, m, Pv, marcha, P, Vmax, backend=backend, processos=processos
+        )
+        R_loop = []
+    elif solver == 'dois_passos':
+        V, contagem_limites, _ = resolver_dois_passos(
+            V[0], R, D, slope, Ax0, cAx, Ay0, cAy, Axmin, g, k,
+            pcurve, m, Pv, marcha, P, Vmax, backend=backend
+        )
+        R_loop = []   # pula a marcha abaixo
+    elif backend == 'numba':
+        from simulador.core.solver.kernels import marcha_kernel, curva_potencia_arrays
+
+        pv_v, pv_p = curva_potencia_arrays(pcurve, marcha)
+        V, contagem, metodos, profundidades, chamadas_roots = marcha_kernel(
+            V[0], pista.R, pista.D, pista.slope, Ax0, cAx, Ay0, cAy,
+            Axmin, g, k, pv_v, pv_p, marcha, P, m, Vmax, retroacao_tolerante
+        )
+        if stats is not None:
+            stats.registrar_correcoes(metodos, profundidades)
+            stats.chamadas_roots = int(chamadas_roots)
+            tempo_correcoes = math.nan  # incluídas no tempo do kernel
+        for nome, n in zip(list(contagem_metodo) + list(contagem_sucesso), contagem):
+            if nome in contagem_metodo:
+                contagem_metodo[nome] = int(n)
+            else:
+                contagem_sucesso[nome] = int(n)
+        R_loop = []
+    else:
+        R, D, slope = R.tolist(), D.tolist(), slope.tolist()
+        R_loop = R
+    Ax0, Ay0 = Ax0.tolist(), Ay0.tolist()
+
+    for i in range(len(R_loop)):
+        Aymax = Ay0[i] - cAy * V[i]**2
+        Axmax = Ax0[i] - cAx * V[i]**2
+
+        AxmaxL.append(Axmax)
+        AymaxL.append(Aymax)
+
+        resultado_roots = Roots(V[i], D[i], R[i], AxmaxL[i], Axmin, AymaxL[i], slope[i], g, k, pcurve, m, Pv, marcha, P, verbose=False)
+
+        #print_iteration_info(i, V[i], D[i], R[i], slope[i], Axmax, Aymax, resultado_roots)
+
+        if resultado_roots != False:
+
+            Viplus1 = resultado_roots[1][1]
+
+            if Viplus1 > Vmax:
+                Viplus1 = Vmax
+
+            V.append(Viplus1)
+            
+        else:
+            inicio_correcao = time.perf_counter()
+            V = corrigir_velocidade(i, V, R, D, slope, AxmaxL, Axmin, AymaxL, k, g,
+                pcurve, m, Pv, marcha, P,mu, contagem_metodo, contagem_sucesso,
+                registro=registro, estatisticas=stats, tolerante=retroacao_tolerante)
+            # A correção parte do limite lateral, que em raios grandes passa de Vmax
+            if retroacao_tolerante and V[i + 1] > Vmax:
+                V[i + 1] = Vmax
+            tempo_correcoes += time.perf_counter() - inicio_correcao
+                
+
+    inicio_pos = time.perf_counter()
+    df = construir_dataframe_simulacao(V, D, R, x, y, m, c=pista.c)
+
+    if marcha:
+        df = adicionar_dados_de_marcha(df, pcurve, powertrain.gearslist, powertrain.finaldrive,
+                                       powertrain.rw, canais_potencia=canais_potencia)
+
+    df.attrs["solver"] = solver
+    df.attrs["backend"] = backend
+    if solver == 'dois_passos':
+        df.attrs["contagem_limites"] = contagem_limites
+        if circuito_fechado:
+            df.attrs["tempo_volta"] = float(np.sum(tempos_segmento(np.asarray(V), np.asarray(D))))
+            df.attrs["iteracoes_volta"] = iteracoes_volta
+            df.attrs["volta_convergiu"] = volta_convergiu
+        elif processos != 1:
+            df.attrs["trechos"] = trechos
+    else:
+        df.attrs["contagem_metodo"] = contagem_metodo
+        df.attrs["contagem_sucesso"] = contagem_sucesso
+
+    if stats is not None:
+        fim = time.perf_counter()
+        stats.solver, stats.backend = solver, backend
+        stats.chamadas_roots += len(R_loop)
+        stats.tempos["preprocessamento"] = inicio_marcha - inicio
+        stats.tempos["marcha"] = inicio_pos - inicio_marcha
+        if not math.isnan(tempo_correcoes):
+            stats.tempos["marcha"] -= tempo_correcoes
+        stats.tempos["correcoes"] = tempo_correcoes
+        stats.tempos["posprocessamento"] = fim - inicio_pos
+        return df, stats
+
+    if chave is not None:
+        for nome in ATTRS_FORA_DO_CACHE:
+            df.attrs.pop(nome, None)
+        cache_resultados.guardar(chave, df)
+    return df
\ No newline at end of file
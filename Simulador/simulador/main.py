@@ -0,0 +1,145 @@
+import argparse
+import json
+
+from simulador.loop import loop
+from simulador.core.tools.carregamento import carregar_arquivo_trajetoria
+from simulador.core.posprocessamento import exportar_resultado, metadados_simulacao
+
+
+def carregar_trajetoria(csv_path=None, colunas=None, escala=1.0):
+    """
+    Carrega a trajetória a partir de CSV, binário (.npy), GPX/KML ou manual.
+
+    Parâmetros:
+    - csv_path: arquivo .csv (lido em blocos), .npy (memory map) ou .gpx/.kml
+      (leitura incremental, convertido para metros em UTM; com várias trilhas
+      usa a primeira, ver carregamento.ler_trajetorias_gps)
+    - colunas: nomes das colunas x/y/z no CSV, ex.: {'x': 'E', 'y': 'N', 'z': 'Alt'}
+    - escala: fator para metros, único ou por eixo
+
+    Retorna:
+    - x, y, z: arrays float64 de coordenadas (listas na inserção manual)
+    """
+
+
+    if csv_path: 
+        x, y, z = carregar_arquivo_trajetoria(csv_path, colunas=colunas, escala=escala)
+
+    else:
+        # Inserção manual de exemplo
+        x = []  # Preencher lista de X
+        y = []  # Preencher lista de Y
+        z = []  # Preencher lista de Z (altitude)
+
+    return x, y, z
+
+
+def main():
+    """
+    Template geral do simulador automotivo.
+    Preencha os parâmetros abaixo.
+    """
+
+    # === Trajetória ===
+    x, y, z = carregar_trajetoria(
+        csv_path=None      # Exemplo: 'trajetoria.csv'
+    )
+
+    # === Parâmetros do Veículo ===
+    m = None           # Massa [kg]
+    Cl = None          # Coef. sustentação
+    Cd = None          # Coef. arrasto
+    Af = None          # Área frontal [m²]
+    Crr = None         # Coef. rolamento
+    lt = None          # Distância eixo traseiro ao CM [m]
+    ld = None          # Distância eixo dianteiro ao CM [m]
+    h = None           # Altura do CM [m]
+    Tracao = None      # 'D' dianteira ou 'T' traseira
+
+    # === Parâmetros físicos ===
+    fx = None
+    fy = None
+    mu = None
+    nu = None
+    Frenagem = None
+
+    Vo = None          # Velocidade inicial [km/h]
+    Vmax = None        # Velocidade máxima [km/h]
+    use_z = True       # Usa inclinação (altitude) se True
+
+    # === Potência e transmissão ===
+    marcha = False     # True para simular com marchas
+    P = None           # Potência máxima [cv]
+    Ps = []            # Lista de potências por marcha [cv]
+    ns = []            # Lista de rotações máximas por marcha [rpm]
+    finaldrive = None  # Relação do diferencial
+    gearslist = []     # Relações de marcha
+    rw = None          # Raio da roda [m]
+
+    # === Executa a Simulação ===
+    df = loop(
+        fx, fy, x, y, z, P, m, Cl, Cd, Af, Crr,
+        ld, lt, h, Tracao, Vo, Frenagem, Vmax,
+        mu, nu, marcha, Ps, ns, finaldrive,
+        gearslist, rw, use_z=use_z
+    )
+
+    # === Exporta resultado ===
+    arquivo_saida = 'resultado_simulacao.csv'   # .csv, .npz ou, com pyarrow, .parquet e .feather
+    veiculo = dict(
+        m=m, Cl=Cl, Cd=Cd, Af=Af, Crr=Crr, ld=ld, lt=lt, h=h, Tracao=Tracao,
+        fx=fx, fy=fy, mu=mu, nu=nu, Frenagem=Frenagem, Vo=Vo, Vmax=Vmax,
+        marcha=marcha, P=P, Ps=Ps, ns=ns, finaldrive=finaldrive,
+        gearslist=gearslist, rw=rw,
+    )
+    exportar_resultado(df, arquivo_saida,
+                       metadados=metadados_simulacao(veiculo, x, y, z, use_z=use_z))
+    print(f'✅ Resultado salvo em {arquivo_saida}')
+
+    # === Geração de Gráficos ===
+    from simulador.core.tools.plots import graph  # matplotlib só é carregado aqui
+
+    graph(
+        df, x, y,
+        distance_range=None,   # Exemplo: (0, 5) para 0 a 5 km, ou None para tudo
+        downsampling=None      # Exemplo: 10 para subamostrar, ou None
+    )
+
+
+def cli(argv=None):
+    """
+    Linha de comando (console script `simulador`): simula a trajetória de um
+    arquivo com os parâmetros de veículo de um JSON e salva o resultado.
+
+    Exemplo:
+        simulador pista.csv --veiculo veiculo.json --solver dois_passos --graficos graficos/
+    """
+    parser = argparse.ArgumentParser(prog='simulador', description='Simula uma volta sobre a trajetória.')
+    parser.add_argument('trajetoria', help='Arquivo .csv, .npy, .gpx ou .kml')
+    parser.add_argument('--veiculo', required=True,
+                        help='JSON com os argumentos de veículo de loop (fx, fy, P, m, Cl, ...)')
+    parser.add_argument('--saida', default='resultado_simulacao.csv',
+                        help='Arquivo de resultado (.csv, .npz ou, com pyarrow, .parquet e .feather)')
+    parser.add_argument('--solver', choices=('marcha', 'dois_passos'), default='marcha')
+    parser.add_argument('--backend', choices=('python', 'numba'), default='python')
+    parser.add_argument('--use-z', action='store_true', help='Usa a inclinação (altitude)')
+    parser.add_argument('--graficos', metavar='PASTA', help='Salva os gráficos nesta pasta')
+    args = parser.parse_args(argv)
+
+    with open(args.veiculo, encoding='utf-8') as f:
+        veiculo = json.load(f)
+
+    x, y, z = carregar_trajetoria(args.trajetoria)
+    df = loop(x=x, y=y, z=z, use_z=args.use_z, solver=args.solver, backend=args.backend, **veiculo)
+    exportar_resultado(df, args.saida,
+                       metadados=metadados_simulacao(veiculo, x, y, z, use_z=args.use_z))
+    print(f'✅ Resultado salvo em {args.saida}')
+
+    if args.graficos:
+        from simulador.core.tools.plots import graph
+
+        graph(df, x, y, pasta=args.graficos)
+
+
+if __name__ == '__main__':
+    main()
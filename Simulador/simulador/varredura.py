@@ -0,0 +1,186 @@
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from simulador.loop import loop
+from simulador.core.preprocessamento import preprocessar_geometria, remover_ponto_repetido
+from simulador.core.solver import numba_disponivel
+
+# Arrays da pista no processo atual (views da memória compartilhada nos trabalhadores)
+_PISTA = {}
+
+
+def combinacoes_grade(grade):
+    """
+    Gera, sob demanda, o produto cartesiano de uma grade de parâmetros.
+
+    Args:
+        grade (dict): {nome_parametro: lista_de_valores}, ex.: {'m': [250, 300], 'Cd': [0.7, 0.8]}
+
+    Yields:
+        dict: Uma combinação {nome_parametro: valor}.
+    """
+    nomes = list(grade)
+    for valores in itertools.product(*(grade[nome] for nome in nomes)):
+        yield dict(zip(nomes, valores))
+
+
+def resumir_resultado(df):
+    """
+    Resume um resultado de loop em uma linha da tabela de varredura.
+
+    Returns:
+        dict: LapTime [s] (df.attrs["tempo_volta"] em circuito fechado),
+        MaxSpeed e MinSpeed [m/s] e as contagens de
+        df.attrs (limites do perfil ou correções), uma coluna por chave.
+    """
+    resumo = {
+        "LapTime": df.attrs.get("tempo_volta", float(np.nanmax(df["Time"]))),
+        "MaxSpeed": float(df["Speed"].max()),
+        "MinSpeed": float(df["Speed"].min()),
+    }
+    for contagem in df.attrs.values():
+        if isinstance(contagem, dict):
+            for nome, n in contagem.items():
+                resumo[nome.strip()] = n
+    return resumo
+
+
+def _publicar_pista(arrays):
+    # Copia os arrays da pista para um único bloco de memória compartilhada
+    arrays = {nome: np.ascontiguousarray(a, dtype=np.float64) for nome, a in arrays.items()}
+    shm = shared_memory.SharedMemory(create=True, size=max(sum(a.nbytes for a in arrays.values()), 1))
+    layout = {}
+    offset = 0
+    for nome, a in arrays.items():
+        np.ndarray(a.shape, np.float64, buffer=shm.buf, offset=offset)[:] = a
+        layout[nome] = (offset, a.shape)
+        offset += a.nbytes
+    return shm, layout
+
+
+def _anexar_pista(nome_shm, layout):
+    # Inicializador dos trabalhadores: anexa a memória compartilhada sem copiar
+    shm = shared_memory.SharedMemory(name=nome_shm)
+    _PISTA.clear()
+    _PISTA["_shm"] = shm
+    for nome, (offset, shape) in layout.items():
+        a = np.ndarray(shape, np.float64, buffer=shm.buf, offset=offset)
+        a.flags.writeable = False
+        _PISTA[nome] = a
+
+
+def _simular(indice, params, base, opcoes):
+    geometria = {nome: _PISTA[nome] for nome in ("R", "D", "angle", "c")}
+    try:
+        df = loop(x=_PISTA["x"], y=_PISTA["y"], z=_PISTA["z"],
+                  geometria=geometria, **{**base, **params}, **opcoes)
+        resumo = resumir_resultado(df)
+    except Exception as erro:  # uma combinação inválida não derruba a varredura
+        resumo = {"Erro": f"{type(erro).__name__}: {erro}"}
+    return indice, {**params, **resumo}
+
+
+def varrer_parametros(x, y, z, base, grade=None, combinacoes=None, use_z=False,
+                      solver='dois_passos', backend='python', processos=None,
+                      max_pendentes=None, progresso=True, cache_geometria=None):
+    """
+    Varre configurações de veículo sobre a mesma pista.
+
+    A geometria é calculada uma única vez e os arrays da pista ficam em
+    memória compartilhada; cada tarefa enviada aos processos leva apenas o
+    dicionário de parâmetros.
+
+    Args:
+        x, y, z (array-like): Coordenadas da trajetória.
+        base (dict): Argumentos de loop comuns a todas as combinações
+            (fx, fy, P, m, Cl, Cd, Af, Crr, ld, lt, h, Tracao, Vo, Frenagem,
+            Vmax, mu, nu e, se houver, marcha, Ps, ns, finaldrive, gearslist, rw,
+            circuito_fechado).
+        grade (dict, optional): {parametro: valores}; varre o produto cartesiano.
+        combinacoes (iterable, optional): Dicts de parâmetros, alternativa à grade.
+        use_z, solver, backend: Repassados a loop.
+        processos (int, optional): Nº de processos (padrão: os.cpu_count()).
+            Com 1, roda no processo atual.
+        max_pendentes (int, optional): Máximo de tarefas em andamento, limita a
+            memória com grades grandes (padrão: 4 * processos).
+        progresso (bool or callable): True imprime o andamento; um callable
+            recebe (concluidas, total), com total None se desconhecido.
+        cache_geometria (CacheGeometria, optional): Lê/grava a geometria da
+            pista no cache em disco.
+
+    Returns:
+        pd.DataFrame: Uma linha por combinação com os parâmetros variados,
+        LapTime, MaxSpeed, MinSpeed, contagens de limites/correções e, quando
+        a simulação falha, a mensagem em 'Erro'.
+    """
+    if (grade is None) == (combinacoes is None):
+        raise ValueError("Informe exatamente um entre 'grade' e 'combinacoes'")
+
+    if grade is not None:
+        total = math.prod(len(v) for v in grade.values())
+        combinacoes = combinacoes_grade(grade)
+    else:
+        total = len(combinacoes) if hasattr(combinacoes, '__len__') else None
+
+    processos = processos or os.cpu_count() or 1
+    if backend == 'numba' and not numba_disponivel():
+        # Avisa uma vez aqui, não a cada combinação nos trabalhadores
+        print('⚠️ Numba não está instalado. Usando backend python.')
+        backend = 'python'
+    max_pendentes = max_pendentes or 4 * processos
+    opcoes = {"use_z": use_z, "solver": solver, "backend": backend}
+
+    x, y, z = np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(z, dtype=float)
+    fechada = base.get("circuito_fechado", False)
+    if fechada:
+        x, y, z = remover_ponto_repetido(x, y, z)
+    if cache_geometria is not None:
+        geometria = cache_geometria.obter(x, y, z, use_z, fechada=fechada)
+    else:
+        geometria = preprocessar_geometria(x, y, z, use_z, fechada)
+    pista = {"x": x, "y": y, "z": z, **geometria}
+
+    linhas = {}
+    inicio = time.time()
+    passo_aviso = max(1, (total or 100) // 20)
+
+    def registrar(indice, linha):
+        linhas[indice] = linha
+        feitas = len(linhas)
+        if callable(progresso):
+            progresso(feitas, total)
+        elif progresso and (feitas % passo_aviso == 0 or feitas == total):
+            print(f"Varredura: {feitas}/{total if total else '?'} combinações "
+                  f"({time.time() - inicio:.1f} s)")
+
+    if processos == 1:
+        _PISTA.clear()
+        _PISTA.update(pista)
+        for indice, params in enumerate(combinacoes):
+            registrar(*_simular(indice, params, base, opcoes))
+    else:
+        shm, layout = _publicar_pista(pista)
+        try:
+            with ProcessPoolExecutor(max_workers=processos, initializer=_anexar_pista,
+                                     initargs=(shm.name, layout)) as executor:
+                pendentes = set()
+                for indice, params in enumerate(combinacoes):
+                    if len(pendentes) >= max_pendentes:
+                        prontas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                        for futuro in prontas:
+                            registrar(*futuro.result())
+                    pendentes.add(executor.submit(_simular, indice, params, base, opcoes))
+                for futuro in wait(pendentes).done:
+                    registrar(*futuro.result())
+        finally:
+            shm.close()
+            shm.unlink()
+
+    return pd.DataFrame([linhas[i] for i in sorted(linhas)])
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from simulador.benchmark import VEICULO_PADRAO, POWERTRAIN_PADRAO, pista_sintetica
+from simulador.core.cache_disco import limitar_diretorio
+from simulador.core.cache_geometria import CacheGeometria
+from simulador.core.cache_resultados import CacheResultados, ATTRS_FORA_DO_CACHE
+from simulador.core.solver import dois_passos
+from simulador.core.preprocessamento import preprocessar_geometria
+from simulador.loop import loop
+
+
+def test_limite_remove_os_mais_antigos(tmp_path):
+    for i in range(4):
+        caminho = tmp_path / f"{i}.npz"
+        caminho.write_bytes(b"0" * 100)
+        os.utime(caminho, (i, i))
+    (tmp_path / "outro.npy").write_bytes(b"0" * 1000)
+
+    limitar_diretorio(str(tmp_path), '.npz', 250)
+
+    assert sorted(os.listdir(tmp_path)) == ["2.npz", "3.npz", "outro.npy"]
+
+
+def test_cache_geometria(tmp_path):
+    x, y, z = pista_sintetica('morro', 500)
+    cache = CacheGeometria(str(tmp_path))
+    calculada = cache.obter(x, y, z, True)
+    lida = cache.obter(x, y, z, True)
+    esperada = preprocessar_geometria(x, y, z, True)
+    for nome in ("D", "R", "angle", "c"):
+        np.testing.assert_array_equal(lida[nome], esperada[nome])
+        np.testing.assert_array_equal(calculada[nome], esperada[nome])
+
+
+def test_cache_resultados_ignora_processos(tmp_path):
+    x, y, z = pista_sintetica('morro', 2000)
+    cache = CacheResultados(str(tmp_path), itens_memoria=0)
+    serial = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', processos=1,
+                  cache_resultados=cache, **VEICULO_PADRAO)
+    paralelo = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', processos=2,
+                    cache_resultados=cache, **VEICULO_PADRAO)
+
+    estatisticas = cache.estatisticas()
+    assert estatisticas["acertos_disco"] == 1 and estatisticas["arquivos"] == 1
+    np.testing.assert_array_equal(serial['Speed'], paralelo['Speed'])
+
+
+OPCOES_CACHE = {
+    'marcha': dict(solver='marcha'),
+    'marcha_tolerante': dict(solver='marcha', retroacao_tolerante=True, marcha=True,
+                             **POWERTRAIN_PADRAO),
+    'dois_passos': dict(solver='dois_passos'),
+    'volta_lancada': dict(solver='dois_passos', circuito_fechado=True),
+    'paralelo': dict(solver='dois_passos', processos=2),
+}
+
+
+@pytest.mark.parametrize("itens_memoria", [0, 4])
+@pytest.mark.parametrize("opcoes", list(OPCOES_CACHE))
+def test_acerto_igual_a_falta(tmp_path, monkeypatch, opcoes, itens_memoria):
+    monkeypatch.setattr(dois_passos.os, 'cpu_count', lambda: 2)
+    monkeypatch.setattr(dois_passos, 'TAMANHO_MIN_TRECHO', 500)
+    x, y, z = pista_sintetica('oval', 3000)
+    parametros = dict(VEICULO_PADRAO, **OPCOES_CACHE[opcoes])
+    cache = CacheResultados(str(tmp_path), itens_memoria=itens_memoria)
+
+    falta = loop(x=x, y=y, z=z, use_z=True, cache_resultados=cache, **parametros)
+    acerto = loop(x=x, y=y, z=z, use_z=True, cache_resultados=cache, **parametros)
+    sem_cache = loop(x=x, y=y, z=z, use_z=True, **parametros)
+
+    assert cache.estatisticas()["acertos"] == 1
+    pd.testing.assert_frame_equal(acerto, falta)
+    pd.testing.assert_frame_equal(acerto, sem_cache)
+    assert acerto.attrs == falta.attrs
+    assert acerto.attrs == {nome: valor for nome, valor in sem_cache.attrs.items()
+                            if nome not in ATTRS_FORA_DO_CACHE}
+    if opcoes == 'paralelo':
+        assert sem_cache.attrs["trechos"] > 1 and "trechos" not in acerto.attrs
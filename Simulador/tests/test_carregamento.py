@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from simulador.core.tools.carregamento import ler_trajetorias_gps
+
+pytest.importorskip("pyproj")
+
+KML = """<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+  <Document>
+    <Placemark>
+      <name>Volta</name>
+      <LineString>
+        <coordinates>
+          -43.2000,-22.9000,10 -43.1990,-22.9000 -43.1980,-22.9000,30
+          -43.1970,-22.9000
+        </coordinates>
+      </LineString>
+    </Placemark>
+  </Document>
+</kml>
+"""
+
+
+def test_kml_com_e_sem_altitude_no_mesmo_bloco(tmp_path):
+    caminho = tmp_path / 'pista.kml'
+    caminho.write_text(KML, encoding='utf-8')
+
+    trilha, = ler_trajetorias_gps(str(caminho))
+
+    assert trilha['nome'] == 'Volta'
+    assert len(trilha['x']) == 4
+    # Pontos na mesma latitude, a 0,001° (~103 m) um do outro
+    np.testing.assert_allclose(np.hypot(np.diff(trilha['x']), np.diff(trilha['y'])), 102.6, rtol=0.01)
+    # Altitude que falta é interpolada entre os vizinhos (e repetida na ponta)
+    np.testing.assert_allclose(trilha['z'], [10, 20, 30, 30])
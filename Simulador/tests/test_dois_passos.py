@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from simulador.benchmark import VEICULO_PADRAO, POWERTRAIN_PADRAO, pista_sintetica
+from simulador.core.modelos import Veiculo, Powertrain
+from simulador.core.preprocessamento import preprocessar_simulacao, coeficientes_aderencia
+from simulador.core.solver import dois_passos
+from simulador.loop import loop
+
+
+@pytest.mark.parametrize("pista", ['morro', 'oito'])
+def test_paralelo_identico_ao_serial(pista, monkeypatch):
+    # Força o pool mesmo numa máquina com um núcleo, com trechos menores
+    monkeypatch.setattr(dois_passos.os, 'cpu_count', lambda: 2)
+    monkeypatch.setattr(dois_passos, 'TAMANHO_MIN_TRECHO', 2_000)
+    x, y, z = pista_sintetica(pista, 20_000)
+    serial = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', **VEICULO_PADRAO)
+    paralelo = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', processos=2, **VEICULO_PADRAO)
+
+    assert paralelo.attrs["trechos"] > 1
+    np.testing.assert_array_equal(serial['Speed'], paralelo['Speed'])
+    assert serial.attrs["contagem_limites"] == paralelo.attrs["contagem_limites"]
+
+
+def test_paralelo_com_um_nucleo_nao_abre_pool(monkeypatch):
+    monkeypatch.setattr(dois_passos.os, 'cpu_count', lambda: 1)
+
+    def sem_pool(*args, **kwargs):
+        raise AssertionError("o pool não deveria ser aberto")
+
+    monkeypatch.setattr(dois_passos, 'ProcessPoolExecutor', sem_pool)
+    x, y, z = pista_sintetica('morro', 20_000)
+    df = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', processos=4, **VEICULO_PADRAO)
+    assert df.attrs["trechos"] == 1
+
+
+# Medido com 3000 pontos: (ganho de tempo sobre a marcha, p95 e máximo da
+# diferença relativa de velocidade)
+CONCORDANCIA_MEDIDA = {
+    ('morro', False): (0.00423, 0.0343, 0.0778),
+    ('morro', True): (0.00403, 0.0241, 0.0695),
+    ('oito', False): (0.00373, 0.0201, 0.0500),
+    ('oito', True): (0.00367, 0.0188, 0.0344),
+}
+
+
+def _parametros(marcha):
+    return {**VEICULO_PADRAO, **(dict(POWERTRAIN_PADRAO, marcha=True) if marcha else {})}
+
+
+@pytest.mark.parametrize("pista, marcha", list(CONCORDANCIA_MEDIDA))
+def test_concorda_com_marcha(pista, marcha):
+    parametros = _parametros(marcha)
+    x, y, z = pista_sintetica(pista, 3000)
+    referencia = loop(x=x, y=y, z=z, use_z=True, solver='marcha', **parametros)
+    df = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', **parametros)
+
+    V_ref, V = referencia['Speed'].to_numpy()[1:], df['Speed'].to_numpy()[1:]
+    T_ref, T = np.nanmax(referencia['Time']), np.nanmax(df['Time'])
+    diferenca = np.abs(V - V_ref) / V_ref
+    ganho, p95, maximo = CONCORDANCIA_MEDIDA[(pista, marcha)]
+    # A marcha volta à velocidade de regime nas curvas (corrigir_velocidade);
+    # os dois passes ficam iguais ou acima dela
+    assert abs((T_ref - T) / T_ref - ganho) < 2e-4
+    assert np.all(V >= V_ref - 0.005)
+    assert np.percentile(diferenca, 95) < p95 + 0.001
+    assert np.max(diferenca) < maximo + 0.002
+
+
+@pytest.mark.parametrize("marcha", [False, True])
+@pytest.mark.parametrize("pista", ['morro', 'oito'])
+def test_apices_no_limite_de_curva(pista, marcha):
+    # Vcap = sqrt(R * Aymax) com Aymax = Ay0 - cAy * V², resolvido aqui à parte
+    x, y, z = pista_sintetica(pista, 3000)
+    veiculo = Veiculo.de_dict(VEICULO_PADRAO)
+    powertrain = Powertrain.de_dict(POWERTRAIN_PADRAO) if marcha else None
+    p = preprocessar_simulacao(veiculo, x, y, z, True, powertrain=powertrain)
+    _, _, Ay0, cAy = coeficientes_aderencia(
+        p.angle, p.g, p.kl, veiculo.m, veiculo.fx, veiculo.fy, veiculo.mu, veiculo.nu,
+        veiculo.ld, veiculo.lt, veiculo.h, veiculo.Tracao
+    )
+    Vcap = np.sqrt(p.R * Ay0 / (1 + cAy * p.R))
+
+    df = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', **_parametros(marcha))
+    V = df['Speed'].to_numpy()[1:len(Vcap) + 1]   # V[i + 1] é limitado por R[i]
+    apices = np.flatnonzero(np.isclose(V, Vcap, rtol=1e-12, atol=0))
+
+    assert np.all(V <= Vcap * (1 + 1e-12))
+    assert len(apices) == df.attrs["contagem_limites"]["Aderência lateral"] > 0
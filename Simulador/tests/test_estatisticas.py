@@ -0,0 +1,71 @@
+import json
+import math
+import sys
+
+import numpy as np
+import pytest
+
+import simulador.core.solver.velocity_correction as velocity_correction
+from simulador.benchmark import VEICULO_PADRAO, POWERTRAIN_PADRAO, pista_sintetica
+from simulador.core.logger.estatisticas import EstatisticasSolver, ETAPAS
+from simulador.core.logger.eventos import METODOS
+from simulador.loop import loop
+
+PARAMETROS = dict(VEICULO_PADRAO, **POWERTRAIN_PADRAO, marcha=True)
+
+
+def _contar_roots(monkeypatch):
+    # Conta as chamadas de Roots na marcha (loop) e na retroação
+    chamadas = []
+    for modulo in (sys.modules['simulador.loop'], velocity_correction):
+        original = modulo.Roots
+        monkeypatch.setattr(modulo, 'Roots',
+                            lambda *args, _f=original, **kwargs: chamadas.append(1) or _f(*args, **kwargs))
+    return chamadas
+
+
+def test_estatisticas_batem_com_as_contagens(monkeypatch):
+    chamadas = _contar_roots(monkeypatch)
+    x, y, z = pista_sintetica('morro', 3000)
+    df, stats = loop(x=x, y=y, z=z, use_z=True, estatisticas=True, **PARAMETROS)
+
+    sucesso = list(df.attrs["contagem_sucesso"].values())
+    assert stats.correcoes == sum(sucesso) > 0
+    histograma = stats.histograma_retroacao()
+    assert histograma[0] == sucesso[0] and histograma[1:].sum() == sucesso[1]
+    assert len(histograma) == stats.profundidade_max + 1
+    por_metodo = stats.contagem_por_metodo()
+    assert {m: sum(por_metodo[m].values()) for m in METODOS} == df.attrs["contagem_metodo"]
+    assert stats.chamadas_roots == len(chamadas)
+
+    assert (stats.solver, stats.backend) == ('marcha', 'python')
+    assert set(stats.tempos) == set(ETAPAS) and all(t >= 0 for t in stats.tempos.values())
+    resumo = json.loads(json.dumps(stats.resumo()))
+    assert resumo["correcoes"] == stats.correcoes
+    assert resumo["tempo_total"] == pytest.approx(sum(stats.tempos.values()))
+
+
+def test_estatisticas_do_kernel_iguais_as_do_python():
+    pytest.importorskip("numba")
+    x, y, z = pista_sintetica('morro', 3000)
+    _, python = loop(x=x, y=y, z=z, use_z=True, estatisticas=True, **PARAMETROS)
+    _, numba = loop(x=x, y=y, z=z, use_z=True, estatisticas=True, backend='numba', **PARAMETROS)
+
+    np.testing.assert_array_equal(numba.histograma_retroacao(), python.histograma_retroacao())
+    assert numba.contagem_por_metodo() == python.contagem_por_metodo()
+    assert numba.chamadas_roots == python.chamadas_roots
+    assert math.isnan(numba.tempos["correcoes"])
+    assert not math.isnan(numba.resumo()["tempo_total"])
+
+
+def test_registro_manual():
+    stats = EstatisticasSolver()
+    stats.registrar_correcao(METODOS[0], 0, 1)
+    stats.registrar_correcao(METODOS[1], 3, 4)
+    stats.registrar_correcoes([0, 0], [3, 1])
+
+    assert stats.correcoes == 4 and stats.profundidade_max == 3
+    assert stats.chamadas_roots == 5
+    np.testing.assert_array_equal(stats.histograma_retroacao(), [1, 1, 0, 2])
+    assert stats.contagem_por_metodo() == {METODOS[0]: {0: 1, 1: 1, 3: 1}, METODOS[1]: {3: 1}}
+    assert EstatisticasSolver().histograma_retroacao().tolist() == [0]
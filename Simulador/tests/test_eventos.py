@@ -0,0 +1,84 @@
+import numpy as np
+
+from simulador.benchmark import VEICULO_PADRAO, POWERTRAIN_PADRAO, pista_sintetica
+from simulador.core.logger.eventos import (RegistroSolver, SaidaTerminal, DESLIGADO, EVENTOS,
+                                           DETALHADO, METODOS)
+from simulador.core.solver.velocity_correction import corrigir_velocidade
+from simulador.loop import loop
+
+PARAMETROS = dict(VEICULO_PADRAO, **POWERTRAIN_PADRAO, marcha=True)
+
+
+def _corrigir_com_argumento_negativo(registro):
+    # Ponto 2 sai do limite lateral de um raio de 1000 m logo depois de um
+    # raio de 5 m: a raiz de x1N da retroação tem argumento negativo
+    V = [10.0, 10.0, 10.0]
+    return corrigir_velocidade(2, V, [50.0, 5.0, 1000.0], [1.0] * 3, [0.0] * 3, [10.0] * 3, 12.0,
+                               [12.0] * 3, 0.001, 9.81, [], 300.0, [], False, 70000.0, 1.3,
+                               None, None, registro=registro, tolerante=True)
+
+
+def test_buffer_circular_em_ordem_cronologica():
+    registro = RegistroSolver(capacidade=4)
+    for i in range(3):
+        registro.registrar_correcao(i, 1, METODOS[i % 2], -1.0, -2.0, 0.5)
+    assert registro.exportar()['i'].tolist() == [0, 1, 2]
+
+    for i in range(3, 6):
+        registro.registrar_correcao(i, 1, METODOS[i % 2], -1.0, -2.0, 0.5)
+    eventos = registro.exportar()
+    assert registro.total == 6
+    assert eventos['i'].tolist() == [2, 3, 4, 5]
+    assert eventos['metodo'].tolist() == [0, 1, 0, 1]
+    assert registro.para_dataframe()['metodo'].tolist() == [METODOS[i % 2] for i in range(2, 6)]
+
+    registro.limpar()
+    assert len(registro.exportar()) == 0
+
+
+def test_sinal_do_argumento_antes_do_ajuste():
+    registro = RegistroSolver()
+    _corrigir_com_argumento_negativo(registro)
+
+    eventos = registro.exportar()
+    assert len(eventos) == 1
+    assert eventos['sinal_argumento'][0] == -1
+    assert eventos['j'][0] == 0 and np.isfinite(eventos['x1N_ajustado'][0])
+
+
+def test_desligado_nao_chama_o_registro():
+    class RegistroProibido(RegistroSolver):
+        def registrar_correcao(self, *args):
+            raise AssertionError("registro desligado foi chamado")
+
+        def emitir(self, *args):
+            raise AssertionError("registro desligado foi chamado")
+
+    x, y, z = pista_sintetica('morro', 3000)
+    df = loop(x=x, y=y, z=z, use_z=True, registro=RegistroProibido(nivel=DESLIGADO), **PARAMETROS)
+    assert sum(df.attrs["contagem_sucesso"].values()) > 0
+
+
+def test_eventos_sem_saidas():
+    recebidos = []
+    registro = RegistroSolver(nivel=EVENTOS, saidas=[lambda *evento: recebidos.append(evento)])
+    x, y, z = pista_sintetica('morro', 3000)
+    df = loop(x=x, y=y, z=z, use_z=True, registro=registro, **PARAMETROS)
+
+    assert recebidos == []
+    assert registro.total >= sum(df.attrs["contagem_sucesso"].values())
+
+
+def test_detalhado_envia_etapas_as_saidas():
+    recebidos = []
+    registro = RegistroSolver(nivel=DETALHADO, saidas=[lambda evento, *args: recebidos.append(evento)])
+    _corrigir_com_argumento_negativo(registro)
+
+    assert recebidos[0] == "entrada_correcao" and recebidos[-1] == "resumo"
+    assert {"retroacao", "debug_x1n", "ajuste", "iterador"} <= set(recebidos)
+    assert registro.total == 1
+
+
+def test_saida_terminal_imprime_as_etapas(capsys):
+    _corrigir_com_argumento_negativo(RegistroSolver(nivel=DETALHADO, saidas=[SaidaTerminal()]))
+    assert "Debug: i=2, j=0" in capsys.readouterr().out
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+from scipy.signal import butter, filtfilt
+
+from simulador.benchmark import pista_sintetica
+from simulador.core.tools.filtros import (aplicar_butterworth, filtrar_zero_fase,
+                                          frequencia_amostragem, projetar_butterworth)
+from simulador.core.tools.geometria import interpolar_trajetoria
+
+
+def _trajetoria_ruidosa():
+    # Rua sintética reamostrada a 1 m, com ruído de GPS em x e y
+    x, y, z = interpolar_trajetoria(*pista_sintetica('rua', 20_000), 1.0, use_z=True, method='cubic')
+    rng = np.random.default_rng(0)
+    return x + rng.normal(0, 0.3, len(x)), y + rng.normal(0, 0.3, len(y)), z
+
+
+def test_igual_ao_filtfilt_por_coordenada():
+    x, y, z = _trajetoria_ruidosa()
+    filtrado = aplicar_butterworth(x, y, z, use_z=True, butter_cutoff=0.1, fs=1.0)
+
+    # Caminho antigo: coeficientes (b, a) e um filtfilt por coordenada
+    b, a = butter(4, 0.1 / 0.5, btype='low', analog=False)
+    for coordenada, f in zip((x, y, z), filtrado):
+        np.testing.assert_allclose(f, filtfilt(b, a, coordenada), rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("tamanho_bloco", [1_000, 7_777])
+def test_blocos_iguais_a_filtragem_inteira(tamanho_bloco):
+    x, y, z = _trajetoria_ruidosa()
+    inteiro = aplicar_butterworth(x, y, z, use_z=True, butter_cutoff=0.1, fs=1.0)
+    # Sobreposição padrão: 20 períodos de corte
+    blocos = aplicar_butterworth(x, y, z, use_z=True, butter_cutoff=0.1, fs=1.0,
+                                 tamanho_bloco=tamanho_bloco)
+
+    for b, i in zip(blocos, inteiro):
+        np.testing.assert_allclose(b, i, rtol=0, atol=1e-10)
+
+
+def test_filtrar_zero_fase_mantem_a_forma():
+    sos = projetar_butterworth(4, 0.1, 1.0)
+    assert projetar_butterworth(4, 0.1, 1.0) is sos
+    sinal = np.cumsum(np.random.default_rng(1).normal(size=5_000))
+
+    inteiro = filtrar_zero_fase(sinal, sos)
+    blocos = filtrar_zero_fase(sinal, sos, tamanho_bloco=600, sobreposicao=200)
+    assert inteiro.shape == blocos.shape == sinal.shape
+    np.testing.assert_allclose(blocos, inteiro, rtol=0, atol=1e-10)
+    # Bloco maior que o sinal: uma chamada só
+    np.testing.assert_array_equal(filtrar_zero_fase(sinal, sos, tamanho_bloco=10_000), inteiro)
+
+
+def test_frequencia_amostragem_por_comprimento_de_arco():
+    t = np.linspace(0, 2 * np.pi, 1_001)
+    x, y = 100 * np.cos(t), 100 * np.sin(t)
+    # Volta completa: 1000 intervalos em ~200π m (y não é monótono em x)
+    assert frequencia_amostragem(x, y) == pytest.approx(1_000 / (200 * np.pi), rel=1e-5)
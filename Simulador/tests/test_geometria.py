@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from simulador.benchmark import VEICULO_PADRAO, pista_sintetica
+from simulador.core.tools.geometria import distanceXYZ, interpolar_trajetoria, reamostrar_adaptativo
+from simulador.loop import loop
+
+
+def test_adaptativo_erro_diminui_com_tolerancia():
+    x, y, z = interpolar_trajetoria(*pista_sintetica('rua', 20_000), 1.0, use_z=True, method='cubic')
+
+    def volta(x, y, z):
+        return np.nanmax(loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', **VEICULO_PADRAO)['Time'])
+
+    T_fino = volta(x, y, z)
+    L_fino = distanceXYZ(x, y, z, use_z=True).sum()
+    erros_T, erros_L, pontos = [], [], []
+    for tolerancia in (0.01, 0.005, 0.002, 0.001):
+        xa, ya, za = reamostrar_adaptativo(x, y, z, tolerancia=tolerancia, use_z=True)
+        erros_T.append(abs(volta(xa, ya, za) - T_fino) / T_fino)
+        erros_L.append((L_fino - distanceXYZ(xa, ya, za, use_z=True).sum()) / L_fino)
+        pontos.append(len(xa))
+
+    assert np.all(np.diff(erros_T) < 0)
+    assert np.all(np.diff(erros_L) < 0)
+    assert erros_T[1] < 0.005
+    assert 0 <= erros_L[-1] < 1e-4
+    assert pontos[1] < len(x) / 4
+
+
+@pytest.mark.parametrize("use_z", [False, True])
+@pytest.mark.parametrize("method", ['quadratic', 'cubic'])
+@pytest.mark.parametrize("pista", ['morro', 'rua', 'spline'])
+def test_janelas_iguais_ao_ajuste_unico(pista, method, use_z):
+    # interp1d é local: longe das bordas de cada bloco o resultado é o mesmo
+    x, y, z = pista_sintetica(pista, 5000, passo=4.0)
+    inteiro = np.column_stack(interpolar_trajetoria(x, y, z, 1.0, use_z=use_z, method=method))
+    janelas = np.column_stack(interpolar_trajetoria(x, y, z, 1.0, use_z=use_z, method=method,
+                                                    janela=2000))
+    assert janelas.shape == inteiro.shape
+    np.testing.assert_allclose(janelas, inteiro, rtol=0, atol=1e-9)
+
+
+def test_janelas_splineS_proximas_do_ajuste_unico():
+    # Na splineS, s vale para cada bloco: o ajuste muda, mas pouco
+    x, y, z = pista_sintetica('rua', 5000, passo=4.0)
+    inteiro = interpolar_trajetoria(x, y, z, 1.0, use_z=True, method='splineS')
+    janelas = interpolar_trajetoria(x, y, z, 1.0, use_z=True, method='splineS', janela=2000)
+
+    assert len(janelas[0]) == len(inteiro[0])
+    assert np.max(np.abs(np.column_stack(janelas) - np.column_stack(inteiro))) < 1.5
+    comprimento = distanceXYZ(*inteiro, use_z=True).sum()
+    assert abs(distanceXYZ(*janelas, use_z=True).sum() - comprimento) / comprimento < 2e-3
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("pyproj")
+
+from simulador.core.tools.gps_processing import (latlon_to_xy, _offsets_geodesicos,
+                                                 transformador_utm, calcular_utm_epsg)
+
+
+def _log_gps(n=400):
+    # Volta de ~2 km em torno de um ponto de Interlagos, com ruído de GPS
+    t = np.linspace(0, 2 * np.pi, n)
+    rng = np.random.default_rng(0)
+    lat = -23.7036 + 0.004 * np.sin(t) + rng.normal(0, 1e-6, n)
+    lon = -46.6997 + 0.006 * np.cos(t) + rng.normal(0, 1e-6, n)
+    return lat, lon
+
+
+def test_offsets_iguais_ao_geopy():
+    geodesic = pytest.importorskip("geopy.distance").geodesic
+    lat, lon = _log_gps()
+
+    dx, dy = _offsets_geodesicos(lat, lon, lat[0], lon[0])
+
+    # Caminho antigo (geopy, um ponto por vez), com o deslocamento medido a
+    # partir do primeiro ponto e não somado ao anterior
+    for i in range(0, len(lat), 37):
+        ref_x = geodesic((lat[0], lon[0]), (lat[0], lon[i])).meters * np.sign(lon[i] - lon[0])
+        ref_y = geodesic((lat[0], lon[0]), (lat[i], lon[0])).meters * np.sign(lat[i] - lat[0])
+        assert dx[i] == pytest.approx(ref_x, abs=1e-6)
+        assert dy[i] == pytest.approx(ref_y, abs=1e-6)
+
+
+def test_geodesica_nao_acumula_deslocamentos():
+    # Reta para leste com passo constante: x cresce linearmente (antes, cada
+    # deslocamento até a referência era somado ao x anterior)
+    lon = -46.7 + np.arange(50) * 1e-4
+    lat = np.full(50, -23.7)
+    x, y = latlon_to_xy(lat, lon, method='geodesica')
+
+    np.testing.assert_allclose(np.diff(x), np.diff(x)[0], rtol=1e-9)
+    np.testing.assert_allclose(y, 0, atol=1e-9)
+    assert x[-1] == pytest.approx(49 * x[1], rel=1e-9)
+
+
+@pytest.mark.parametrize("method", ['haversine', 'geodesica', 'utm'])
+def test_blocos_iguais_a_conversao_inteira(method):
+    lat, lon = _log_gps()
+    x, y = latlon_to_xy(lat, lon, method=method)
+    xb, yb = latlon_to_xy(lat, lon, method=method, tamanho_bloco=7)
+
+    np.testing.assert_array_equal(xb, x)
+    np.testing.assert_array_equal(yb, y)
+    if method != 'utm':
+        assert (x[0], y[0]) == (0.0, 0.0)
+
+
+def test_metodos_concordam():
+    lat, lon = _log_gps()
+    xh, yh = latlon_to_xy(lat, lon, method='haversine')
+    xg, yg = latlon_to_xy(lat, lon, method='geopy')   # sinônimo de 'geodesica'
+    xu, yu = latlon_to_xy(lat, lon, method='utm')
+
+    # Em ~1 km os métodos diferem bem menos que 1%
+    np.testing.assert_allclose(xg, xh, atol=5.0)
+    np.testing.assert_allclose(yg, yh, atol=5.0)
+    np.testing.assert_allclose(np.hypot(np.diff(xu), np.diff(yu)),
+                               np.hypot(np.diff(xg), np.diff(yg)), rtol=2e-3, atol=1e-3)
+    assert transformador_utm(calcular_utm_epsg(lat[0], lon[0])) is \
+        transformador_utm(calcular_utm_epsg(lat[0], lon[0]))
+    with pytest.raises(ValueError):
+        latlon_to_xy(lat, lon, method='mercator')
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from simulador.benchmark import VEICULO_PADRAO, POWERTRAIN_PADRAO, pista_sintetica
+from simulador.incremental import SimulacaoIncremental
+from simulador.loop import loop
+
+N = 2000
+
+
+def _parametros(marcha):
+    return {**VEICULO_PADRAO, **(dict(POWERTRAIN_PADRAO, marcha=True) if marcha else {})}
+
+
+def _deslocado(x, y, z, inicio, fim, amplitude=3.0):
+    # Pontos [inicio, fim) afastados lateralmente por um calombo suave
+    t = np.linspace(0, np.pi, fim - inicio)
+    return x[inicio:fim], y[inicio:fim] + amplitude * np.sin(t), z[inicio:fim] + 0.5 * np.sin(t)
+
+
+def _intermediarios(x, y, z, i, n):
+    # n pontos inseridos entre i - 1 e i
+    s = np.arange(1, n + 1) / (n + 1)
+    return tuple(c[i - 1] + s * (c[i] - c[i - 1]) for c in (x, y, z))
+
+
+def _comparar(sim, df, x, y, z, parametros):
+    x, y, z = (np.asarray(c) for c in (x, y, z))
+    np.testing.assert_array_equal(sim.x, x)
+    referencia = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', **parametros)
+    pd.testing.assert_frame_equal(df, referencia, check_exact=False, rtol=1e-9, atol=1e-9)
+    assert df.attrs["contagem_limites"] == referencia.attrs["contagem_limites"]
+
+
+EDICOES = {
+    'interior': lambda x, y, z: (900, 960, _deslocado(x, y, z, 900, 960)),
+    'inicio': lambda x, y, z: (0, 40, _deslocado(x, y, z, 0, 40)),
+    'fim': lambda x, y, z: (len(x) - 40, len(x), _deslocado(x, y, z, len(x) - 40, len(x))),
+    'insercao': lambda x, y, z: (1200, 1200, _intermediarios(x, y, z, 1200, 3)),
+    'remocao': lambda x, y, z: (1200, 1210, (np.empty(0),) * 3),
+}
+
+
+@pytest.mark.parametrize("marcha", [False, True])
+@pytest.mark.parametrize("edicao", list(EDICOES))
+def test_editar_igual_a_volta_completa(edicao, marcha):
+    parametros = _parametros(marcha)
+    x, y, z = pista_sintetica('morro', N)
+    sim = SimulacaoIncremental(x, y, z, use_z=True, **parametros)
+
+    inicio, fim, (xn, yn, zn) = EDICOES[edicao](x, y, z)
+    df = sim.editar(inicio, fim, xn, yn, zn)
+
+    x2, y2, z2 = (np.concatenate((c[:inicio], n, c[fim:])) for c, n in ((x, xn), (y, yn), (z, zn)))
+    _comparar(sim, df, x2, y2, z2, parametros)
+    # Edições longe das pontas resolvem só uma janela do perfil
+    if edicao in ('interior', 'insercao', 'remocao'):
+        assert sim.janela[1] - sim.janela[0] < len(sim.V) - 1
+
+
+def test_editar_estende_a_janela_ate_as_ancoras():
+    # Com Vmax baixo quase todo ponto é âncora; uma curva nova no meio da reta
+    # obriga a janela a crescer para os dois lados (laço de editar)
+    parametros = dict(VEICULO_PADRAO, Vmax=70)
+    x, y, z = pista_sintetica('morro', N)
+    sim = SimulacaoIncremental(x, y, z, use_z=True, **parametros)
+    passes = []
+    _passes = sim._passes
+    sim._passes = lambda *args: passes.append(args) or _passes(*args)
+
+    inicio, fim = 1000, 1006
+    xn, yn, zn = _deslocado(x, y, z, inicio, fim, amplitude=4.0)
+    df = sim.editar(inicio, fim, xn, yn, zn)
+
+    assert len(passes) > 2
+    assert sim.janela[0] < inicio - 2 and sim.janela[1] > fim
+    x2, y2, z2 = (np.concatenate((c[:inicio], n, c[fim:])) for c, n in ((x, xn), (y, yn), (z, zn)))
+    _comparar(sim, df, x2, y2, z2, parametros)
+
+
+def test_edicoes_em_sequencia():
+    parametros = _parametros(True)
+    x, y, z = pista_sintetica('oito', N)
+    sim = SimulacaoIncremental(x, y, z, use_z=True, **parametros)
+
+    for edicao in EDICOES.values():
+        inicio, fim, novo = edicao(sim.x, sim.y, sim.z)
+        df = sim.editar(inicio, fim, *novo)
+    _comparar(sim, df, sim.x, sim.y, sim.z, parametros)
+
+
+def test_alterar_parametros_igual_a_volta_completa():
+    parametros = _parametros(True)
+    x, y, z = pista_sintetica('morro', N)
+    sim = SimulacaoIncremental(x, y, z, use_z=True, **parametros)
+
+    novos = dict(P=70, m=330, mu=1.1)
+    df = sim.alterar_parametros(**novos)
+    _comparar(sim, df, x, y, z, {**parametros, **novos})
+    assert sim.janela == (0, len(sim.V) - 1)
@@ -0,0 +1,99 @@
+import functools
+import sys
+
+import numpy as np
+import pytest
+
+from simulador.benchmark import VEICULO_PADRAO, POWERTRAIN_PADRAO, pista_sintetica
+from simulador.core.preprocessamento import remover_ponto_repetido
+from simulador.loop import loop
+
+def test_use_z_posicional():
+    x, y, z = pista_sintetica('morro', 500)
+    v = VEICULO_PADRAO
+    posicional = loop(v['fx'], v['fy'], x, y, z, v['P'], v['m'], v['Cl'], v['Cd'], v['Af'],
+                      v['Crr'], v['ld'], v['lt'], v['h'], v['Tracao'], v['Vo'], v['Frenagem'],
+                      v['Vmax'], v['mu'], v['nu'], False, 0, 0, 0, 0, 0, True,
+                      solver='dois_passos')
+    nomeado = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', **v)
+    plano = loop(x=x, y=y, z=z, solver='dois_passos', **v)
+
+    np.testing.assert_array_equal(posicional['Speed'], nomeado['Speed'])
+    assert not np.array_equal(posicional['Speed'], plano['Speed'])
+
+
+@pytest.mark.parametrize("pista, marcha", [('oval', True), ('rua', False), ('spline', False)])
+def test_retroacao_tolerante_onde_a_referencia_falha(pista, marcha):
+    parametros = {**VEICULO_PADRAO, **(dict(POWERTRAIN_PADRAO, marcha=True) if marcha else {})}
+    x, y, z = pista_sintetica(pista, 3000)
+    # Antes: a retroação da referência para na raiz complexa de x1N
+    with pytest.raises(TypeError):
+        loop(x=x, y=y, z=z, use_z=True, solver='marcha', **parametros)
+
+    # Depois: termina, abaixo de Vmax e do perfil dos dois passes
+    V = loop(x=x, y=y, z=z, use_z=True, solver='marcha', retroacao_tolerante=True,
+             **parametros)['Speed'].to_numpy()
+    limite = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', **parametros)['Speed'].to_numpy()
+    assert np.all(np.isfinite(V))
+    assert V.max() <= VEICULO_PADRAO['Vmax'] / 3.6
+    assert V.max() <= limite.max() + 0.05
+
+
+@pytest.mark.parametrize("pista, marcha", [('oito', False), ('rua', True), ('morro', True)])
+def test_retroacao_tolerante_igual_a_referencia(pista, marcha):
+    parametros = {**VEICULO_PADRAO, **(dict(POWERTRAIN_PADRAO, marcha=True) if marcha else {})}
+    x, y, z = pista_sintetica(pista, 3000)
+    referencia = loop(x=x, y=y, z=z, use_z=True, solver='marcha', **parametros)
+    df = loop(x=x, y=y, z=z, use_z=True, solver='marcha', retroacao_tolerante=True, **parametros)
+
+    np.testing.assert_array_equal(df['Speed'], referencia['Speed'])
+    assert df.attrs["contagem_metodo"] == referencia.attrs["contagem_metodo"]
+
+
+def _uma_volta(pista):
+    # pista_sintetica dá uma volta só com ~1600 m de trajetória
+    x, y, z = pista_sintetica(pista, 800 if pista == 'oval' else 1600)
+    assert x[-1] != x[0] or y[-1] != y[0] or z[-1] != z[0]  # fecha só a menos de ~1e-14 m
+    return x, y, z
+
+
+def test_remover_ponto_repetido_com_tolerancia():
+    x, y, z = _uma_volta('oval')
+    assert len(remover_ponto_repetido(x, y, z)[0]) == len(x) - 1
+    # Pontos exatamente repetidos continuam saindo; trajetórias abertas ficam
+    exato = [np.append(c[:-1], c[0]) for c in (x, y, z)]
+    assert len(remover_ponto_repetido(*exato)[0]) == len(x) - 1
+    xa, ya, za = pista_sintetica('morro', 500)
+    assert len(remover_ponto_repetido(xa, ya, za)[0]) == 500
+
+
+@pytest.mark.parametrize("marcha", [False, True])
+@pytest.mark.parametrize("pista", ['oval', 'rua'])
+def test_volta_lancada_igual_a_volta_do_meio(pista, marcha):
+    parametros = {**VEICULO_PADRAO, **(dict(POWERTRAIN_PADRAO, marcha=True) if marcha else {})}
+    x, y, z = _uma_volta(pista)
+    n = len(x) - 1
+    lancada = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', circuito_fechado=True,
+                   **parametros)
+    V = lancada['Speed'].to_numpy()
+
+    assert len(V) == n + 1
+    assert V[0] == V[-1]
+    assert lancada.attrs["volta_convergiu"]
+
+    # Três voltas em trajetória aberta: a do meio já não depende de Vo nem do fim
+    x3, y3, z3 = (np.concatenate([c[:-1]] * 3 + [c[:1]]) for c in (x, y, z))
+    aberta = loop(x=x3, y=y3, z=z3, use_z=True, solver='dois_passos', **parametros)
+    np.testing.assert_allclose(V, aberta['Speed'].to_numpy()[n:2 * n + 1], rtol=1e-9, atol=1e-9)
+
+
+def test_volta_lancada_sem_convergencia(monkeypatch, capsys):
+    modulo_loop = sys.modules['simulador.loop']
+    monkeypatch.setattr(modulo_loop, 'resolver_volta_lancada',
+                        functools.partial(modulo_loop.resolver_volta_lancada, max_iter=1))
+    x, y, z = _uma_volta('oval')
+    df = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', circuito_fechado=True,
+              **VEICULO_PADRAO)
+
+    assert df.attrs["volta_convergiu"] is False
+    assert "não convergiu" in capsys.readouterr().out
@@ -0,0 +1,22 @@
+import json
+
+import numpy as np
+
+from simulador.benchmark import VEICULO_PADRAO, pista_sintetica
+from simulador.core.posprocessamento import ler_resultado
+from simulador.main import cli
+
+
+def test_cli_saida_padrao_csv(tmp_path, monkeypatch):
+    x, y, z = pista_sintetica('morro', 300)
+    np.savetxt(tmp_path / 'pista.csv', np.column_stack((x, y, z)), delimiter=',',
+               header='x,y,z', comments='')
+    with open(tmp_path / 'veiculo.json', 'w', encoding='utf-8') as f:
+        json.dump(VEICULO_PADRAO, f)
+
+    monkeypatch.chdir(tmp_path)
+    cli(['pista.csv', '--veiculo', 'veiculo.json', '--solver', 'dois_passos'])
+
+    df = ler_resultado('resultado_simulacao.csv')
+    assert len(df) == len(x) - 1
+    assert df.attrs["solver"] == 'dois_passos'
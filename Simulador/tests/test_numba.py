@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from simulador.benchmark import VEICULO_PADRAO, POWERTRAIN_PADRAO, pista_sintetica
+from simulador.loop import loop
+
+pytest.importorskip("numba")
+
+PISTAS = ['oval', 'oito', 'rua', 'morro', 'spline']
+
+# Casos em que a retroação da marcha de referência encontra a raiz de x1N complexa
+SEM_SOLUCAO_NA_MARCHA = {('oval', True), ('rua', False), ('spline', False)}
+
+
+def _parametros(marcha):
+    return {**VEICULO_PADRAO, **(dict(POWERTRAIN_PADRAO, marcha=True) if marcha else {})}
+
+
+@pytest.mark.parametrize("solver", ['marcha', 'dois_passos'])
+@pytest.mark.parametrize("marcha", [False, True])
+@pytest.mark.parametrize("pista", PISTAS)
+def test_numba_igual_ao_python(pista, marcha, solver):
+    if solver == 'marcha' and (pista, marcha) in SEM_SOLUCAO_NA_MARCHA:
+        pytest.skip("a marcha de referência não termina nesta pista")
+    parametros = _parametros(marcha)
+    x, y, z = pista_sintetica(pista, 3000)
+    referencia = loop(x=x, y=y, z=z, use_z=True, solver=solver, backend='python', **parametros)
+    df = loop(x=x, y=y, z=z, use_z=True, solver=solver, backend='numba', **parametros)
+
+    assert df.attrs["backend"] == 'numba'
+    np.testing.assert_allclose(df['Speed'], referencia['Speed'], rtol=1e-10, atol=1e-10)
+    if solver == 'marcha':
+        assert df.attrs["contagem_metodo"] == referencia.attrs["contagem_metodo"]
+        assert df.attrs["contagem_sucesso"] == referencia.attrs["contagem_sucesso"]
+    else:
+        assert df.attrs["contagem_limites"] == referencia.attrs["contagem_limites"]
+
+
+@pytest.mark.parametrize("pista, marcha", sorted(SEM_SOLUCAO_NA_MARCHA))
+def test_numba_falha_onde_a_referencia_falha(pista, marcha):
+    x, y, z = pista_sintetica(pista, 3000)
+    with pytest.raises(TypeError):
+        loop(x=x, y=y, z=z, use_z=True, solver='marcha', backend='python', **_parametros(marcha))
+    with pytest.raises(ValueError, match="argumento negativo"):
+        loop(x=x, y=y, z=z, use_z=True, solver='marcha', backend='numba', **_parametros(marcha))
+
+
+@pytest.mark.parametrize("pista, marcha", sorted(SEM_SOLUCAO_NA_MARCHA))
+def test_numba_igual_ao_python_tolerante(pista, marcha):
+    x, y, z = pista_sintetica(pista, 3000)
+    opcoes = dict(use_z=True, solver='marcha', retroacao_tolerante=True, **_parametros(marcha))
+    referencia = loop(x=x, y=y, z=z, backend='python', **opcoes)
+    df = loop(x=x, y=y, z=z, backend='numba', **opcoes)
+
+    np.testing.assert_allclose(df['Speed'], referencia['Speed'], rtol=1e-10, atol=1e-10)
+    assert df.attrs["contagem_sucesso"] == referencia.attrs["contagem_sucesso"]
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from simulador.benchmark import VEICULO_PADRAO, pista_sintetica
+from simulador.core.tools.plots import GRAFICOS, decimar_minmax, graph
+from simulador.loop import loop
+
+
+def test_decimar_minmax_mantem_os_extremos():
+    rng = np.random.default_rng(0)
+    n, baldes = 100_003, 50
+    x = np.arange(n) * 0.5
+    y = np.cumsum(rng.normal(size=n))
+    y[[17, 5_000, 77_777]] = [1e3, -1e3, 2e3]   # picos isolados
+
+    xd, yd = decimar_minmax(x, y, baldes)
+
+    assert len(yd) <= 2 * baldes + 2
+    assert np.all(np.diff(xd) > 0)
+    assert (xd[0], xd[-1]) == (x[0], x[-1])
+    # Mínimo e máximo de cada balde, como calculados pela referência em laço
+    tamanho = -(-n // baldes)
+    for inicio in range(0, n, tamanho):
+        grupo = y[inicio:inicio + tamanho]
+        assert grupo.min() in yd and grupo.max() in yd
+    np.testing.assert_array_equal(np.interp(xd, x, y), yd)
+
+
+def test_decimar_minmax_nao_altera_curvas_curtas():
+    x, y = np.arange(10.0), np.arange(10.0) ** 2
+    xd, yd = decimar_minmax(x, y, baldes=5)
+    np.testing.assert_array_equal(xd, x)
+    np.testing.assert_array_equal(yd, y)
+
+
+def test_graph_sem_tela_grava_os_arquivos(tmp_path):
+    x, y, z = pista_sintetica('morro', 3000)
+    df = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', **VEICULO_PADRAO)
+
+    arquivos = graph(df, x, y, pasta=str(tmp_path), processos=1)
+
+    esperados = [str(tmp_path / f'{nome}.png') for nome in GRAFICOS]
+    assert arquivos == esperados
+    for arquivo in esperados:
+        with open(arquivo, 'rb') as f:
+            assert f.read(8) == b'\x89PNG\r\n\x1a\n'
+
+
+def test_modo_sem_tela_nao_importa_pyplot(tmp_path):
+    codigo = (
+        "import sys\n"
+        "import pandas as pd\n"
+        "from simulador.core.tools.plots import plot_speed_histogram\n"
+        f"plot_speed_histogram(pd.DataFrame({{'Distance': [0., 1.], 'Speed': [1., 2.]}}),"
+        f" arquivo={str(tmp_path / 'h.png')!r})\n"
+        "assert 'matplotlib.pyplot' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, '-c', codigo], check=True)
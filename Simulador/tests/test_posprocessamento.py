@@ -0,0 +1,73 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from simulador.benchmark import VEICULO_PADRAO, POWERTRAIN_PADRAO, pista_sintetica
+from simulador.core.posprocessamento import (adicionar_dados_de_marcha, exportar_resultado,
+                                             ler_resultado, metadados_simulacao)
+from simulador.core.tools.powertrain import powercurve, TabelaPotencia
+from simulador.loop import loop
+
+PT = POWERTRAIN_PADRAO
+
+
+def _marcha_por_linha(speed, Vs, gearslist, finaldrive, rw):
+    # Implementação anterior, linha a linha
+    gears, gr, rpm = [], [], []
+    for v in speed:
+        gear = 1
+        for j in range(len(Vs))[::-1]:
+            if v > Vs[j]:
+                gear = j + 2
+                break
+        gears.append(gear)
+        gr.append(gearslist[gear - 1])
+        omega = v * gr[-1] * finaldrive * 30 / (rw * math.pi)
+        rpm.append(1000 if omega < 1000 else omega)
+    return gears, gr, rpm
+
+
+def test_canais_de_marcha_iguais_aos_por_linha():
+    pcurve = powercurve(PT['Ps'], PT['ns'], PT['finaldrive'], PT['gearslist'], PT['rw'])
+    Vs = pcurve[2][1:-1]
+    # Velocidades aleatórias, exatamente nas trocas, abaixo da 1ª marcha e NaN
+    speed = np.concatenate((np.random.default_rng(0).uniform(0, pcurve[2][-1], 5_000),
+                            Vs, np.nextafter(Vs, np.inf), [0.0, 1.0, np.nan]))
+    df = adicionar_dados_de_marcha(pd.DataFrame({'Speed': speed}), pcurve, PT['gearslist'],
+                                   PT['finaldrive'], PT['rw'], canais_potencia=True)
+
+    gears, gr, rpm = _marcha_por_linha(speed, Vs, PT['gearslist'], PT['finaldrive'], PT['rw'])
+    np.testing.assert_array_equal(df['Gears'], gears)
+    np.testing.assert_array_equal(df['GRatios'], gr)
+    np.testing.assert_array_equal(df['RPM'], rpm)
+
+    potencia = np.array([TabelaPotencia(pcurve)(float(v)) if np.isfinite(v) else np.nan
+                         for v in speed])
+    np.testing.assert_allclose(df['EnginePower'], potencia, rtol=1e-12)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.testing.assert_allclose(df['WheelTorque'], potencia * PT['rw'] / speed, rtol=1e-12)
+
+
+@pytest.mark.parametrize("formato", ['parquet', 'feather', 'npz', 'csv'])
+def test_exportar_e_ler_resultado(tmp_path, formato):
+    if formato in ('parquet', 'feather'):
+        pytest.importorskip("pyarrow")
+    parametros = dict(VEICULO_PADRAO, **POWERTRAIN_PADRAO, marcha=True)
+    x, y, z = pista_sintetica('morro', 2000)
+    df = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', canais_potencia=True, **parametros)
+    metadados = metadados_simulacao(parametros, x, y, z, use_z=True, nome='morro')
+
+    caminho = str(tmp_path / f'resultado.{formato}')
+    exportar_resultado(df, caminho, metadados=metadados)
+    lido = ler_resultado(caminho)
+
+    # CSV guarda o texto decimal mais curto de cada float: volta ao mesmo valor
+    pd.testing.assert_frame_equal(lido, df, check_exact=formato != 'csv', rtol=1e-15)
+    assert lido.attrs == {**df.attrs, **metadados}
+
+
+def test_formato_desconhecido(tmp_path):
+    with pytest.raises(ValueError, match="Formato de exportação não suportado"):
+        exportar_resultado(pd.DataFrame({'Speed': [1.0]}), str(tmp_path / 'resultado.xlsx'))
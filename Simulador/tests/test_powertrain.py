@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pytest
+
+from simulador.benchmark import POWERTRAIN_PADRAO
+from simulador.core.tools.powertrain import powercurve, TabelaPotencia
+
+pytest.importorskip("scipy")
+
+PT = POWERTRAIN_PADRAO
+K_V = math.pi * PT['rw'] / (30 * PT['finaldrive'])   # v = rpm * K_V / relação
+
+
+def _potencia(v, relacao):
+    # Curva do motor, linear por partes em rpm (ns está dentro da malha aqui)
+    return np.interp(v * relacao / K_V, PT['ns'], PT['Ps'])
+
+
+def test_trocas_nos_cruzamentos_das_curvas():
+    _, _, Vs = powercurve(PT['Ps'], PT['ns'], PT['finaldrive'], PT['gearslist'], PT['rw'])
+    relacoes = PT['gearslist']
+
+    assert Vs[0] == pytest.approx(PT['ns'][0] * K_V / relacoes[0])
+    assert Vs[-1] == pytest.approx(PT['ns'][-1] * K_V / relacoes[-1])
+    # Referência: primeira mudança de sinal numa malha bem mais fina; sem
+    # cruzamento, o ponto médio entre o fim da marcha i e o início da i + 1
+    cruzaram = 0
+    for i in range(len(relacoes) - 1):
+        inicio, fim = PT['ns'][0] * K_V / relacoes[i + 1], PT['ns'][-1] * K_V / relacoes[i]
+        v = np.linspace(inicio, fim, 200_001)
+        dif = _potencia(v, relacoes[i]) - _potencia(v, relacoes[i + 1])
+        j = np.flatnonzero(np.sign(dif[:-1]) * np.sign(dif[1:]) <= 0)
+        if len(j):
+            cruzaram += 1
+            assert Vs[i + 1] == pytest.approx(v[j[0]], abs=1e-3)
+        else:
+            assert Vs[i + 1] == pytest.approx((inicio + fim) / 2)
+    assert cruzaram > 0
+
+
+def test_curva_usa_a_marcha_entre_as_trocas():
+    Plist, Vlist, Vs = powercurve(PT['Ps'], PT['ns'], PT['finaldrive'], PT['gearslist'], PT['rw'])
+
+    assert np.allclose(np.diff(Vlist), 0.01, atol=1e-3)
+    for v, P in zip(Vlist[::97], Plist[::97]):
+        marcha = sum(v > troca for troca in Vs[1:-1])
+        assert P == pytest.approx(_potencia(v, PT['gearslist'][marcha]))
+
+
+def test_tabela_igual_a_interpolacao_linear():
+    from scipy.interpolate import interp1d
+
+    pcurve = powercurve(PT['Ps'], PT['ns'], PT['finaldrive'], PT['gearslist'], PT['rw'])
+    tabela = TabelaPotencia(pcurve)
+    referencia = interp1d(pcurve[1], pcurve[0], fill_value='extrapolate')
+
+    v = np.random.default_rng(0).uniform(pcurve[1][0] - 2, pcurve[1][-1] + 2, 5_000)
+    np.testing.assert_allclose(tabela(v), referencia(v), rtol=1e-9)
+    # Escalares do Python seguem o mesmo caminho que arrays
+    escalares = np.array([tabela(float(vi)) for vi in v[:200]])
+    np.testing.assert_allclose(escalares, tabela(v[:200]), rtol=1e-12)
+    assert isinstance(tabela(float(v[0])), float)
+    assert tabela.forca(20.0) == pytest.approx(tabela(20.0) / 20.0)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from simulador.benchmark import VEICULO_PADRAO, POWERTRAIN_PADRAO, pista_sintetica
+from simulador.core.modelos import Veiculo, Powertrain
+from simulador.core.preprocessamento import preprocessar_simulacao, coeficientes_aderencia
+from simulador.core.solver.roots import Roots, RootsVetorizado, termos_roots
+from simulador.loop import loop
+
+
+def _linhas(pista, marcha, escala):
+    # Uma linha de Roots por segmento, partindo do perfil de dois_passos escalado
+    parametros = {**VEICULO_PADRAO, **(dict(POWERTRAIN_PADRAO, marcha=True) if marcha else {})}
+    x, y, z = pista_sintetica(pista, 2000)
+    veiculo = Veiculo.de_dict(VEICULO_PADRAO)
+    powertrain = Powertrain.de_dict(POWERTRAIN_PADRAO) if marcha else None
+    p = preprocessar_simulacao(veiculo, x, y, z, True, powertrain=powertrain)
+    Ax0, cAx, Ay0, cAy = coeficientes_aderencia(
+        p.angle, p.g, p.kl, veiculo.m, veiculo.fx, veiculo.fy, veiculo.mu, veiculo.nu,
+        veiculo.ld, veiculo.lt, veiculo.h, veiculo.Tracao
+    )
+    df = loop(x=x, y=y, z=z, use_z=True, solver='dois_passos', **parametros)
+    Vo = df['Speed'].to_numpy()[:-1] * escala
+    n = len(p.R)
+    Vo = Vo[:n]
+    constantes = dict(Axmin=veiculo.Frenagem * p.g * veiculo.fx, g=p.g, k=p.k, pcurve=p.pcurve,
+                      m=veiculo.m, Pv=p.Pv, marcha=marcha, P=p.P)
+    return dict(Vo=Vo, D=p.D[:n], R=p.R, Axmax=Ax0[:n] - cAx * Vo ** 2,
+                Aymax=Ay0[:n] - cAy * Vo ** 2, slope=p.slope[:n]), constantes
+
+
+@pytest.mark.parametrize("escala", [0.6, 1.0, 1.2])
+@pytest.mark.parametrize("marcha", [False, True])
+@pytest.mark.parametrize("pista", ['rua', 'morro'])
+def test_vetorizado_igual_ao_escalar(pista, marcha, escala):
+    linhas, c = _linhas(pista, marcha, escala)
+    inter, Vint, valido = RootsVetorizado(
+        linhas['Vo'], linhas['D'], linhas['R'], linhas['Axmax'], c['Axmin'], linhas['Aymax'],
+        linhas['slope'], c['g'], c['k'], c['pcurve'], c['m'], c['Pv'], c['marcha'], c['P'],
+        termos=termos_roots(linhas['D'], linhas['R'], linhas['slope'], c['g'], c['k'])
+    )
+
+    sem_solucao = 0
+    for i in range(len(linhas['Vo'])):
+        try:
+            resultado = Roots(*(float(linhas[nome][i]) for nome in ('Vo', 'D', 'R', 'Axmax')),
+                              c['Axmin'], float(linhas['Aymax'][i]), float(linhas['slope'][i]),
+                              c['g'], c['k'], c['pcurve'], c['m'], c['Pv'], c['marcha'], c['P'])
+        except TypeError:
+            # Velocidade complexa depois da correção pela potência: NaN no lote
+            assert valido[i] and np.isnan(Vint[i, 1])
+            continue
+        if resultado is False:
+            sem_solucao += 1
+            assert not valido[i]
+            assert np.all(np.isnan(inter[i])) and np.all(np.isnan(Vint[i]))
+        else:
+            assert valido[i]
+            np.testing.assert_allclose(inter[i], resultado[0], rtol=1e-9, atol=1e-9)
+            np.testing.assert_allclose(Vint[i], resultado[1], rtol=1e-9, atol=1e-9)
+
+    # Acima do perfil viável aparecem linhas sem solução
+    if escala > 1:
+        assert sem_solucao > 0
@@ -0,0 +1,17 @@
+import numpy as np
+
+from simulador.benchmark import VEICULO_PADRAO, pista_sintetica
+from simulador.varredura import varrer_parametros
+
+
+def test_paralelo_igual_ao_serial():
+    x, y, z = pista_sintetica('morro', 1000)
+    grade = {'m': [250, 300], 'Cd': [0.7, 0.9]}
+    serial = varrer_parametros(x, y, z, VEICULO_PADRAO, grade=grade, use_z=True,
+                               processos=1, progresso=False)
+    paralelo = varrer_parametros(x, y, z, VEICULO_PADRAO, grade=grade, use_z=True,
+                                 processos=2, progresso=False)
+
+    assert len(serial) == 4 and 'Erro' not in serial
+    np.testing.assert_array_equal(serial['LapTime'], paralelo['LapTime'])
+